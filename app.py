@@ -1,63 +1,323 @@
-from flask import Flask, jsonify, request, send_file
+from flask import Flask, g, jsonify, request, send_file
 from flask_cors import CORS
+from cache import CacheRespostas
+from config import Config
 from database import Database
-from scrapers import ScraperManager
-from apscheduler.schedulers.background import BackgroundScheduler
+from exportacao import FORMATOS, FormatoIndisponivel, exportar
+from metricas import LATENCIA_ROTA, registro as registro_metricas
+from respostas import ProvedorJSON, comprimir_resposta, json_lista, ndjson
+from tarefas import GerenciadorSincronizacao
+import hashlib
 import os
+import threading
+import time
 from datetime import datetime
+from functools import wraps
 
 
 app = Flask(__name__, static_folder='.', static_url_path='')
+app.json = ProvedorJSON(app)
 CORS(app)
 
 
 # Inicializar banco de dados
-db = Database('concursos.db')
+db = Database(Config.DATABASE_PATH)
 
 
-# Agendador de tarefas
-scheduler = BackgroundScheduler()
+# Cache das respostas de leitura, invalidado a cada sincronização
+cache = CacheRespostas(Config.CACHE_MAX_ITENS)
 
 
-def atualizar_concursos():
-    """Função para atualizar concursos em tempo real"""
+# Agendador de tarefas (criado em iniciar_agendador, para não importar o APScheduler no boot)
+scheduler = None
+
+
+# Valor de 'fonte' do registro de atualizacoes que resume cada sincronização
+FONTE_RESUMO = 'todas'
+
+
+def preparar_concurso(concurso: dict) -> dict:
+    """Normalizar um concurso raspado antes de gravar"""
+    # CORREÇÃO #1: Garantir que campo 'vagas' seja sempre int
+    if 'vagas' in concurso:
+        if concurso['vagas'] is None or concurso['vagas'] == '':
+            concurso['vagas'] = 0
+        else:
+            # Limpar formatação (remove pontos e vírgulas)
+            concurso['vagas'] = int(str(concurso['vagas']).replace('.', '').replace(',', '').strip())
+    else:
+        concurso['vagas'] = 0
+    return concurso
+
+
+def atualizar_concursos(progresso=None, somente_vencidas: bool = False) -> dict:
+    """Função para atualizar concursos em tempo real
+    
+    Sincroniza todas as fontes ativas do registro, ou só as que venceram o
+    próprio intervalo_horas (somente_vencidas, usado pelo agendador).
+    Os concursos de cada fonte são gravados assim que ela termina, sem esperar
+    as demais: a memória fica limitada ao lote da fonte em andamento.
+    Retorna o resumo das contagens ('erro' preenchido se a sincronização falhou).
+    """
     print(f"\n[{datetime.now()}] Iniciando atualização de concursos...")
     try:
-        concursos = ScraperManager.scrape_all()
-        inseridos, atualizados, erros = 0, 0, 0
+        # Importado só aqui: requests/BeautifulSoup/lxml não pesam no boot da API
+        from scrapers import Scraper, ScraperManager
+        
+        # Hash e validadores HTTP das páginas ficam no banco, entre execuções
+        Scraper.estado_paginas = db
+        
+        if somente_vencidas:
+            fontes = ScraperManager.fontes_vencidas(db.obter_execucoes_fontes(), db.obter_ultima_atualizacao())
+        else:
+            fontes = ScraperManager.fontes_ativas()
+        if not fontes:
+            print("✓ Nenhuma fonte vencida")
+            return {'fontes': [], 'processados': 0, 'novos': 0, 'atualizados': 0,
+                    'inalterados': 0, 'encerrados': 0, 'erros': 0}
+        
+        # Status final de cada fonte, gravado só depois que seus concursos foram salvos
+        execucoes = {}
+        def acompanhar(nome, status, total, duracao):
+            if status != 'executando':
+                execucoes[nome] = status
+            if progresso:
+                progresso(nome, status, total, duracao)
         
-        for concurso in concursos:
-            try:
-                # CORREÇÃO #1: Garantir que campo 'vagas' seja sempre int
-                if 'vagas' in concurso:
-                    if concurso['vagas'] is None or concurso['vagas'] == '':
-                        concurso['vagas'] = 0
-                    else:
-                        # Limpar formatação (remove pontos e vírgulas)
-                        concurso['vagas'] = int(str(concurso['vagas']).replace('.', '').replace(',', '').strip())
-                else:
-                    concurso['vagas'] = 0
-                
-                db.inserir_concurso(concurso)
-                inseridos += 1
-            except Exception as e:
-                print(f"❌ Erro ao inserir concurso '{concurso.get('titulo', '[sem título]')}': {e}")
-                erros += 1
+        contagens, processados, erros = {}, 0, 0
+        # O hash das páginas de cada fonte só é gravado quando o próximo lote é pedido,
+        # depois deste ter sido salvo: uma falha aqui faz a fonte ser relida na próxima vez
+        for lote, lidas in ScraperManager.scrape_stream(fontes, progresso=acompanhar):
+            processados += len(lote)
+            validos = []
+            for concurso in lote:
+                try:
+                    validos.append(preparar_concurso(concurso))
+                except Exception as e:
+                    print(f"❌ Erro ao preparar concurso '{concurso.get('titulo', '[sem título]')}': {e}")
+                    erros += 1
+            
+            # Um lote por fonte, com as páginas que ela leu (mesmo sem concursos): os
+            # ausentes são encerrados pela lista de cada página, na mesma transação
+            resultado = db.sincronizar_concursos(validos, lidas)
+            for fonte, c in resultado.items():
+                total = contagens.setdefault(fonte, dict.fromkeys(c, 0))
+                for campo, valor in c.items():
+                    total[campo] += valor
+            if any(c['novos'] or c['atualizados'] or c['removidos'] for c in resultado.values()):
+                cache.invalidar()
+        db.registrar_execucoes_fontes(execucoes)
+        for fonte, c in contagens.items():
+            db.registrar_atualizacao(fonte, c['total'], c['novos'], c['atualizados'], c['removidos'])
         
-        print(f"✓ Concursos processados: {len(concursos)} | Inseridos: {inseridos} | Erros: {erros}")
+        novos = sum(c['novos'] for c in contagens.values())
+        atualizados = sum(c['atualizados'] for c in contagens.values())
+        inalterados = sum(c['inalterados'] for c in contagens.values())
+        removidos = sum(c['removidos'] for c in contagens.values())
+        # Resumo da execução: marca a sincronização mesmo quando nenhuma fonte mudou
+        db.registrar_atualizacao(FONTE_RESUMO, processados - erros, novos, atualizados, removidos)
+        if novos or atualizados or removidos:
+            duplicatas = db.agrupar_duplicatas()
+            print(f"✓ Duplicatas entre fontes agrupadas: {duplicatas}")
+            db.atualizar_estatisticas()
+            cache.invalidar()
+        print(f"✓ Concursos processados: {processados} | Novos: {novos} | Atualizados: {atualizados} "
+              f"| Inalterados: {inalterados} | Encerrados: {removidos} | Erros: {erros}")
+        return {
+            'fontes': [fonte.nome for fonte in fontes],
+            'processados': processados,
+            'novos': novos,
+            'atualizados': atualizados,
+            'inalterados': inalterados,
+            'encerrados': removidos,
+            'erros': erros,
+        }
     except Exception as e:
         print(f"✗ Erro geral na atualização: {e}")
+        return {'erro': str(e)}
+    finally:
+        # A thread do job termina aqui; a conexão volta ao pool
+        db.liberar()
+
+
+# Sincronizações manuais e agendadas passam pela mesma fila single-flight
+sincronizacao = GerenciadorSincronizacao(atualizar_concursos)
+
+
+def sincronizacao_agendada():
+    """Disparo do agendador: só as fontes vencidas (agrupado se já houver uma sincronização rodando)"""
+    sincronizacao.disparar('agendador', somente_vencidas=True)
+
+
+def iniciar_agendador():
+    """Verificar a cada Config.AGENDADOR_VERIFICACAO_MINUTOS minutos quais fontes venceram"""
+    global scheduler
+    from apscheduler.schedulers.background import BackgroundScheduler
+    
+    scheduler = BackgroundScheduler()
+    scheduler.add_job(
+        func=sincronizacao_agendada,
+        trigger="interval",
+        minutes=Config.AGENDADOR_VERIFICACAO_MINUTOS,
+        id="atualizar_concursos",
+        name="Atualizar concursos",
+        replace_existing=True
+    )
+    scheduler.start()
 
 
-# Configurar job de atualização (a cada 6 horas)
-scheduler.add_job(
-    func=atualizar_concursos,
-    trigger="interval",
-    hours=6,
-    id="atualizar_concursos",
-    name="Atualizar concursos",
-    replace_existing=True
-)
+def iniciar_sincronizacao():
+    """Sincronizar em background só as fontes vencidas, e ligar o agendador
+    
+    A API já serve o concursos.db existente enquanto isso.
+    """
+    from scrapers import ScraperManager
+    
+    vencidas = ScraperManager.fontes_vencidas(db.obter_execucoes_fontes(), db.obter_ultima_atualizacao())
+    if vencidas:
+        print(f"\n⏳ {len(vencidas)} fonte(s) vencida(s): sincronização inicial em background...")
+        sincronizacao.disparar('inicializacao', somente_vencidas=True)
+    else:
+        print("\n✓ Todas as fontes estão atualizadas")
+    iniciar_agendador()
+
+
+def resposta_em_cache(view):
+    """Servir a resposta do cache LRU (ou 304 pelo ETag) até a próxima sincronização
+    
+    Listagens completas em fluxo (formato_lista) não passam pelo cache.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        if formato_lista():
+            return view(*args, **kwargs)
+        chave = CacheRespostas.chave(request.path, request.args)
+        geracao = cache.geracao
+        etag = cache.etag(chave)
+        # Comparação fraca: a resposta comprimida leva o mesmo ETag, marcado como fraco
+        if request.if_none_match.contains_weak(etag):
+            resposta = app.response_class(status=304)
+            resposta.set_etag(etag)
+            return resposta
+        
+        corpo = cache.obter(chave)
+        if corpo is None:
+            resposta = app.make_response(view(*args, **kwargs))
+            if resposta.status_code != 200:
+                return resposta
+            cache.guardar(chave, resposta.get_data(), geracao)
+        else:
+            resposta = app.response_class(corpo, mimetype='application/json')
+        resposta.set_etag(etag)
+        return resposta
+    return wrapper
+
+
+def parametro_booleano(nome: str) -> bool:
+    """Ler um parâmetro booleano da query string (1/true/sim)"""
+    return request.args.get(nome, '').lower() in ('1', 'true', 'sim')
+
+
+def parametros_paginacao():
+    """Ler limit, cursor e fields da query string (ValueError se inválidos)"""
+    limite = request.args.get('limit', Config.API_LIMITE_PADRAO)
+    try:
+        limite = int(limite)
+    except (TypeError, ValueError):
+        raise ValueError('limit deve ser um número inteiro')
+    limite = max(1, min(limite, Config.API_LIMITE_MAXIMO))
+    
+    campos = None
+    if request.args.get('fields'):
+        campos = [c.strip() for c in request.args['fields'].split(',') if c.strip()]
+        invalidos = [c for c in campos if c not in Database.CAMPOS_CONCURSO + Database.CAMPOS_VIRTUAIS]
+        if invalidos:
+            raise ValueError(f"campos inválidos: {', '.join(invalidos)}")
+    
+    return limite, request.args.get('cursor') or None, campos
+
+
+def filtros_concursos() -> dict:
+    """Ler os filtros de listagem da query string
+    
+    estado, status, fonte, busca, duplicados, os campos do enriquecimento
+    (banca, escolaridade, salario_min, salario_max, vagas_min) e a ordem.
+    Valores inválidos são recusados pelo banco com ValueError.
+    """
+    filtros = {
+        'estado': request.args.get('estado'),
+        'status': request.args.get('status'),
+        'fonte': request.args.get('fonte'),
+        'busca': request.args.get('busca'),
+        'banca': request.args.get('banca'),
+        'escolaridade': request.args.get('escolaridade'),
+        'salario_min': request.args.get('salario_min'),
+        'salario_max': request.args.get('salario_max'),
+        'vagas_min': request.args.get('vagas_min'),
+        'ordem': request.args.get('ordem'),
+        'incluir_duplicados': parametro_booleano('duplicados')
+    }
+    # Remover filtros vazios
+    return {k: v for k, v in filtros.items() if v}
+
+
+def formato_lista() -> str:
+    """Formato da listagem completa em fluxo: 'ndjson', 'json' ou None (página por cursor)
+    
+    NDJSON vem de formato=ndjson ou de Accept: application/x-ndjson preferido
+    a application/json; todos=1 pede o JSON completo, gerado em partes.
+    """
+    formato = request.args.get('formato', '').lower()
+    if formato == 'ndjson':
+        return 'ndjson'
+    if not formato and request.accept_mimetypes.best_match(
+            ['application/json', 'application/x-ndjson']) == 'application/x-ndjson':
+        return 'ndjson'
+    if formato in ('', 'json') and parametro_booleano('todos'):
+        return 'json'
+    return None
+
+
+def resposta_em_fluxo(filtros: dict, campos, rodape):
+    """Enviar todos os concursos dos filtros direto do cursor do SQLite, em partes
+    
+    'rodape(total)' monta os campos que acompanham a lista no formato JSON.
+    A memória do worker fica limitada a um lote (API_STREAM_LOTE) e o
+    primeiro byte sai antes de a consulta terminar.
+    """
+    concursos = db.iterar_concursos(filtros, campos, Config.API_STREAM_LOTE)
+    if formato_lista() == 'ndjson':
+        return app.response_class(ndjson(concursos), mimetype='application/x-ndjson')
+    return app.response_class(json_lista('concursos', concursos, rodape), mimetype='application/json')
+
+
+@app.teardown_appcontext
+def liberar_conexao(_erro=None):
+    """Devolver ao pool a conexão usada pela requisição (cada requisição roda em uma thread nova)"""
+    db.liberar()
+
+
+@app.before_request
+def iniciar_cronometro():
+    g.inicio_requisicao = time.perf_counter()
+
+
+@app.after_request
+def medir_requisicao(resposta):
+    """Observar a latência de cada requisição, rotulada pelo padrão da rota (não pela URL)"""
+    inicio = g.pop('inicio_requisicao', None)
+    if inicio is not None:
+        rota = request.url_rule.rule if request.url_rule else 'nao_encontrada'
+        # Em respostas em fluxo, mede até o início do envio (cabeçalhos)
+        LATENCIA_ROTA.observar(time.perf_counter() - inicio, rota=rota, metodo=request.method,
+                               status=resposta.status_code)
+    return resposta
+
+
+@app.after_request
+def comprimir(resposta):
+    """Comprimir JSON/NDJSON/texto com brotli ou gzip, conforme o Accept-Encoding"""
+    return comprimir_resposta(resposta, request.accept_encodings, Config.API_COMPRESSAO_MINIMO_BYTES)
 
 
 # ===== SERVIR O FRONTEND HTML =====
@@ -82,25 +342,40 @@ def health():
     return jsonify({
         'status': 'online',
         'timestamp': datetime.now().isoformat(),
-        'total_concursos': db.contar_concursos()
+        'total_concursos': cache.obter_ou_calcular(('contar_concursos',), db.contar_concursos)
     })
 
 
+@app.route('/api/metrics', methods=['GET'])
+def metricas():
+    """Métricas da sincronização (por fonte) e das rotas no formato de texto do Prometheus"""
+    return app.response_class(registro_metricas.exportar(), mimetype='text/plain; version=0.0.4')
+
+
 @app.route('/api/concursos', methods=['GET'])
+@resposta_em_cache
 def obter_concursos():
-    """Obter concursos com filtros"""
-    filtros = {
-        'estado': request.args.get('estado'),
-        'status': request.args.get('status'),
-        'fonte': request.args.get('fonte'),
-        'busca': request.args.get('busca')
-    }
-    # Remover filtros vazios
-    filtros = {k: v for k, v in filtros.items() if v}
-    concursos = db.obter_concursos(filtros)
+    """Obter concursos com filtros, paginados por cursor (limit, cursor, fields)
+    
+    Retorna só o registro canônico de cada concurso listado por várias fontes;
+    duplicados=1 (ou um filtro por fonte) traz todos os registros. Com
+    formato=ndjson ou todos=1, envia todos os concursos dos filtros em fluxo.
+    ordem=salario|vagas ordena pelo maior salário ou pelo número de vagas.
+    """
+    filtros = filtros_concursos()
+    try:
+        limite, cursor, campos = parametros_paginacao()
+        if formato_lista():
+            return resposta_em_fluxo(filtros, campos, lambda total: {
+                'total': total, 'timestamp': datetime.now().isoformat()
+            })
+        concursos, proximo_cursor = db.obter_pagina_concursos(filtros, limite, cursor, campos)
+    except ValueError as e:
+        return jsonify({'erro': str(e)}), 400
     return jsonify({
         'total': len(concursos),
         'concursos': concursos,
+        'proximo_cursor': proximo_cursor,
         'timestamp': datetime.now().isoformat()
     })
 
@@ -108,86 +383,115 @@ def obter_concursos():
 @app.route('/api/concursos/<int:concurso_id>', methods=['GET'])
 def obter_concurso(concurso_id):
     """Obter detalhes de um concurso específico"""
-    concursos = db.obter_concursos()
-    concurso = None
-    for c in concursos:
-        if c['id'] == concurso_id:
-            concurso = c
-            break
+    concurso = db.obter_concurso_por_id(concurso_id)
     if not concurso:
         return jsonify({'erro': 'Concurso não encontrado'}), 404
-    return jsonify(concurso)
+    
+    # ETag do corpo serializado: muda com a linha e com as fontes relacionadas (outras
+    # linhas do grupo), mesmo que duas gravações caiam no mesmo segundo
+    resposta = jsonify(concurso)
+    etag = hashlib.md5(resposta.get_data()).hexdigest()
+    if request.if_none_match.contains_weak(etag):
+        resposta = app.response_class(status=304)
+    resposta.set_etag(etag)
+    return resposta
 
 
 @app.route('/api/estatisticas', methods=['GET'])
+@resposta_em_cache
 def obter_estatisticas():
-    """Obter estatísticas gerais - CORRIGIDO"""
-    concursos = db.obter_concursos()
-    estados = {}
-    fontes = {}
-    total_vagas = 0
-    
-    for concurso in concursos:
-        # Contar estados
-        estado = concurso.get('estado', 'BR')
-        estados[estado] = estados.get(estado, 0) + 1
-        
-        # Contar fontes
-        fonte = concurso.get('fonte', 'unknown')
-        fontes[fonte] = fontes.get(fonte, 0) + 1
-        
-        # CORREÇÃO #2: Converter vagas para int e somar corretamente
-        try:
-            vagas = int(str(concurso.get('vagas', 0)).replace('.', '').replace(',', '').strip())
-        except (ValueError, TypeError):
-            vagas = 0
-        total_vagas += vagas
-    
-    # CORREÇÃO #3: Incluir total_fontes na resposta
+    """Obter estatísticas gerais (pré-calculadas a cada sincronização)"""
+    estatisticas = db.obter_estatisticas()
     return jsonify({
-        'total_concursos': len(concursos),
-        'total_vagas': total_vagas,
-        'total_estados': len(estados),
-        'total_fontes': len(fontes),  # ← ADICIONADO!
-        'estados': estados,
-        'fontes': fontes,
+        'total_concursos': estatisticas['total_concursos'],
+        'total_vagas': estatisticas['total_vagas'],
+        'total_estados': len(estatisticas['estados']),
+        'total_fontes': len(estatisticas['fontes']),
+        'estados': estatisticas['estados'],
+        'fontes': estatisticas['fontes'],
         'timestamp': datetime.now().isoformat()
     })
 
 
 @app.route('/api/busca', methods=['GET'])
+@resposta_em_cache
 def busca_avancada():
-    """Busca avançada de concursos"""
+    """Busca avançada de concursos (aceita limit, cursor, fields e o fluxo completo como /api/concursos)"""
     termo = request.args.get('termo', '')
-    estado = request.args.get('estado')
-    status = request.args.get('status')
-    fonte = request.args.get('fonte')
+    # Mesmos filtros da listagem; o termo ocupa o lugar de 'busca'
+    filtros = filtros_concursos()
+    filtros['busca'] = termo
     
-    filtros = {'busca': termo}
-    if estado:
-        filtros['estado'] = estado
-    if status:
-        filtros['status'] = status
-    if fonte:
-        filtros['fonte'] = fonte
-    
-    concursos = db.obter_concursos(filtros)
+    try:
+        limite, cursor, campos = parametros_paginacao()
+        if formato_lista():
+            return resposta_em_fluxo(filtros, campos, lambda total: {
+                'termo_busca': termo, 'total_resultados': total, 'timestamp': datetime.now().isoformat()
+            })
+        concursos, proximo_cursor = db.obter_pagina_concursos(filtros, limite, cursor, campos)
+    except ValueError as e:
+        return jsonify({'erro': str(e)}), 400
     return jsonify({
         'termo_busca': termo,
         'total_resultados': len(concursos),
         'concursos': concursos,
+        'proximo_cursor': proximo_cursor,
         'timestamp': datetime.now().isoformat()
     })
 
 
+@app.route('/api/export', methods=['GET'])
+def exportar_tabela():
+    """Exportar concursos ou atualizacoes inteiros em CSV, Parquet ou Arrow, em fluxo
+    
+    tabela=concursos|atualizacoes, formato=csv|parquet|arrow, fields e os
+    mesmos filtros de /api/concursos (em atualizacoes, só fonte). A exportação
+    traz todos os registros, duplicatas entre fontes inclusive; canonicos=1
+    deixa só os canônicos. Parquet e Arrow exigem o pyarrow (501 sem ele).
+    """
+    tabela = request.args.get('tabela', 'concursos')
+    formato = request.args.get('formato', 'csv').lower()
+    campos = [c.strip() for c in request.args.get('fields', '').split(',') if c.strip()]
+    filtros = filtros_concursos()
+    filtros['incluir_duplicados'] = not parametro_booleano('canonicos')
+    try:
+        mimetype, partes = exportar(db, tabela, formato, filtros, campos,
+                                    Config.API_STREAM_LOTE, Config.EXPORT_LINHAS_POR_GRUPO)
+    except ValueError as e:
+        return jsonify({'erro': str(e)}), 400
+    except FormatoIndisponivel as e:
+        return jsonify({'erro': str(e)}), 501
+    
+    nome = f"{tabela}-{datetime.now().strftime('%Y%m%d-%H%M%S')}.{FORMATOS[formato][1]}"
+    resposta = app.response_class(partes, mimetype=mimetype)
+    resposta.headers['Content-Disposition'] = f'attachment; filename="{nome}"'
+    return resposta
+
+
 @app.route('/api/atualizar', methods=['POST'])
 def atualizar_manual():
-    """Forçar atualização de concursos"""
-    atualizar_concursos()
-    return jsonify({
-        'status': 'atualização iniciada',
+    """Enfileirar uma atualização de concursos (202 + id do job para acompanhar)"""
+    job, criado = sincronizacao.disparar('manual')
+    url_status = f"/api/atualizar/{job['id']}"
+    resposta = jsonify({
+        'status': 'atualização iniciada' if criado else 'atualização já em andamento',
+        'job_id': job['id'],
+        'agrupado': not criado,
+        'url_status': url_status,
         'timestamp': datetime.now().isoformat()
     })
+    resposta.status_code = 202
+    resposta.headers['Location'] = url_status
+    return resposta
+
+
+@app.route('/api/atualizar/<job_id>', methods=['GET'])
+def status_atualizacao(job_id):
+    """Consultar o andamento de uma atualização: progresso por scraper, tempos e contagens"""
+    job = sincronizacao.obter(job_id)
+    if not job:
+        return jsonify({'erro': 'Job não encontrado'}), 404
+    return jsonify(job)
 
 
 @app.errorhandler(404)
@@ -204,20 +508,17 @@ if __name__ == '__main__':
     print("\n" + "="*60)
     print("🚀 CONCURSOS BRASIL FINDER - Backend")
     print("="*60)
-    print("\n⏳ Iniciando sincronização inicial de concursos...")
-    atualizar_concursos()
-    print("\n⏳ Iniciando scheduler de atualizações automáticas...")
-    scheduler.start()
-    print(f"\n✓ API rodando em http://localhost:5000")
-    print(f"✓ Acesse no navegador: http://localhost:5000")
-    print(f"✓ Banco de dados: concursos.db")
-    print(f"✓ Atualização automática: a cada 6 horas")
+    threading.Thread(target=iniciar_sincronizacao, name='inicializacao', daemon=True).start()
+    print(f"\n✓ API rodando em http://localhost:{Config.API_PORT}")
+    print(f"✓ Acesse no navegador: http://localhost:{Config.API_PORT}")
+    print(f"✓ Banco de dados: {Config.DATABASE_PATH}")
+    print(f"✓ Atualização automática: por fonte (fontes.yaml), verificada a cada {Config.AGENDADOR_VERIFICACAO_MINUTOS} minutos")
     print("\n" + "="*60)
     print("Pressione CTRL+C para parar o servidor")
     print("="*60 + "\n")
     app.run(
         host='0.0.0.0',
-        port=5000,
+        port=Config.API_PORT,
         debug=False,
         use_reloader=False,
         threaded=True
@@ -0,0 +1,239 @@
+import argparse
+import json
+import logging
+import os
+import random
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from typing import Dict, List
+
+import requests
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+import sintetico  # noqa: E402
+
+BANCO_PADRAO = os.path.join(RAIZ, 'benchmarks', 'fixtures', 'carga.db')
+# Peso de cada endpoint na mistura de requisições dos clientes
+PESOS = {'concursos': 40, 'busca': 25, 'detalhe': 25, 'estatisticas': 10}
+TERMOS = [c.split()[0] for c in sintetico.CARGOS] + sintetico.CIDADES + ['prefeitura', 'tribunal', 'câmara']
+PAGINAS_POR_LISTAGEM = 3
+FASES = {'sem_sincronizacao': 'sem sincronização', 'com_sincronizacao': 'com sincronização concorrente'}
+
+
+# ===== SERVIDOR (processo separado, para não disputar o GIL com os clientes) =====
+
+
+def servidor(banco: str, porta: int, sincronizar: bool):
+    """Servir a API sobre o banco informado, opcionalmente sincronizando em laço"""
+    os.environ['DATABASE_PATH'] = banco
+    import app as aplicacao
+    from werkzeug.serving import make_server
+    # Sem o log de acesso por requisição, que custaria mais que as próprias rotas
+    logging.getLogger('werkzeug').setLevel(logging.ERROR)
+    if sincronizar:
+        threading.Thread(target=sincronizar_em_laco, args=(aplicacao,), name='sincronizacao', daemon=True).start()
+    make_server('127.0.0.1', porta, aplicacao.app, threaded=True).serve_forever()
+
+
+def sincronizar_em_laco(aplicacao):
+    """Rodar atualizar_concursos sem parar contra fontes locais com páginas sempre novas
+
+    Cada rodada regrava as páginas sintéticas com outra semente: a sincronização
+    faz o caminho completo (HTTP, parse, extração, upsert, encerramento,
+    agrupamento, estatísticas e invalidação do cache) enquanto os clientes leem.
+    """
+    from config import Config
+    from pipeline import ServidorFixtures
+    diretorio = tempfile.mkdtemp(prefix='carga-fontes-')
+    servidor_fontes = ServidorFixtures(diretorio)
+    fontes = sintetico.FONTES[:6]
+    Config.CRAWL_INTERVALO_DOMINIO_SECONDS = 0
+    Config.FONTES_PATH = os.path.join(diretorio, 'fontes.yaml')
+    with open(Config.FONTES_PATH, 'w', encoding='utf-8') as f:
+        for fonte in fontes:
+            f.write(f"- fonte: {fonte}\n  urls: [{servidor_fontes.url(fonte + '.html')}]\n  profundidade: 0\n")
+
+    rodada = 0
+    while True:
+        gerador = random.Random(rodada)
+        for fonte in fontes:
+            with open(os.path.join(diretorio, f"{fonte}.html"), 'w', encoding='utf-8') as f:
+                f.write(sintetico.pagina_listagem(gerador, 100))
+        inicio = time.perf_counter()
+        resumo = aplicacao.atualizar_concursos()
+        print(f"  [sincronização {rodada}] {resumo.get('novos', 0)} novos em "
+              f"{time.perf_counter() - inicio:.1f}s", file=sys.stderr)
+        rodada += 1
+
+
+def iniciar_servidor(banco: str, porta: int, sincronizar: bool) -> subprocess.Popen:
+    comando = [sys.executable, os.path.abspath(__file__), 'servidor', '--banco', banco, '--porta', str(porta)]
+    if sincronizar:
+        comando.append('--sincronizar')
+    processo = subprocess.Popen(comando, cwd=RAIZ, stdout=subprocess.DEVNULL)
+    url = f"http://127.0.0.1:{porta}"
+    limite = time.time() + 30
+    while time.time() < limite:
+        try:
+            requests.get(f"{url}/api/health", timeout=1)
+            return processo
+        except requests.RequestException:
+            time.sleep(0.2)
+    processo.kill()
+    raise SystemExit("Servidor da API não respondeu em 30s")
+
+
+# ===== CLIENTES =====
+
+
+def requisicoes(gerador: random.Random, max_id: int):
+    """Sortear o endpoint da próxima visita e o caminho da primeira requisição"""
+    endpoint = gerador.choices(list(PESOS), weights=list(PESOS.values()))[0]
+    if endpoint == 'concursos':
+        filtro = gerador.choice(['', f"&estado={gerador.choice(sintetico.UFS)}", '&status=open',
+                                 '&ordem=salario', '&escolaridade=superior&salario_min=8000'])
+        return endpoint, f"/api/concursos?limit=50{filtro}"
+    if endpoint == 'busca':
+        return endpoint, f"/api/busca?termo={gerador.choice(TERMOS)}&limit=20"
+    if endpoint == 'detalhe':
+        return endpoint, f"/api/concursos/{gerador.randint(1, max_id)}"
+    return endpoint, "/api/estatisticas"
+
+
+def cliente(url: str, max_id: int, semente: int, fim: float, amostras: Dict[str, List[float]], erros: Dict[str, int]):
+    """Fazer requisições até o fim da fase; listagens seguem o cursor por algumas páginas"""
+    gerador = random.Random(semente)
+    sessao = requests.Session()
+    while time.time() < fim:
+        endpoint, caminho = requisicoes(gerador, max_id)
+        paginas = PAGINAS_POR_LISTAGEM if endpoint == 'concursos' else 1
+        for _ in range(paginas):
+            inicio = time.perf_counter()
+            try:
+                resposta = sessao.get(url + caminho, timeout=30)
+                ok = resposta.status_code == 200 or (endpoint == 'detalhe' and resposta.status_code == 404)
+            except requests.RequestException:
+                resposta, ok = None, False
+            amostras[endpoint].append(time.perf_counter() - inicio)
+            if not ok:
+                erros[endpoint] += 1
+                break
+            cursor = resposta.json().get('proximo_cursor') if endpoint == 'concursos' else None
+            if not cursor:
+                break
+            caminho = caminho.split('&cursor=')[0] + f"&cursor={cursor}"
+
+
+def fase(url: str, max_id: int, clientes: int, duracao: float) -> Dict:
+    amostras = {endpoint: [] for endpoint in PESOS}
+    erros = {endpoint: 0 for endpoint in PESOS}
+    fim = time.time() + duracao
+    threads = [
+        threading.Thread(target=cliente, args=(url, max_id, i, fim, amostras, erros))
+        for i in range(clientes)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    resultado = {}
+    for endpoint, tempos in amostras.items():
+        if len(tempos) < 2:
+            resultado[endpoint] = {'requisicoes': len(tempos), 'erros': erros[endpoint]}
+            continue
+        percentis = statistics.quantiles(tempos, n=100)
+        resultado[endpoint] = {
+            'requisicoes': len(tempos),
+            'erros': erros[endpoint],
+            'por_segundo': round(len(tempos) / duracao, 1),
+            'p50_ms': round(percentis[49] * 1000, 2),
+            'p95_ms': round(percentis[94] * 1000, 2),
+            'p99_ms': round(percentis[98] * 1000, 2),
+        }
+    return resultado
+
+
+def executar(banco: str, clientes: int, duracao: float, porta: int, fases: List[str]) -> Dict:
+    with sqlite3.connect(banco) as conn:
+        linhas, max_id = conn.execute("SELECT COUNT(*), MAX(id) FROM concursos").fetchone()
+
+    resultado = {'banco': banco, 'linhas': linhas, 'clientes': clientes, 'duracao_s': duracao, 'fases': {}}
+    for nome in fases:
+        processo = iniciar_servidor(banco, porta, sincronizar=nome == 'com_sincronizacao')
+        try:
+            resultado['fases'][nome] = fase(f"http://127.0.0.1:{porta}", max_id, clientes, duracao)
+        finally:
+            processo.terminate()
+            processo.wait()
+    return resultado
+
+
+def imprimir(resultado: Dict):
+    print("\n" + "=" * 78)
+    print(f"📊 Carga na API: {resultado['linhas']} concursos, {resultado['clientes']} clientes, "
+          f"{resultado['duracao_s']:g}s por fase")
+    for nome, endpoints in resultado['fases'].items():
+        print("=" * 78)
+        print(f"  {FASES[nome]}")
+        print(f"  {'endpoint':<14}{'req':>8}{'req/s':>9}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'erros':>8}")
+        for endpoint, m in endpoints.items():
+            if 'p50_ms' not in m:
+                print(f"  {endpoint:<14}{m['requisicoes']:>8}{'-':>9}{'-':>10}{'-':>10}{'-':>10}{m['erros']:>8}")
+                continue
+            print(f"  {endpoint:<14}{m['requisicoes']:>8}{m['por_segundo']:>9}{m['p50_ms']:>10}"
+                  f"{m['p95_ms']:>10}{m['p99_ms']:>10}{m['erros']:>8}")
+    print("=" * 78)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Teste de carga dos endpoints de leitura da API")
+    sub = parser.add_subparsers(dest='comando', required=True)
+
+    p_exec = sub.add_parser('executar', help='medir latência e vazão, sem e com sincronização concorrente')
+    p_exec.add_argument('--banco', default=BANCO_PADRAO, help='banco gerado por gerar_dados.py')
+    p_exec.add_argument('--clientes', type=int, default=8)
+    p_exec.add_argument('--duracao', type=float, default=30, help='segundos por fase')
+    p_exec.add_argument('--porta', type=int, default=5099)
+    p_exec.add_argument('--fases', default=','.join(FASES))
+    p_exec.add_argument('--saida', help='gravar o resultado em JSON')
+
+    p_serv = sub.add_parser('servidor', help='(interno) servir a API para o teste de carga')
+    p_serv.add_argument('--banco', required=True)
+    p_serv.add_argument('--porta', type=int, required=True)
+    p_serv.add_argument('--sincronizar', action='store_true')
+
+    args = parser.parse_args()
+    if args.comando == 'servidor':
+        servidor(os.path.abspath(args.banco), args.porta, args.sincronizar)
+        return
+    fases = [f.strip() for f in args.fases.split(',') if f.strip()]
+    invalidas = set(fases) - set(FASES)
+    if invalidas:
+        parser.error(f"fases inválidas: {', '.join(sorted(invalidas))}")
+    if not os.path.exists(args.banco):
+        raise SystemExit(f"Banco {args.banco} não encontrado; gere-o com: python benchmarks/gerar_dados.py")
+    # Banco copiado: a fase com sincronização grava nele e não pode afetar a próxima execução
+    with tempfile.TemporaryDirectory() as tmp:
+        copia = os.path.join(tmp, 'carga.db')
+        origem, destino = sqlite3.connect(args.banco), sqlite3.connect(copia)
+        origem.backup(destino)
+        origem.close()
+        destino.close()
+        resultado = executar(copia, args.clientes, args.duracao, args.porta, fases)
+    resultado['banco'] = args.banco
+    imprimir(resultado)
+    if args.saida:
+        with open(args.saida, 'w', encoding='utf-8') as f:
+            json.dump(resultado, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+import argparse
+import os
+import random
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from database import Database  # noqa: E402
+import sintetico  # noqa: E402
+
+TAMANHO_LOTE = 5000
+
+
+def gerar(caminho: str, linhas: int, semente: int, fracao_duplicadas: float, agrupar: bool):
+    """Preencher o banco com concursos sintéticos pelo mesmo upsert da sincronização
+
+    Uma fração das linhas repete um concurso já gerado em outra fonte, como os
+    agregadores fazem, para que o filtro de canônicos tenha o que descartar.
+    """
+    gerador = random.Random(semente)
+    db = Database(caminho)
+    conn = db.conexao()
+    inicial = db.contar_concursos()
+    recentes = []
+    inicio = time.perf_counter()
+
+    while db.contar_concursos() - inicial < linhas:
+        faltam = linhas - (db.contar_concursos() - inicial)
+        lote = []
+        for _ in range(min(TAMANHO_LOTE, faltam)):
+            if recentes and gerador.random() < fracao_duplicadas:
+                concurso = dict(gerador.choice(recentes), fonte=gerador.choice(sintetico.FONTES))
+            else:
+                concurso = sintetico.concurso(gerador)
+                recentes.append(concurso)
+            lote.append(concurso)
+        # Só os últimos concursos servem de base para duplicatas (memória constante)
+        del recentes[:-TAMANHO_LOTE]
+        # Conflitos com linhas existentes viram no-op; o laço completa o que faltar
+        with conn:
+            conn.executemany(db.SQL_UPSERT, [db._parametros_concurso(c) for c in lote])
+        total = db.contar_concursos() - inicial
+        print(f"  {total:>9} linhas ({total / (time.perf_counter() - inicio):,.0f}/s)", end='\r')
+    print()
+
+    if agrupar:
+        etapa = time.perf_counter()
+        duplicatas = db.agrupar_duplicatas()
+        print(f"✓ {duplicatas} duplicatas agrupadas em {time.perf_counter() - etapa:.1f}s")
+    db.atualizar_estatisticas()
+    db.fechar()
+    print(f"✓ {linhas} concursos gravados em {caminho} em {time.perf_counter() - inicio:.1f}s "
+          f"({os.path.getsize(caminho) / 2**20:.1f} MiB)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gerar um banco de concursos sintéticos para benchmarks")
+    parser.add_argument('--banco', default=os.path.join(RAIZ, 'benchmarks', 'fixtures', 'carga.db'))
+    parser.add_argument('--linhas', type=int, default=10000)
+    parser.add_argument('--semente', type=int, default=2024)
+    parser.add_argument('--duplicadas', type=float, default=0.15,
+                        help='fração de linhas que repetem um concurso em outra fonte')
+    parser.add_argument('--agrupar', action='store_true',
+                        help='agrupar duplicatas (canonico_id) ao final; lento acima de ~100 mil linhas')
+    args = parser.parse_args()
+    os.makedirs(os.path.dirname(os.path.abspath(args.banco)), exist_ok=True)
+    gerar(args.banco, args.linhas, args.semente, args.duplicadas, args.agrupar)
+
+
+if __name__ == '__main__':
+    main()
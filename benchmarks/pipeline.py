@@ -0,0 +1,295 @@
+import argparse
+import http.server
+import json
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from typing import Dict, List, Tuple
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from config import Config  # noqa: E402
+from database import Database  # noqa: E402
+from scrapers import EstadoPaginasMemoria, Scraper, ScraperManager  # noqa: E402
+import sintetico  # noqa: E402
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+DIR_FIXTURES = os.path.join(RAIZ, 'benchmarks', 'fixtures')
+DIR_GOLDEN = os.path.join(RAIZ, 'benchmarks', 'golden')
+ETAPAS = ('http', 'parse', 'extracao', 'gravacao')
+# Campos que variam entre execuções e ficam fora da comparação com o golden
+CAMPOS_VOLATEIS = ('data_publicacao',)
+
+
+def dir_conjunto(conjunto: str) -> str:
+    return os.path.join(DIR_FIXTURES, conjunto)
+
+
+def salvar_conjunto(conjunto: str, paginas: List[Dict]):
+    """Gravar páginas ({'nome', 'fonte', 'url', 'html' ou 'conteudo'}) e o manifest.json do conjunto"""
+    destino = dir_conjunto(conjunto)
+    os.makedirs(destino, exist_ok=True)
+    manifesto = []
+    for pagina in paginas:
+        arquivo = f"{pagina['nome']}.html"
+        conteudo = pagina.get('conteudo') or pagina['html'].encode('utf-8')
+        with open(os.path.join(destino, arquivo), 'wb') as f:
+            f.write(conteudo)
+        manifesto.append({'nome': pagina['nome'], 'fonte': pagina['fonte'], 'url': pagina['url'],
+                          'max_items': pagina.get('max_items', 100), 'arquivo': arquivo})
+    with open(os.path.join(destino, 'manifest.json'), 'w', encoding='utf-8') as f:
+        json.dump(manifesto, f, ensure_ascii=False, indent=2)
+    print(f"✓ {len(manifesto)} páginas gravadas em {destino}")
+
+
+def carregar_conjunto(conjunto: str) -> List[Dict]:
+    caminho = os.path.join(dir_conjunto(conjunto), 'manifest.json')
+    if not os.path.exists(caminho):
+        if conjunto != 'sintetico':
+            raise SystemExit(f"Conjunto '{conjunto}' não encontrado; grave-o com: gravar --conjunto {conjunto}")
+        salvar_conjunto(conjunto, sintetico.fixtures_sinteticas())
+    with open(caminho, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def gravar(conjunto: str, paginas_por_fonte: int):
+    """Baixar as páginas de cada fonte ativa do registro (rede necessária)"""
+    Config.HTTP_CONDITIONAL_GET = False
+    paginas = []
+    for fonte in ScraperManager.fontes_ativas():
+        fila, vistas = list(fonte.urls), set()
+        while fila and len(vistas) < paginas_por_fonte:
+            url = fila.pop(0)
+            if url in vistas:
+                continue
+            vistas.add(url)
+            try:
+                Scraper.aguardar_vez_host(url)
+                resposta = Scraper.sessao().get(url, timeout=fonte.timeout)
+                resposta.raise_for_status()
+            except Exception as e:
+                print(f"  ❌ {fonte.nome} {url}: {e}")
+                continue
+            paginas.append({'nome': f"{fonte.nome}-{len(vistas) - 1}", 'fonte': fonte.fonte, 'url': url,
+                            'max_items': fonte.max_items, 'conteudo': resposta.content})
+            doc = Scraper.analisar_html(resposta.content.decode('utf-8', 'replace'))
+            fila.extend(Scraper.links_rastreaveis(doc, url))
+            Scraper.liberar_documento(doc)
+            print(f"  ✓ {fonte.nome}: {url} ({len(resposta.content) // 1024} KiB)")
+    salvar_conjunto(conjunto, paginas)
+
+
+class ServidorFixtures(http.server.ThreadingHTTPServer):
+    """Servidor HTTP local que responde com os arquivos de um conjunto"""
+
+    def __init__(self, diretorio: str):
+        diretorio_servido = diretorio
+
+        class Handler(http.server.SimpleHTTPRequestHandler):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, directory=diretorio_servido, **kwargs)
+
+            def log_message(self, *args):
+                pass
+
+        super().__init__(('127.0.0.1', 0), Handler)
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+    def url(self, arquivo: str) -> str:
+        return f"http://127.0.0.1:{self.server_port}/{arquivo}"
+
+
+def comparavel(concursos: List[Dict]) -> List[Dict]:
+    return [{k: v for k, v in c.items() if k not in CAMPOS_VOLATEIS} for c in concursos]
+
+
+def executar(conjunto: str, repeticoes: int, alocacoes: bool) -> Tuple[Dict, Dict]:
+    """Reproduzir o conjunto pelo pipeline fazer_requisicao → extrair → inserir_concurso
+
+    Retorna as métricas e os concursos extraídos na primeira rodada, por página.
+    """
+    paginas = carregar_conjunto(conjunto)
+    servidor = ServidorFixtures(dir_conjunto(conjunto))
+    Config.CRAWL_INTERVALO_DOMINIO_SECONDS = 0
+
+    # Tempo de parse medido separadamente dentro de fazer_requisicao
+    analisar_html = Scraper.analisar_html
+    tempo_parse = [0.0]
+
+    def analisar_medindo(html):
+        inicio = time.perf_counter()
+        try:
+            return analisar_html(html)
+        finally:
+            tempo_parse[0] += time.perf_counter() - inicio
+    Scraper.analisar_html = staticmethod(analisar_medindo)
+
+    tempos = {etapa: [] for etapa in ETAPAS}
+    picos = {etapa: 0 for etapa in ETAPAS}
+    extraidos = {}
+    linhas = bytes_lidos = 0
+
+    def medir(etapa, funcao):
+        if alocacoes:
+            tracemalloc.reset_peak()
+        inicio = time.perf_counter()
+        resultado = funcao()
+        tempos[etapa].append(time.perf_counter() - inicio)
+        if alocacoes:
+            picos[etapa] = max(picos[etapa], tracemalloc.get_traced_memory()[1])
+        return resultado
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for rodada in range(repeticoes):
+            # Estado novo a cada rodada: nenhuma página volta como não modificada
+            Scraper.estado_paginas = EstadoPaginasMemoria()
+            db = Database(os.path.join(tmp, f"bench-{rodada}.db"))
+            if alocacoes:
+                tracemalloc.start()
+            for pagina in paginas:
+                url = servidor.url(pagina['arquivo'])
+                bytes_lidos += os.path.getsize(os.path.join(dir_conjunto(conjunto), pagina['arquivo']))
+
+                tempo_parse[0] = 0.0
+                doc = medir('http', lambda: Scraper.fazer_requisicao(url))
+                tempos['http'][-1] -= tempo_parse[0]
+                tempos['parse'].append(tempo_parse[0])
+                concursos = medir('extracao', lambda: Scraper.extrair_concursos_generico(
+                    doc, pagina['fonte'], pagina['url'], pagina['max_items']))
+                Scraper.liberar_documento(doc)
+                medir('gravacao', lambda: [db.inserir_concurso(dict(c)) for c in concursos])
+                linhas += len(concursos)
+                if rodada == 0:
+                    extraidos[pagina['nome']] = comparavel(concursos)
+            if alocacoes:
+                tracemalloc.stop()
+            db.fechar()
+
+    Scraper.analisar_html = staticmethod(analisar_html)
+    servidor.shutdown()
+
+    total = sum(sum(v) for v in tempos.values())
+    resultado = {
+        'conjunto': conjunto,
+        'paginas': len(paginas),
+        'repeticoes': repeticoes,
+        'linhas': linhas,
+        'etapas': {
+            etapa: {
+                'total_ms': round(sum(v) * 1000, 2),
+                'media_ms': round(statistics.mean(v) * 1000, 3) if v else 0,
+                # O parse acontece dentro de 'http'; seu pico aparece somado ao dessa etapa
+                'pico_alocado_kib': round(picos[etapa] / 1024, 1) if alocacoes and etapa != 'parse' else None,
+            }
+            for etapa, v in tempos.items()
+        },
+        'total_ms': round(total * 1000, 2),
+        'linhas_por_segundo': round(linhas / total, 1) if total else 0,
+        'mib_por_segundo': round(bytes_lidos / 2**20 / total, 2) if total else 0,
+        'pico_rss_mib': pico_rss_mib(),
+    }
+    return resultado, extraidos
+
+
+def pico_rss_mib() -> float:
+    if resource is None:
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss vem em KiB no Linux e em bytes no macOS
+    return round(pico / (2**20 if sys.platform == 'darwin' else 1024), 1)
+
+
+def verificar_golden(conjunto: str, extraidos: Dict, atualizar: bool) -> bool:
+    """Comparar os concursos extraídos com o golden do conjunto (ou regravá-lo)"""
+    caminho = os.path.join(DIR_GOLDEN, f"{conjunto}.json")
+    if atualizar or not os.path.exists(caminho):
+        os.makedirs(DIR_GOLDEN, exist_ok=True)
+        with open(caminho, 'w', encoding='utf-8') as f:
+            json.dump(extraidos, f, ensure_ascii=False, indent=1, sort_keys=True)
+        print(f"✓ Golden gravado em {caminho}")
+        return True
+
+    with open(caminho, encoding='utf-8') as f:
+        esperado = json.load(f)
+    ok = True
+    for nome in sorted(set(esperado) | set(extraidos)):
+        a, b = esperado.get(nome), extraidos.get(nome)
+        if a != b:
+            ok = False
+            faltando = [c['titulo'] for c in a or [] if c not in (b or [])]
+            sobrando = [c['titulo'] for c in b or [] if c not in (a or [])]
+            print(f"  ❌ {nome}: esperado {len(a or [])}, extraído {len(b or [])} "
+                  f"(faltando {faltando[:3]}, sobrando {sobrando[:3]})")
+    print("✓ Saída idêntica ao golden" if ok else "✗ Saída diferente do golden")
+    return ok
+
+
+def imprimir(resultado: Dict, baseline: Dict = None):
+    print("\n" + "=" * 70)
+    print(f"📊 Benchmark '{resultado['conjunto']}': {resultado['paginas']} páginas x "
+          f"{resultado['repeticoes']} repetições, {resultado['linhas']} concursos")
+    print("=" * 70)
+    for etapa, m in resultado['etapas'].items():
+        linha = f"  {etapa:<10} total {m['total_ms']:>10.2f} ms   média {m['media_ms']:>8.3f} ms/página"
+        if m['pico_alocado_kib'] is not None:
+            linha += f"   pico alocado {m['pico_alocado_kib']:>9.1f} KiB"
+        if baseline:
+            anterior = baseline['etapas'][etapa]['total_ms']
+            if anterior:
+                linha += f"   ({(m['total_ms'] - anterior) / anterior * 100:+.1f}%)"
+        print(linha)
+    print(f"  {'total':<10} {resultado['total_ms']:.2f} ms | {resultado['linhas_por_segundo']} concursos/s | "
+          f"{resultado['mib_por_segundo']} MiB/s | pico RSS {resultado['pico_rss_mib']} MiB")
+    print("=" * 70)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark offline do pipeline de scraping com páginas gravadas (fixtures)")
+    sub = parser.add_subparsers(dest='comando', required=True)
+
+    p_gravar = sub.add_parser('gravar', help='gravar páginas das fontes ativas de fontes.yaml (usa a rede)')
+    p_gravar.add_argument('--conjunto', default='gravado')
+    p_gravar.add_argument('--paginas', type=int, default=1, help='páginas por fonte (segue paginação)')
+
+    p_sint = sub.add_parser('sintetico', help='(re)gerar o conjunto sintético determinístico')
+    p_sint.add_argument('--semente', type=int, default=2024)
+
+    p_exec = sub.add_parser('executar', help='reproduzir um conjunto por um servidor HTTP local')
+    p_exec.add_argument('--conjunto', default='sintetico')
+    p_exec.add_argument('--repeticoes', type=int, default=5)
+    p_exec.add_argument('--alocacoes', action='store_true', help='medir pico de alocações (tracemalloc)')
+    p_exec.add_argument('--atualizar-golden', action='store_true')
+    p_exec.add_argument('--saida', help='gravar o resultado em JSON (para usar como baseline)')
+    p_exec.add_argument('--baseline', help='JSON de uma execução anterior para comparar')
+
+    args = parser.parse_args()
+    if args.comando == 'gravar':
+        gravar(args.conjunto, args.paginas)
+    elif args.comando == 'sintetico':
+        salvar_conjunto('sintetico', sintetico.fixtures_sinteticas(args.semente))
+    else:
+        resultado, extraidos = executar(args.conjunto, args.repeticoes, args.alocacoes)
+        baseline = None
+        if args.baseline:
+            with open(args.baseline, encoding='utf-8') as f:
+                baseline = json.load(f)
+        imprimir(resultado, baseline)
+        ok = verificar_golden(args.conjunto, extraidos, args.atualizar_golden)
+        if args.saida:
+            with open(args.saida, 'w', encoding='utf-8') as f:
+                json.dump(resultado, f, indent=2)
+        sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+import random
+from typing import Dict, List
+
+ORGAOS = [
+    'Prefeitura de', 'Câmara Municipal de', 'Tribunal de Justiça de', 'SAAE de',
+    'Instituto de Previdência de', 'Universidade Federal de', 'Polícia Militar de',
+    'Hospital Municipal de', 'Secretaria de Educação de', 'Consórcio Intermunicipal de',
+]
+CIDADES = [
+    'Campinas', 'São José dos Campos', 'Maringá', 'Londrina', 'Uberlândia', 'Ribeirão Preto',
+    'Juiz de Fora', 'Feira de Santana', 'Joinville', 'Caxias do Sul', 'Sorocaba', 'Niterói',
+    'Petrolina', 'Anápolis', 'Mossoró', 'Chapecó', 'Imperatriz', 'Parnaíba',
+]
+UFS = ['SP', 'RJ', 'MG', 'PR', 'SC', 'RS', 'BA', 'PE', 'GO', 'CE', 'DF', 'PA', 'MA', 'PI', 'RN']
+CARGOS = ['Professor', 'Enfermeiro', 'Agente Administrativo', 'Analista', 'Técnico em Enfermagem',
+          'Guarda Municipal', 'Médico', 'Assistente Social', 'Engenheiro Civil', 'Motorista']
+ESCOLARIDADES = ['Fundamental', 'Médio', 'Técnico', 'Superior']
+BANCAS = ['FGV', 'Cebraspe', 'Vunesp', 'IBFC', 'Instituto AOCP', 'Fundatec', 'Quadrix', '']
+FONTES = ['pciconcursos', 'jcconcursos', 'concursosnobrasil', 'qconcursos', 'acheconcursos',
+          'globalconcursos', 'konkursos', 'concursos.com.br', 'cebraspe', 'vunesp', 'fgv', 'ibfc']
+# Textos que o classificador deve rejeitar (cursos, resultados, propaganda)
+RUIDO = ['Apostila completa para concursos', 'Resultado final do concurso', 'Curso preparatório online',
+         'Gabarito oficial da prova', 'Assine o plano anual com desconto', 'Fale conosco pelo WhatsApp']
+
+
+def titulo(gerador: random.Random) -> str:
+    """Título de edital no formato mais comum dos agregadores"""
+    return (f"Edital {gerador.choice(ORGAOS)} {gerador.choice(CIDADES)} - {gerador.choice(UFS)}"
+            f" {gerador.randint(1, 30):02d}/{gerador.choice((2024, 2025))}")
+
+
+def concurso(gerador: random.Random, fonte: str = None) -> Dict:
+    """Concurso completo para popular o banco (o cargo no título amplia as combinações únicas)"""
+    texto = f"{titulo(gerador)} - {gerador.choice(CARGOS)}"
+    salario = gerador.randint(1500, 25000)
+    escolaridade = gerador.choice(ESCOLARIDADES)
+    nivel = ESCOLARIDADES.index(escolaridade) + 1
+    return {
+        'titulo': texto,
+        'organizacao': texto.split('-')[0].replace('Edital ', '').strip()[:50],
+        'estado': texto.split(' - ')[1][:2],
+        'escolaridade': escolaridade,
+        'escolaridade_min': nivel,
+        'escolaridade_max': nivel,
+        'vagas': gerador.randint(1, 500),
+        'salario': f"R$ {salario:,}".replace(',', '.') + ',00',
+        'salario_min': float(salario),
+        'salario_max': float(salario),
+        'banca': gerador.choice(BANCAS),
+        'status': gerador.choice(('open', 'open', 'open', 'closed')),
+        'fonte': fonte or gerador.choice(FONTES),
+        'link_edital': f"https://exemplo.com.br/edital/{gerador.randrange(10**9)}",
+        'descricao': f"{gerador.choice(CARGOS)}, {gerador.choice(CARGOS)} e outros cargos",
+        'data_publicacao': f"{gerador.choice((2024, 2025))}-{gerador.randint(1, 12):02d}-{gerador.randint(1, 28):02d}",
+    }
+
+
+def pagina_listagem(gerador: random.Random, itens: int, com_links: bool = True) -> str:
+    """Página HTML de listagem no estilo de um agregador
+
+    Com links, cada concurso é um <a> seguido das vagas (caminho principal do
+    extrator); sem links, os títulos ficam em parágrafos (fallback por texto).
+    """
+    partes = ['<!DOCTYPE html><html><head><meta charset="utf-8"><title>Concursos abertos</title>',
+              '<script>var destaque = "Edital Prefeitura de X - SP 10 vagas";</script>',
+              '<style>.item{margin:0}</style></head><body><nav><a href="/">Início</a>',
+              '<a href="/cursos">Cursos</a></nav><main>']
+    for i in range(itens):
+        texto = gerador.choice(RUIDO) if gerador.random() < 0.2 else titulo(gerador)
+        vagas = gerador.randint(1, 900)
+        if com_links:
+            partes.append(f'<div class="item"><h3><a href="/concurso/{i}">{texto}</a> <span>{vagas} vagas</span>'
+                          f'</h3><p>Salário até R$ {gerador.randint(1500, 25000)},00</p></div>')
+        else:
+            partes.append(f'<div class="item"><p>{texto}</p><p>{vagas} vagas</p><p>Publicado hoje</p></div>')
+    partes.append('</main><footer><a href="/lista?page=2">Próxima</a> <a href="/estado/sp">São Paulo</a>'
+                  '</footer></body></html>')
+    return ''.join(partes)
+
+
+def fixtures_sinteticas(semente: int = 2024) -> List[Dict]:
+    """Conjunto fixo de páginas sintéticas: [{'nome', 'fonte', 'url', 'html'}]"""
+    gerador = random.Random(semente)
+    paginas = []
+    for i, (fonte, itens, com_links) in enumerate((
+        ('pciconcursos', 120, True), ('jcconcursos', 80, True), ('concursosnobrasil', 100, True),
+        ('qconcursos', 40, True), ('cebraspe', 30, False), ('vunesp', 60, False),
+    )):
+        paginas.append({
+            'nome': f"{fonte}-{i}",
+            'fonte': fonte,
+            'url': f"https://{fonte}.exemplo/concursos",
+            'html': pagina_listagem(gerador, itens, com_links),
+        })
+    return paginas
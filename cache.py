@@ -0,0 +1,76 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable
+
+
+class CacheRespostas:
+    """Cache LRU em memória para respostas da API
+
+    Cada sincronização bem-sucedida chama invalidar(), que incrementa a
+    geração dos dados e descarta todas as entradas. A geração também compõe
+    o ETag das respostas, então um ETag antigo nunca valida dados novos.
+    """
+
+    def __init__(self, max_itens: int = 256):
+        self.max_itens = max_itens
+        self.geracao = 0
+        # Diferencia ETags entre execuções do servidor
+        self._instancia = format(int(time.time()), 'x')
+        self._itens = OrderedDict()
+        self._lock = threading.Lock()
+        self.acertos = 0
+        self.falhas = 0
+
+    @staticmethod
+    def chave(endpoint: str, args) -> tuple:
+        """Normalizar endpoint + parâmetros (ordem e valores vazios não importam)"""
+        parametros = sorted(
+            (nome, valor) for nome in args for valor in args.getlist(nome) if valor != ''
+        )
+        return (endpoint, tuple(parametros))
+
+    def etag(self, chave: tuple) -> str:
+        """ETag da chave na geração atual dos dados"""
+        resumo = hashlib.md5(repr(chave).encode()).hexdigest()[:16]
+        return f"{self._instancia}-{self.geracao}-{resumo}"
+
+    def obter(self, chave: tuple) -> Any:
+        """Obter um valor do cache (None se ausente)"""
+        with self._lock:
+            valor = self._itens.get(chave)
+            if valor is None:
+                self.falhas += 1
+                return None
+            self._itens.move_to_end(chave)
+            self.acertos += 1
+            return valor
+
+    def guardar(self, chave: tuple, valor: Any, geracao: int):
+        """Guardar um valor calculado na geração informada (ignorado se ela já passou)"""
+        with self._lock:
+            if geracao != self.geracao:
+                return
+            self._itens[chave] = valor
+            self._itens.move_to_end(chave)
+            while len(self._itens) > self.max_itens:
+                self._itens.popitem(last=False)
+
+    def obter_ou_calcular(self, chave: tuple, calcular: Callable[[], Any]) -> Any:
+        """Obter do cache ou calcular e guardar o valor"""
+        valor = self.obter(chave)
+        if valor is None:
+            geracao = self.geracao
+            valor = calcular()
+            self.guardar(chave, valor, geracao)
+        return valor
+
+    def invalidar(self):
+        """Avançar a geração dos dados e esvaziar o cache"""
+        with self._lock:
+            self.geracao += 1
+            self._itens.clear()
+
+    def __len__(self):
+        return len(self._itens)
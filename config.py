@@ -7,13 +7,35 @@ class Config:
     # API Configuration
     API_HOST = os.getenv('API_HOST', 'http://localhost:5000')
     API_PORT = int(os.getenv('API_PORT', 5000))
+    API_LIMITE_PADRAO = int(os.getenv('API_LIMITE_PADRAO', 100))
+    API_LIMITE_MAXIMO = int(os.getenv('API_LIMITE_MAXIMO', 1000))
+    CACHE_MAX_ITENS = int(os.getenv('CACHE_MAX_ITENS', 256))
+    API_STREAM_LOTE = int(os.getenv('API_STREAM_LOTE', 500))
+    API_COMPRESSAO_MINIMO_BYTES = int(os.getenv('API_COMPRESSAO_MINIMO_BYTES', 1024))
+    EXPORT_LINHAS_POR_GRUPO = int(os.getenv('EXPORT_LINHAS_POR_GRUPO', 10000))
     
     # Database
     DATABASE_PATH = os.getenv('DATABASE_PATH', 'concursos.db')
+    DB_BUSY_TIMEOUT_MS = int(os.getenv('DB_BUSY_TIMEOUT_MS', 5000))
+    DB_MMAP_SIZE = int(os.getenv('DB_MMAP_SIZE', 64 * 1024 * 1024))
+    DB_POOL_TAMANHO = int(os.getenv('DB_POOL_TAMANHO', 8))
     
     # Scraping
     SCRAPE_INTERVAL_HOURS = int(os.getenv('SCRAPE_INTERVAL_HOURS', 6))
     REQUEST_TIMEOUT = int(os.getenv('REQUEST_TIMEOUT', 10))
+    FONTES_PATH = os.getenv('FONTES_PATH', 'fontes.yaml')
+    AGENDADOR_VERIFICACAO_MINUTOS = int(os.getenv('AGENDADOR_VERIFICACAO_MINUTOS', 15))
+    SCRAPE_CONCORRENTE = os.getenv('SCRAPE_CONCORRENTE', 'True') == 'True'
+    SCRAPE_MAX_WORKERS = int(os.getenv('SCRAPE_MAX_WORKERS', 12))
+    SCRAPE_MAX_POR_HOST = int(os.getenv('SCRAPE_MAX_POR_HOST', 2))
+    SCRAPE_DEADLINE_SECONDS = int(os.getenv('SCRAPE_DEADLINE_SECONDS', 60))
+    CRAWL_MAX_PAGINAS = int(os.getenv('CRAWL_MAX_PAGINAS', 10))
+    CRAWL_PROFUNDIDADE_MAXIMA = int(os.getenv('CRAWL_PROFUNDIDADE_MAXIMA', 2))
+    CRAWL_INTERVALO_DOMINIO_SECONDS = float(os.getenv('CRAWL_INTERVALO_DOMINIO_SECONDS', 1.0))
+    CRAWL_TEMPO_MAXIMO_SECONDS = int(os.getenv('CRAWL_TEMPO_MAXIMO_SECONDS', 45))
+    HTTP_RETRIES = int(os.getenv('HTTP_RETRIES', 2))
+    HTTP_BACKOFF = float(os.getenv('HTTP_BACKOFF', 0.5))
+    HTTP_CONDITIONAL_GET = os.getenv('HTTP_CONDITIONAL_GET', 'True') == 'True'
     
     # CORS
     CORS_ORIGINS = os.getenv('CORS_ORIGINS', '*')
@@ -1,16 +1,86 @@
 import sqlite3
+import base64
+import hashlib
 import json
-from datetime import datetime
-from typing import List, Dict
+import re
+import threading
+from datetime import datetime, timezone
+from typing import Iterator, List, Dict, Tuple
+from config import Config
+from deduplicacao import agrupar, chaves_conjunto, normalizar_titulo, shingles
+from enriquecimento import banca_canonica, enriquecer, nivel_escolaridade
+from metricas import GRAVACAO_FONTE, LINHAS_FONTE
 
 class Database:
     def __init__(self, db_path='concursos.db'):
         self.db_path = db_path
+        self._local = threading.local()
+        # Conexões devolvidas pelas threads, reaproveitadas sem novo connect nem PRAGMAs
+        self._livres = []
+        self._trava_livres = threading.Lock()
         self.init_db()
     
+    def _nova_conexao(self) -> sqlite3.Connection:
+        """Abrir uma conexão em WAL, synchronous=NORMAL (compartilhável entre threads, uma por vez)"""
+        conn = sqlite3.connect(self.db_path, timeout=Config.DB_BUSY_TIMEOUT_MS / 1000, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA mmap_size={int(Config.DB_MMAP_SIZE)}")
+        conn.execute(f"PRAGMA busy_timeout={int(Config.DB_BUSY_TIMEOUT_MS)}")
+        return conn
+    
+    def _emprestar(self) -> sqlite3.Connection:
+        """Retirar uma conexão livre do pool, ou abrir uma nova se não houver"""
+        with self._trava_livres:
+            if self._livres:
+                return self._livres.pop()
+        return self._nova_conexao()
+    
+    def _devolver(self, conn: sqlite3.Connection):
+        """Devolver a conexão ao pool (fechada se o pool já estiver cheio)"""
+        if conn.in_transaction:
+            conn.rollback()
+        with self._trava_livres:
+            if len(self._livres) < Config.DB_POOL_TAMANHO:
+                self._livres.append(conn)
+                return
+        conn.close()
+    
+    def conexao(self) -> sqlite3.Connection:
+        """Obter a conexão da thread atual, emprestada do pool na primeira chamada
+        
+        A conexão fica com a thread até liberar(). O servidor cria uma thread
+        por requisição, então a app libera ao fim de cada requisição e a
+        próxima reaproveita a conexão já aberta.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._emprestar()
+            self._local.conn = conn
+        return conn
+    
+    def liberar(self):
+        """Devolver ao pool a conexão da thread atual"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            self._local.conn = None
+            self._devolver(conn)
+    
+    def fechar(self):
+        """Fechar a conexão da thread atual e as conexões livres do pool"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+        with self._trava_livres:
+            livres, self._livres = self._livres, []
+        for conn in livres:
+            conn.close()
+    
     def init_db(self):
         """Inicializar banco de dados com tabelas"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.conexao()
         cursor = conn.cursor()
         
         # Tabela de concursos
@@ -47,101 +117,909 @@ class Database:
             )
         ''')
         
+        # Estado de cada página visitada pelos scrapers (sincronização incremental)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS paginas (
+                url TEXT PRIMARY KEY,
+                hash_conteudo TEXT,
+                etag TEXT,
+                last_modified TEXT,
+                data_verificacao TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        
+        # Última execução de cada fonte do registro (agendamento por fonte)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS execucoes_fontes (
+                fonte TEXT PRIMARY KEY,
+                status TEXT,
+                data_execucao TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        
+        # Colunas adicionadas depois da primeira versão do esquema
+        self._adicionar_coluna(cursor, 'concursos', 'hash_conteudo', 'TEXT')
+        self._adicionar_coluna(cursor, 'atualizacoes', 'removidos', 'INTEGER DEFAULT 0')
+        self._adicionar_coluna(cursor, 'paginas', 'links', 'TEXT')
+        # Registro canônico do grupo de quase duplicados (NULL = ainda não agrupado, vale como canônico)
+        self._adicionar_coluna(cursor, 'concursos', 'canonico_id', 'INTEGER')
+        # Linha nova, alterada ou encerrada desde o último agrupamento (as existentes entram todas)
+        self._adicionar_coluna(cursor, 'concursos', 'agrupamento_pendente', 'INTEGER NOT NULL DEFAULT 1')
+        self._adicionar_coluna(cursor, 'concursos', 'titulo_normalizado', 'TEXT')
+        # Campos tipados do enriquecimento (faixas de salário e de nível de escolaridade)
+        novas = [
+            self._adicionar_coluna(cursor, 'concursos', coluna, tipo)
+            for coluna, tipo in (('salario_min', 'REAL'), ('salario_max', 'REAL'),
+                                 ('escolaridade_min', 'INTEGER'), ('escolaridade_max', 'INTEGER'))
+        ]
+        if any(novas):
+            self._enriquecer_existentes(cursor)
+        
+        # Chaves dos baldes LSH do título de cada concurso (agrupamento incremental de duplicatas)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS lsh_bandas (
+                chave INTEGER NOT NULL,
+                concurso_id INTEGER NOT NULL,
+                PRIMARY KEY (chave, concurso_id)
+            ) WITHOUT ROWID
+        ''')
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_lsh_bandas_concurso ON lsh_bandas(concurso_id)")
+        
+        # Concursos listados por cada página da última vez que ela foi lida (encerramento dos ausentes)
+        existia = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'paginas_concursos'"
+        ).fetchone() is not None
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS paginas_concursos (
+                url TEXT NOT NULL,
+                concurso_id INTEGER NOT NULL,
+                PRIMARY KEY (url, concurso_id)
+            ) WITHOUT ROWID
+        ''')
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_paginas_concursos_concurso ON paginas_concursos(concurso_id)")
+        if not existia:
+            # Bancos anteriores só sabem a página em que cada concurso aberto foi visto por último
+            cursor.execute('''
+                INSERT OR IGNORE INTO paginas_concursos (url, concurso_id)
+                SELECT link_edital, id FROM concursos
+                WHERE link_edital IS NOT NULL AND status IS NOT 'closed'
+            ''')
+        
+        # Estatísticas agregadas, recalculadas ao fim de cada sincronização
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS estatisticas (
+                tipo TEXT NOT NULL,
+                chave TEXT NOT NULL,
+                valor INTEGER NOT NULL,
+                data_atualizacao TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (tipo, chave)
+            )
+        ''')
+        
+        # Índices para os filtros e para a ordenação por data
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_concursos_data ON concursos(data_publicacao)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_concursos_estado ON concursos(estado, data_publicacao)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_concursos_status ON concursos(status, data_publicacao)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_concursos_fonte ON concursos(fonte, data_publicacao)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_concursos_canonico ON concursos(canonico_id)")
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_concursos_agrupamento ON concursos(id) WHERE agrupamento_pendente = 1"
+        )
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_concursos_banca ON concursos(banca, data_publicacao)")
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_concursos_escolaridade ON concursos(escolaridade_min, escolaridade_max)"
+        )
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_concursos_salario ON concursos(salario_max)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_concursos_vagas ON concursos(vagas)")
+        cursor.execute(f'''
+            CREATE INDEX IF NOT EXISTS idx_concursos_canonicos_data ON concursos(data_publicacao)
+            WHERE {self.filtro_canonico()}
+        ''')
+        
         conn.commit()
-        conn.close()
+        self.fts_disponivel = self.init_fts()
+    
+    @staticmethod
+    def _adicionar_coluna(cursor: sqlite3.Cursor, tabela: str, coluna: str, tipo: str) -> bool:
+        """Adicionar uma coluna a uma tabela existente, se ela ainda não existir (True se adicionou)"""
+        colunas = [row[1] for row in cursor.execute(f"PRAGMA table_info({tabela})")]
+        if coluna in colunas:
+            return False
+        cursor.execute(f"ALTER TABLE {tabela} ADD COLUMN {coluna} {tipo}")
+        return True
+    
+    @staticmethod
+    def _enriquecer_existentes(cursor: sqlite3.Cursor):
+        """Preencher os campos tipados das linhas gravadas antes de eles existirem
+        
+        O enriquecimento relê o título junto com os textos já gravados; UF vazia
+        é preenchida, e banca e escolaridade reconhecidas ficam com o nome canônico.
+        """
+        linhas = cursor.execute(
+            "SELECT id, titulo, escolaridade, salario, banca, descricao FROM concursos"
+        ).fetchall()
+        if not linhas:
+            return
+        atualizacoes = []
+        for id_, titulo, escolaridade, salario, banca, descricao in linhas:
+            contexto = ' '.join(filter(None, (
+                descricao, salario, f"nível {escolaridade}" if escolaridade else None, banca
+            )))
+            campos = enriquecer(titulo or '', contexto)
+            atualizacoes.append((
+                campos['estado'], campos['banca'], campos['escolaridade'], campos['escolaridade_min'],
+                campos['escolaridade_max'], campos['salario_min'], campos['salario_max'], id_
+            ))
+        cursor.executemany('''
+            UPDATE concursos SET
+                estado = COALESCE(NULLIF(estado, ''), NULLIF(?, '')),
+                banca = COALESCE(?, banca),
+                escolaridade = COALESCE(?, escolaridade),
+                escolaridade_min = ?, escolaridade_max = ?, salario_min = ?, salario_max = ?,
+                data_atualizacao = CURRENT_TIMESTAMP
+            WHERE id = ?
+        ''', atualizacoes)
+        print(f"✓ Campos tipados preenchidos em {len(atualizacoes)} concursos existentes")
+    
+    def init_fts(self) -> bool:
+        """Criar o índice FTS5 de busca textual, sincronizado por triggers
+        
+        Retorna False quando o SQLite não tem FTS5; a busca volta a usar LIKE.
+        """
+        conn = self.conexao()
+        existia = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'concursos_fts'"
+        ).fetchone() is not None
+        try:
+            with conn:
+                conn.execute('''
+                    CREATE VIRTUAL TABLE IF NOT EXISTS concursos_fts USING fts5(
+                        titulo, organizacao, descricao,
+                        content='concursos', content_rowid='id',
+                        tokenize='unicode61 remove_diacritics 2'
+                    )
+                ''')
+                conn.execute('''
+                    CREATE TRIGGER IF NOT EXISTS concursos_fts_insert AFTER INSERT ON concursos BEGIN
+                        INSERT INTO concursos_fts (rowid, titulo, organizacao, descricao)
+                        VALUES (new.id, new.titulo, new.organizacao, new.descricao);
+                    END
+                ''')
+                conn.execute('''
+                    CREATE TRIGGER IF NOT EXISTS concursos_fts_delete AFTER DELETE ON concursos BEGIN
+                        INSERT INTO concursos_fts (concursos_fts, rowid, titulo, organizacao, descricao)
+                        VALUES ('delete', old.id, old.titulo, old.organizacao, old.descricao);
+                    END
+                ''')
+                conn.execute('''
+                    CREATE TRIGGER IF NOT EXISTS concursos_fts_update
+                    AFTER UPDATE OF titulo, organizacao, descricao ON concursos BEGIN
+                        INSERT INTO concursos_fts (concursos_fts, rowid, titulo, organizacao, descricao)
+                        VALUES ('delete', old.id, old.titulo, old.organizacao, old.descricao);
+                        INSERT INTO concursos_fts (rowid, titulo, organizacao, descricao)
+                        VALUES (new.id, new.titulo, new.organizacao, new.descricao);
+                    END
+                ''')
+                if not existia:
+                    # Indexar as linhas que já estavam no banco
+                    conn.execute("INSERT INTO concursos_fts (concursos_fts) VALUES ('rebuild')")
+            return True
+        except sqlite3.OperationalError as e:
+            print(f"FTS5 indisponível, busca usará LIKE: {e}")
+            return False
+    
+    @staticmethod
+    def consulta_fts(termo: str) -> str:
+        """Converter o termo digitado numa consulta FTS5 (todas as palavras, por prefixo)"""
+        palavras = re.findall(r'\w+', termo)
+        return ' '.join(f'"{palavra}"*' for palavra in palavras)
+    
+    # Campos que, ao mudar, contam como atualização do concurso
+    CAMPOS_COMPARADOS = (
+        'estado', 'escolaridade', 'vagas', 'salario', 'banca',
+        'status', 'link_edital', 'descricao',
+        'salario_min', 'salario_max', 'escolaridade_min', 'escolaridade_max'
+    )
+    
+    COLUNAS_UPSERT = (
+        'titulo', 'organizacao', 'estado', 'escolaridade', 'vagas', 'salario',
+        'banca', 'fonte', 'status', 'data_publicacao', 'link_edital', 'descricao',
+        'salario_min', 'salario_max', 'escolaridade_min', 'escolaridade_max'
+    )
+    
+    SQL_UPSERT = '''
+        INSERT INTO concursos
+        (titulo, organizacao, estado, escolaridade, vagas, salario, banca, fonte,
+         status, data_publicacao, link_edital, descricao,
+         salario_min, salario_max, escolaridade_min, escolaridade_max, hash_conteudo, data_atualizacao)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+        ON CONFLICT(titulo, organizacao, fonte) DO UPDATE SET
+            {atribuicoes},
+            hash_conteudo = excluded.hash_conteudo,
+            data_publicacao = COALESCE(concursos.data_publicacao, excluded.data_publicacao),
+            agrupamento_pendente = 1,
+            data_atualizacao = CURRENT_TIMESTAMP
+        WHERE concursos.hash_conteudo IS NOT excluded.hash_conteudo
+    '''.format(
+        atribuicoes=',\n            '.join(f"{c} = excluded.{c}" for c in CAMPOS_COMPARADOS),
+    )
+    
+    @classmethod
+    def _parametros_concurso(cls, concurso: Dict) -> tuple:
+        """Montar os parâmetros do upsert (com o hash dos campos comparados)"""
+        parametros = (
+            concurso.get('titulo'),
+            concurso.get('organizacao'),
+            concurso.get('estado'),
+            concurso.get('escolaridade'),
+            concurso.get('vagas', 0),
+            concurso.get('salario'),
+            concurso.get('banca'),
+            concurso.get('fonte'),
+            concurso.get('status', 'open'),
+            concurso.get('data_publicacao'),
+            concurso.get('link_edital'),
+            concurso.get('descricao'),
+            concurso.get('salario_min'),
+            concurso.get('salario_max'),
+            concurso.get('escolaridade_min'),
+            concurso.get('escolaridade_max')
+        )
+        valores = dict(zip(cls.COLUNAS_UPSERT, parametros))
+        conteudo = json.dumps([valores[c] for c in cls.CAMPOS_COMPARADOS], default=str)
+        return parametros + (hashlib.sha1(conteudo.encode()).hexdigest(),)
     
     def inserir_concurso(self, concurso: Dict) -> bool:
         """Inserir ou atualizar concurso"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                INSERT OR REPLACE INTO concursos 
-                (titulo, organizacao, estado, escolaridade, vagas, salario, 
-                 banca, fonte, status, data_publicacao, link_edital, descricao, data_atualizacao)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-            ''', (
-                concurso.get('titulo'),
-                concurso.get('organizacao'),
-                concurso.get('estado'),
-                concurso.get('escolaridade'),
-                concurso.get('vagas', 0),
-                concurso.get('salario'),
-                concurso.get('banca'),
-                concurso.get('fonte'),
-                concurso.get('status', 'open'),
-                concurso.get('data_publicacao'),
-                concurso.get('link_edital'),
-                concurso.get('descricao')
-            ))
-            
-            conn.commit()
-            conn.close()
+            self.inserir_concursos([concurso])
             return True
         except Exception as e:
             print(f"Erro ao inserir concurso: {e}")
             return False
     
+    def inserir_concursos(self, concursos: List[Dict]) -> Dict[str, Dict[str, int]]:
+        """Inserir ou atualizar concursos em lote, numa única transação
+        
+        O upsert mantém o id e a data de publicação das linhas existentes e só
+        as reescreve quando o hash do conteúdo mudou. Retorna, por fonte,
+        as contagens total/novos/atualizados/inalterados.
+        """
+        with self.conexao() as conn:
+            return self._upsert(conn, concursos)
+    
+    def sincronizar_concursos(self, concursos: List[Dict], lidas: Dict[str, str] = None) -> Dict[str, Dict[str, int]]:
+        """Gravar o resultado de uma sincronização, encerrando os concursos que sumiram
+        
+        'lidas' mapeia cada página lida nesta execução ({url: fonte}) e vale
+        também para as que não trouxeram nenhum concurso; sem ele, contam as
+        páginas (link_edital) dos concursos recebidos. Cada concurso pode
+        informar em 'paginas' todas as páginas em que apareceu. Além do upsert
+        de inserir_concursos, a lista de concursos de cada página lida é
+        substituída, e os concursos abertos que ela listava e que nenhuma
+        página lista mais passam a 'closed'; páginas não modificadas mantêm a
+        lista anterior e por isso não encerram nada. O link_edital gravado é
+        mantido enquanto a página dele ainda listar o concurso. As contagens
+        ganham 'removidos'.
+        """
+        if lidas is None:
+            lidas = {c.get('link_edital'): c.get('fonte') for c in concursos}
+        with self.conexao() as conn:
+            self._manter_links(conn, concursos, lidas)
+            contagens = self._upsert(conn, concursos)
+            for fonte, removidos in self._encerrar_ausentes(conn, concursos, lidas).items():
+                LINHAS_FONTE.incrementar(removidos, fonte=fonte, resultado='encerrados')
+                contagens.setdefault(fonte, {'total': 0, 'novos': 0, 'atualizados': 0, 'inalterados': 0})
+                contagens[fonte]['removidos'] = removidos
+            for c in contagens.values():
+                c.setdefault('removidos', 0)
+        return contagens
+    
+    def _manter_links(self, conn: sqlite3.Connection, concursos: List[Dict], lidas: Dict[str, str]):
+        """Manter o link_edital já gravado se a página dele ainda lista o concurso
+        
+        Sem isso, um concurso listado em várias páginas trocaria de link (e
+        contaria como atualizado) conforme a página que foi lida nesta execução.
+        """
+        for concurso in concursos:
+            row = conn.execute('''
+                SELECT c.link_edital, EXISTS(
+                    SELECT 1 FROM paginas_concursos p WHERE p.url = c.link_edital AND p.concurso_id = c.id
+                ) FROM concursos c
+                WHERE c.titulo = ? AND c.organizacao = ? AND c.fonte IS ?
+            ''', (concurso.get('titulo'), concurso.get('organizacao'), concurso.get('fonte'))).fetchone()
+            if row is None or row[0] == concurso.get('link_edital'):
+                continue
+            link, listado = row
+            # Lida agora: vale a lista desta execução; não modificada: a lista gravada
+            if link in (concurso.get('paginas') or []) or (link not in lidas and listado):
+                concurso['link_edital'] = link
+    
+    def _upsert(self, conn: sqlite3.Connection, concursos: List[Dict]) -> Dict[str, Dict[str, int]]:
+        """Executar o upsert em lote, agrupado por fonte para contar (e medir) o resultado"""
+        por_fonte = {}
+        for concurso in concursos:
+            por_fonte.setdefault(concurso.get('fonte'), []).append(self._parametros_concurso(concurso))
+        
+        contagens = {}
+        for fonte, parametros in por_fonte.items():
+            with GRAVACAO_FONTE.medir(fonte=fonte):
+                ultimo_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM concursos").fetchone()[0]
+                # rowcount soma as linhas gravadas pelo próprio upsert (sem os triggers do FTS)
+                alteracoes = conn.executemany(self.SQL_UPSERT, parametros).rowcount
+                novos = conn.execute("SELECT COUNT(*) FROM concursos WHERE id > ?", (ultimo_id,)).fetchone()[0]
+            contagens[fonte] = {
+                'total': len(parametros),
+                'novos': novos,
+                'atualizados': alteracoes - novos,
+                'inalterados': len(parametros) - alteracoes,
+            }
+            for resultado in ('novos', 'atualizados', 'inalterados'):
+                LINHAS_FONTE.incrementar(contagens[fonte][resultado], fonte=fonte, resultado=resultado)
+        return contagens
+    
+    def _encerrar_ausentes(self, conn: sqlite3.Connection, concursos: List[Dict], lidas: Dict[str, str]) -> Dict[str, int]:
+        """Renovar os concursos de cada página lida e marcar como 'closed' os que nenhuma página lista mais"""
+        antes = {}
+        for url, fonte in lidas.items():
+            antes.update(conn.execute('''
+                SELECT c.id, c.fonte FROM paginas_concursos p JOIN concursos c ON c.id = p.concurso_id
+                WHERE p.url = ? AND c.fonte IS ? AND c.status IS NOT 'closed'
+            ''', (url, fonte)).fetchall())
+            conn.execute('''
+                DELETE FROM paginas_concursos
+                WHERE url = ? AND concurso_id IN (SELECT id FROM concursos WHERE fonte IS ?)
+            ''', (url, fonte))
+        
+        listados = []
+        for concurso in concursos:
+            row = conn.execute(
+                "SELECT id FROM concursos WHERE titulo = ? AND organizacao = ? AND fonte IS ?",
+                (concurso.get('titulo'), concurso.get('organizacao'), concurso.get('fonte'))
+            ).fetchone()
+            if row is None:
+                continue
+            for url in concurso.get('paginas') or [concurso.get('link_edital')]:
+                if url in lidas:
+                    listados.append((url, row[0]))
+        conn.executemany("INSERT OR IGNORE INTO paginas_concursos (url, concurso_id) VALUES (?, ?)", listados)
+        
+        # Ausentes: listados antes por uma página lida e agora por nenhuma (nem pelas não modificadas)
+        ausentes = [
+            (id_, fonte) for id_, fonte in antes.items()
+            if conn.execute("SELECT 1 FROM paginas_concursos WHERE concurso_id = ?", (id_,)).fetchone() is None
+        ]
+        conn.executemany('''
+            UPDATE concursos
+            SET status = 'closed', hash_conteudo = NULL, agrupamento_pendente = 1,
+                data_atualizacao = CURRENT_TIMESTAMP
+            WHERE id = ?
+        ''', [(id_,) for id_, _ in ausentes])
+        removidos = dict.fromkeys(lidas.values(), 0)
+        for _, fonte in ausentes:
+            removidos[fonte] += 1
+        return removidos
+    
+    CAMPOS_CONCURSO = (
+        'id', 'titulo', 'organizacao', 'estado', 'escolaridade', 'vagas', 'salario',
+        'banca', 'fonte', 'status', 'data_publicacao', 'link_edital', 'descricao',
+        'data_criacao', 'data_atualizacao', 'canonico_id',
+        'salario_min', 'salario_max', 'escolaridade_min', 'escolaridade_max'
+    )
+    
+    CAMPOS_ATUALIZACAO = ('id', 'fonte', 'total_concursos', 'novos', 'atualizados', 'removidos', 'data_atualizacao')
+    
+    # Campos calculados, aceitos em 'campos' além das colunas
+    CAMPOS_VIRTUAIS = ('fontes_relacionadas',)
+    
+    # Valores de 'ordem' e a coluna ordenada (decrescente; linhas sem valor vêm no fim)
+    ORDENACOES = {'data': 'c.data_publicacao', 'salario': 'c.salario_max', 'vagas': 'c.vagas'}
+    
+    # Status de execução de fonte que não contam como sincronizada (ver obter_execucoes_fontes)
+    STATUS_FALHA = ('erro', 'prazo_excedido')
+    
+    @staticmethod
+    def filtro_canonico(prefixo: str = '') -> str:
+        """Condição dos concursos que representam o seu grupo de duplicatas (a mesma do índice parcial)"""
+        return f"({prefixo}canonico_id IS NULL OR {prefixo}canonico_id = {prefixo}id)"
+    
+    @staticmethod
+    def codificar_cursor(chave: list) -> str:
+        """Codificar a chave de ordenação da última linha num cursor opaco"""
+        return base64.urlsafe_b64encode(json.dumps(chave).encode()).decode().rstrip('=')
+    
+    @staticmethod
+    def decodificar_cursor(cursor: str) -> list:
+        """Decodificar um cursor gerado por codificar_cursor (ValueError se inválido)"""
+        try:
+            chave = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+        except Exception:
+            raise ValueError('cursor inválido')
+        # A chave de ordem vai direto para o SQLite: só escalares (lista ou objeto seria ProgrammingError)
+        if (not isinstance(chave, list) or len(chave) != 2 or not isinstance(chave[1], int)
+                or not (chave[0] is None or isinstance(chave[0], (str, int, float)))):
+            raise ValueError('cursor inválido')
+        return chave
+    
     def obter_concursos(self, filtros: Dict = None) -> List[Dict]:
-        """Obter concursos com filtros opcionais"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        """Obter concursos com filtros opcionais
+        
+        Com 'busca', os resultados vêm do índice FTS5, ordenados por relevância.
+        """
+        concursos, _ = self.obter_pagina_concursos(filtros, limite=1000)
+        return concursos
+    
+    def obter_pagina_concursos(self, filtros: Dict = None, limite: int = 100, cursor: str = None,
+                               campos: List[str] = None) -> Tuple[List[Dict], str]:
+        """Obter uma página de concursos com paginação por cursor (keyset)
+        
+        A ordem é (data_publicacao DESC, id DESC), ou (relevância, id) quando há
+        'busca' no FTS5; 'ordem' troca a data por salario (salario_max) ou vagas. 'campos' restringe as colunas retornadas ('id' sempre
+        vem). Só os registros canônicos de cada grupo de duplicatas são
+        retornados, a menos que haja 'incluir_duplicados' ou filtro por 'fonte'.
+        Retorna os concursos e o cursor da próxima página (None no fim).
+        """
+        consulta = self._consulta_concursos(filtros, campos)
+        
+        def consultar(extras: List[str], extras_params: list, n: int) -> List[Dict]:
+            sql, params = self._sql_concursos(consulta, extras, com_chave=True)
+            sql += " LIMIT ?"
+            return [dict(row) for row in self.conexao().execute(sql, params + extras_params + [n])]
+        
+        valor, ultimo_id = self.decodificar_cursor(cursor) if cursor else (None, None)
+        if consulta['por_relevancia']:
+            extras, extras_params = [], []
+            if cursor:
+                extras.append("(concursos_fts.rank > ? OR (concursos_fts.rank = ? AND c.id > ?))")
+                extras_params.extend([valor, valor, ultimo_id])
+            concursos = consultar(extras, extras_params, limite + 1)
+        else:
+            # Comparação por row value para o SQLite buscar direto no índice;
+            # linhas sem valor na chave vêm depois, numa segunda consulta ordenada por id
+            chave = consulta['chave_ordem']
+            concursos = []
+            if not cursor or valor is not None:
+                extras, extras_params = [f"{chave} IS NOT NULL"], []
+                if cursor:
+                    extras.append(f"({chave}, c.id) < (?, ?)")
+                    extras_params.extend([valor, ultimo_id])
+                concursos = consultar(extras, extras_params, limite + 1)
+            if len(concursos) <= limite:
+                extras, extras_params = [f"{chave} IS NULL"], []
+                if cursor and valor is None:
+                    extras.append("c.id < ?")
+                    extras_params.append(ultimo_id)
+                concursos += consultar(extras, extras_params, limite + 1 - len(concursos))
         
-        query = "SELECT * FROM concursos WHERE 1=1"
+        proximo_cursor = None
+        if len(concursos) > limite:
+            concursos = concursos[:limite]
+            ultimo = concursos[-1]
+            proximo_cursor = self.codificar_cursor([ultimo['_chave_cursor'], ultimo['id']])
+        for concurso in concursos:
+            del concurso['_chave_cursor']
+        if 'fontes_relacionadas' in consulta['campos']:
+            self._anexar_fontes_relacionadas(concursos)
+        
+        return concursos, proximo_cursor
+    
+    def iterar_concursos(self, filtros: Dict = None, campos: List[str] = None, lote: int = 500) -> Iterator[Dict]:
+        """Percorrer todos os concursos dos filtros direto do cursor do SQLite, sem paginação
+        
+        Mesmos filtros, campos e ordem de obter_pagina_concursos. As linhas são
+        lidas em lotes (fetchmany), então a memória fica limitada a um lote e o
+        primeiro concurso sai antes de a consulta terminar. Filtros inválidos
+        levantam ValueError já na chamada, antes de a primeira linha ser lida.
+        """
+        consulta = self._consulta_concursos(filtros, campos)
+        return self._iterar_consulta(consulta, lote)
+    
+    def _iterar_consulta(self, consulta: Dict, lote: int) -> Iterator[Dict]:
+        """Ler as linhas da consulta em lotes, os concursos sem valor na chave de ordem por último
+        
+        Usa uma conexão própria do pool, devolvida quando a iteração termina:
+        respostas em fluxo são lidas depois do fim da requisição.
+        """
+        if consulta['por_relevancia']:
+            partes = [[]]
+        else:
+            chave = consulta['chave_ordem']
+            partes = [[f"{chave} IS NOT NULL"], [f"{chave} IS NULL"]]
+        conn = self._emprestar()
+        try:
+            for extras in partes:
+                sql, params = self._sql_concursos(consulta, extras)
+                cursor = conn.execute(sql, params)
+                try:
+                    while True:
+                        linhas = [dict(row) for row in cursor.fetchmany(lote)]
+                        if not linhas:
+                            break
+                        if 'fontes_relacionadas' in consulta['campos']:
+                            self._anexar_fontes_relacionadas(linhas, conn)
+                        yield from linhas
+                finally:
+                    cursor.close()
+        finally:
+            self._devolver(conn)
+    
+    def _consulta_concursos(self, filtros: Dict = None, campos: List[str] = None) -> Dict:
+        """Montar colunas, junções, condições e ordem da listagem de concursos
+        
+        Além de estado, status, fonte e busca, filtra pelos campos do
+        enriquecimento: banca, escolaridade (nível dentro da faixa do concurso),
+        salario_min (paga ao menos), salario_max (começa até) e vagas_min.
+        Levanta ValueError para filtros ou ordem inválidos.
+        """
+        campos = self.CAMPOS_CONCURSO + self.CAMPOS_VIRTUAIS if not campos else list(dict.fromkeys(['id'] + list(campos)))
+        colunas = [f"c.{c}" for c in campos if c not in self.CAMPOS_VIRTUAIS]
+        query = "FROM concursos c"
+        condicoes = []
         params = []
+        filtros = filtros or {}
+        
+        if not filtros.get('incluir_duplicados') and not filtros.get('fonte'):
+            condicoes.append(self.filtro_canonico('c.'))
+        ordenacao = filtros.get('ordem')
+        if ordenacao and ordenacao not in self.ORDENACOES:
+            raise ValueError(f"ordem inválida: {ordenacao} (use {', '.join(self.ORDENACOES)})")
+        chave_ordem = self.ORDENACOES[ordenacao or 'data']
+        ordem = f"{chave_ordem} DESC, c.id DESC"
+        por_relevancia = False
         
         if filtros:
             if filtros.get('estado'):
-                query += " AND estado = ?"
+                condicoes.append("c.estado = ?")
                 params.append(filtros['estado'])
             
             if filtros.get('status'):
-                query += " AND status = ?"
+                condicoes.append("c.status = ?")
                 params.append(filtros['status'])
             
             if filtros.get('fonte'):
-                query += " AND fonte = ?"
+                condicoes.append("c.fonte = ?")
                 params.append(filtros['fonte'])
             
+            if filtros.get('banca'):
+                condicoes.append("c.banca = ?")
+                params.append(banca_canonica(filtros['banca']))
+            
+            if filtros.get('escolaridade'):
+                nivel = nivel_escolaridade(filtros['escolaridade'])
+                if nivel is None:
+                    raise ValueError("escolaridade inválida (use fundamental, medio, tecnico ou superior)")
+                condicoes.append("c.escolaridade_min <= ? AND c.escolaridade_max >= ?")
+                params.extend([nivel, nivel])
+            
+            if filtros.get('salario_min'):
+                condicoes.append("c.salario_max >= ?")
+                params.append(self._filtro_numerico(filtros, 'salario_min', float))
+            
+            if filtros.get('salario_max'):
+                condicoes.append("COALESCE(c.salario_min, c.salario_max) <= ?")
+                params.append(self._filtro_numerico(filtros, 'salario_max', float))
+            
+            if filtros.get('vagas_min'):
+                condicoes.append("c.vagas >= ?")
+                params.append(self._filtro_numerico(filtros, 'vagas_min', int))
+            
             if filtros.get('busca'):
-                query += " AND (titulo LIKE ? OR organizacao LIKE ? OR descricao LIKE ?)"
-                termo = f"%{filtros['busca']}%"
-                params.extend([termo, termo, termo])
-        
-        query += " ORDER BY data_publicacao DESC LIMIT 1000"
-        
-        cursor.execute(query, params)
-        concursos = [dict(row) for row in cursor.fetchall()]
-        conn.close()
+                consulta = self.consulta_fts(filtros['busca'])
+                if self.fts_disponivel and consulta:
+                    query += " JOIN concursos_fts ON concursos_fts.rowid = c.id"
+                    condicoes.append("concursos_fts MATCH ?")
+                    params.append(consulta)
+                    # Sem 'ordem' explícita, os resultados vêm por relevância
+                    if not ordenacao:
+                        chave_ordem = "concursos_fts.rank"
+                        ordem = "concursos_fts.rank, c.id"
+                        por_relevancia = True
+                else:
+                    condicoes.append("(c.titulo LIKE ? OR c.organizacao LIKE ? OR c.descricao LIKE ?)")
+                    termo = f"%{filtros['busca']}%"
+                    params.extend([termo, termo, termo])
         
-        return concursos
+        return {'campos': campos, 'colunas': colunas, 'query': query, 'condicoes': condicoes, 'params': params,
+                'chave_ordem': chave_ordem, 'ordem': ordem, 'por_relevancia': por_relevancia}
+    
+    @staticmethod
+    def _filtro_numerico(filtros: Dict, nome: str, tipo=float):
+        """Converter um filtro numérico da query string (ValueError com o nome do filtro)"""
+        try:
+            return tipo(filtros[nome])
+        except (TypeError, ValueError):
+            raise ValueError(f"{nome} deve ser numérico")
+    
+    @staticmethod
+    def _sql_concursos(consulta: Dict, extras: List[str], com_chave: bool = False) -> Tuple[str, list]:
+        """SQL ordenado da consulta com condições extras ('_chave_cursor' opcional)"""
+        colunas = consulta['colunas'] + ([f"{consulta['chave_ordem']} AS _chave_cursor"] if com_chave else [])
+        todas = consulta['condicoes'] + extras
+        sql = f"SELECT {', '.join(colunas)} {consulta['query']}"
+        if todas:
+            sql += " WHERE " + " AND ".join(todas)
+        sql += f" ORDER BY {consulta['ordem']}"
+        return sql, list(consulta['params'])
+    
+    def _anexar_fontes_relacionadas(self, concursos: List[Dict], conn: sqlite3.Connection = None):
+        """Preencher 'fontes_relacionadas' com os outros registros do grupo de cada concurso"""
+        if not concursos:
+            return
+        ids = [c['id'] for c in concursos]
+        marcadores = ', '.join('?' * len(ids))
+        conn = conn or self.conexao()
+        grupos = {
+            row['id']: row['canonico_id'] or row['id']
+            for row in conn.execute(f"SELECT id, canonico_id FROM concursos WHERE id IN ({marcadores})", ids)
+        }
+        relacionados = {}
+        chaves = list(set(grupos.values()))
+        marcadores = ', '.join('?' * len(chaves))
+        for row in conn.execute(f'''
+            SELECT id, canonico_id, fonte, link_edital FROM concursos
+            WHERE canonico_id IN ({marcadores}) ORDER BY id
+        ''', chaves):
+            relacionados.setdefault(row['canonico_id'], []).append(
+                {'id': row['id'], 'fonte': row['fonte'], 'link_edital': row['link_edital']}
+            )
+        for concurso in concursos:
+            grupo = relacionados.get(grupos.get(concurso['id']), [])
+            concurso['fontes_relacionadas'] = [r for r in grupo if r['id'] != concurso['id']]
+    
+    def obter_concurso_por_id(self, concurso_id: int) -> Dict:
+        """Obter um concurso pela chave primária, com as fontes relacionadas"""
+        row = self.conexao().execute(
+            f"SELECT {', '.join(self.CAMPOS_CONCURSO)} FROM concursos WHERE id = ?", (concurso_id,)
+        ).fetchone()
+        if not row:
+            return None
+        concurso = dict(row)
+        self._anexar_fontes_relacionadas([concurso])
+        return concurso
+    
+    def obter_concursos_por_ids(self, ids: List[int]) -> List[Dict]:
+        """Obter vários concursos pela chave primária, na ordem dos ids informados"""
+        encontrados = {}
+        ids = list(dict.fromkeys(ids))
+        conn = self.conexao()
+        # Respeitar o limite de parâmetros por consulta do SQLite
+        for i in range(0, len(ids), 500):
+            lote = ids[i:i + 500]
+            marcadores = ', '.join('?' * len(lote))
+            sql = f"SELECT {', '.join(self.CAMPOS_CONCURSO)} FROM concursos WHERE id IN ({marcadores})"
+            for row in conn.execute(sql, lote):
+                encontrados[row['id']] = dict(row)
+        return [encontrados[i] for i in ids if i in encontrados]
     
     def contar_concursos(self) -> int:
         """Contar total de concursos"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM concursos")
-        count = cursor.fetchone()[0]
-        conn.close()
-        return count
+        return self.conexao().execute("SELECT COUNT(*) FROM concursos").fetchone()[0]
+    
+    def atualizar_estatisticas(self):
+        """Recalcular a tabela de estatísticas com GROUP BY sobre os concursos
+        
+        Totais e estados contam só os registros canônicos (cada concurso uma
+        vez); a contagem por fonte inclui as duplicatas que cada fonte lista.
+        """
+        with self.conexao() as conn:
+            conn.execute("DELETE FROM estatisticas")
+            conn.execute(f'''
+                INSERT INTO estatisticas (tipo, chave, valor)
+                SELECT 'geral', 'total_concursos', COUNT(*) FROM concursos WHERE {self.filtro_canonico()}
+                UNION ALL
+                SELECT 'geral', 'total_vagas', COALESCE(SUM(vagas), 0) FROM concursos WHERE {self.filtro_canonico()}
+            ''')
+            conn.execute(f'''
+                INSERT INTO estatisticas (tipo, chave, valor)
+                SELECT 'estado', COALESCE(estado, 'BR'), COUNT(*) FROM concursos
+                WHERE {self.filtro_canonico()} GROUP BY 2
+            ''')
+            conn.execute('''
+                INSERT INTO estatisticas (tipo, chave, valor)
+                SELECT 'fonte', COALESCE(fonte, 'unknown'), COUNT(*) FROM concursos GROUP BY 2
+            ''')
+    
+    # Colunas lidas para o agrupamento de duplicatas (título, UF e campos de completude)
+    CAMPOS_AGRUPAMENTO = ('id', 'titulo', 'titulo_normalizado', 'estado', 'status', 'escolaridade', 'salario',
+                          'banca', 'link_edital', 'descricao', 'canonico_id')
+    
+    def agrupar_duplicatas(self, lote: int = 500) -> int:
+        """Agrupar os concursos novos ou alterados com os quase duplicados já gravados
+        
+        Só as linhas com agrupamento_pendente (inseridas, alteradas ou
+        encerradas desde o último agrupamento) são comparadas, e só com os
+        membros dos seus baldes LSH, lidos de lsh_bandas (a assinatura MinHash
+        deles não é recalculada e o título normalizado vem gravado); os grupos
+        envolvidos são carregados inteiros para reescolher o canônico. Linhas
+        cujo grupo mudou têm data_atualizacao renovada (o ETag do detalhe muda
+        junto).
+        Retorna quantos concursos são duplicatas.
+        """
+        conn = self.conexao()
+        pendentes = {
+            row['id']: normalizar_titulo(row['titulo'])
+            for row in conn.execute("SELECT id, titulo FROM concursos WHERE agrupamento_pendente = 1")
+        }
+        if pendentes:
+            bandas = {i: chaves_conjunto(shingles(texto)) for i, texto in pendentes.items()}
+            # Membros já gravados dos baldes dos pendentes e, depois, os grupos de todos eles
+            baldes, vizinhos = {}, set(pendentes)
+            chaves = sorted({chave for chaves in bandas.values() for chave in chaves})
+            for parte in self._em_partes(chaves, lote):
+                for chave, concurso_id in conn.execute(
+                    f"SELECT chave, concurso_id FROM lsh_bandas WHERE chave IN ({', '.join('?' * len(parte))})", parte
+                ):
+                    baldes.setdefault(chave, []).append(concurso_id)
+                    vizinhos.add(concurso_id)
+            grupos = set()
+            for parte in self._em_partes(sorted(vizinhos), lote):
+                grupos.update(row[0] for row in conn.execute(
+                    f"SELECT COALESCE(canonico_id, id) FROM concursos WHERE id IN ({', '.join('?' * len(parte))})", parte
+                ))
+            registros = {}
+            for parte in self._em_partes(sorted(grupos), lote):
+                marcadores = ', '.join('?' * len(parte))
+                for row in conn.execute(
+                    f"SELECT {', '.join(self.CAMPOS_AGRUPAMENTO)} FROM concursos "
+                    f"WHERE id IN ({marcadores}) OR canonico_id IN ({marcadores})", parte + parte
+                ):
+                    registros[row['id']] = dict(row)
+            for i, texto in pendentes.items():
+                registros[i]['titulo_normalizado'] = texto
+            canonicos = agrupar(list(registros.values()), set(pendentes), baldes, bandas)
+            
+            anteriores = {i: r['canonico_id'] for i, r in registros.items()}
+            grupos_alterados = set()
+            for i, canonico in canonicos.items():
+                if anteriores[i] != canonico:
+                    grupos_alterados.add(canonico)
+                    if anteriores[i] is not None:
+                        grupos_alterados.add(anteriores[i])
+            alterados = [
+                (canonicos[i], i) for i in canonicos
+                if canonicos[i] in grupos_alterados or anteriores[i] in grupos_alterados
+            ]
+            with conn:
+                conn.executemany(
+                    "UPDATE concursos SET canonico_id = ?, data_atualizacao = CURRENT_TIMESTAMP WHERE id = ?",
+                    alterados
+                )
+                # Título alterado troca de baldes: as chaves antigas saem
+                conn.executemany("DELETE FROM lsh_bandas WHERE concurso_id = ?", [(i,) for i in pendentes])
+                conn.executemany(
+                    "INSERT OR IGNORE INTO lsh_bandas (chave, concurso_id) VALUES (?, ?)",
+                    [(chave, i) for i, chaves in bandas.items() for chave in chaves]
+                )
+                conn.executemany("UPDATE concursos SET agrupamento_pendente = 0, titulo_normalizado = ? WHERE id = ?",
+                                 [(texto, i) for i, texto in pendentes.items()])
+        return conn.execute(
+            "SELECT COUNT(*) FROM concursos WHERE canonico_id IS NOT NULL AND canonico_id != id"
+        ).fetchone()[0]
+    
+    @staticmethod
+    def _em_partes(valores: list, tamanho: int) -> Iterator[list]:
+        """Fatiar uma lista de parâmetros para ficar abaixo do limite de variáveis do SQLite"""
+        for inicio in range(0, len(valores), tamanho):
+            yield valores[inicio:inicio + tamanho]
+    
+    def obter_estatisticas(self) -> Dict:
+        """Ler as estatísticas pré-calculadas (calcula na primeira chamada, se preciso)"""
+        rows = self.conexao().execute("SELECT tipo, chave, valor FROM estatisticas").fetchall()
+        if not rows:
+            self.atualizar_estatisticas()
+            rows = self.conexao().execute("SELECT tipo, chave, valor FROM estatisticas").fetchall()
+        
+        estatisticas = {'total_concursos': 0, 'total_vagas': 0, 'estados': {}, 'fontes': {}}
+        for tipo, chave, valor in rows:
+            if tipo == 'geral':
+                estatisticas[chave] = valor
+            elif tipo == 'estado':
+                estatisticas['estados'][chave] = valor
+            elif tipo == 'fonte':
+                estatisticas['fontes'][chave] = valor
+        return estatisticas
     
     def limpar_concursos(self):
         """Limpar banco antes de atualizar"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM concursos")
-        conn.commit()
-        conn.close()
+        with self.conexao() as conn:
+            conn.execute("DELETE FROM concursos")
+            conn.execute("DELETE FROM lsh_bandas")
+            conn.execute("DELETE FROM paginas_concursos")
     
-    def registrar_atualizacao(self, fonte: str, total: int, novos: int, atualizados: int):
+    def registrar_atualizacao(self, fonte: str, total: int, novos: int, atualizados: int, removidos: int = 0):
         """Registrar log de atualização"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('''
-            INSERT INTO atualizacoes (fonte, total_concursos, novos, atualizados)
-            VALUES (?, ?, ?, ?)
-        ''', (fonte, total, novos, atualizados))
-        conn.commit()
-        conn.close()
+        with self.conexao() as conn:
+            conn.execute('''
+                INSERT INTO atualizacoes (fonte, total_concursos, novos, atualizados, removidos)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (fonte, total, novos, atualizados, removidos))
+    
+    def iterar_atualizacoes(self, fonte: str = None, lote: int = 500) -> Iterator[Dict]:
+        """Percorrer o histórico de atualizações (mais recentes primeiro), lido em lotes
+        
+        Como _iterar_consulta, usa uma conexão própria do pool, devolvida
+        quando a iteração termina.
+        """
+        sql = f"SELECT {', '.join(self.CAMPOS_ATUALIZACAO)} FROM atualizacoes"
+        params = []
+        if fonte:
+            sql += " WHERE fonte = ?"
+            params.append(fonte)
+        conn = self._emprestar()
+        try:
+            cursor = conn.execute(sql + " ORDER BY id DESC", params)
+            try:
+                while True:
+                    linhas = cursor.fetchmany(lote)
+                    if not linhas:
+                        break
+                    yield from (dict(row) for row in linhas)
+            finally:
+                cursor.close()
+        finally:
+            self._devolver(conn)
+    
+    def obter_ultima_atualizacao(self) -> datetime:
+        """Data (UTC) do último registro em atualizacoes, ou None se nunca sincronizou"""
+        ultima = self.conexao().execute("SELECT MAX(data_atualizacao) FROM atualizacoes").fetchone()[0]
+        if not ultima:
+            return None
+        return datetime.strptime(ultima, '%Y-%m-%d %H:%M:%S').replace(tzinfo=timezone.utc)
+    
+    def registrar_execucoes_fontes(self, execucoes: Dict[str, str]):
+        """Guardar o status e o horário da última execução de cada fonte ({nome: status})"""
+        with self.conexao() as conn:
+            conn.executemany('''
+                INSERT INTO execucoes_fontes (fonte, status, data_execucao)
+                VALUES (?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(fonte) DO UPDATE SET
+                    status = excluded.status,
+                    data_execucao = CURRENT_TIMESTAMP
+            ''', list(execucoes.items()))
+    
+    def obter_execucoes_fontes(self) -> Dict[str, datetime]:
+        """Horário (UTC) da última execução de cada fonte
+        
+        None para as fontes cuja última execução terminou em 'erro' ou
+        'prazo_excedido': elas ficam vencidas e são tentadas de novo na
+        próxima verificação, sem esperar o intervalo_horas.
+        """
+        return {
+            row['fonte']: None if row['status'] in self.STATUS_FALHA else
+            datetime.strptime(row['data_execucao'], '%Y-%m-%d %H:%M:%S').replace(tzinfo=timezone.utc)
+            for row in self.conexao().execute("SELECT fonte, status, data_execucao FROM execucoes_fontes")
+        }
+    
+    def obter_pagina(self, url: str) -> Dict:
+        """Obter o hash, os validadores HTTP e os links da última visita à página"""
+        row = self.conexao().execute(
+            "SELECT hash_conteudo, etag, last_modified, links FROM paginas WHERE url = ?", (url,)
+        ).fetchone()
+        if not row:
+            return None
+        pagina = dict(row)
+        pagina['links'] = json.loads(pagina['links']) if pagina['links'] else []
+        return pagina
+    
+    def salvar_pagina(self, url: str, hash_conteudo: str, etag: str = None, last_modified: str = None):
+        """Guardar o hash e os validadores HTTP da página visitada"""
+        with self.conexao() as conn:
+            conn.execute('''
+                INSERT INTO paginas (url, hash_conteudo, etag, last_modified, data_verificacao)
+                VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(url) DO UPDATE SET
+                    hash_conteudo = excluded.hash_conteudo,
+                    etag = excluded.etag,
+                    last_modified = excluded.last_modified,
+                    data_verificacao = CURRENT_TIMESTAMP
+            ''', (url, hash_conteudo, etag, last_modified))
+    
+    def salvar_links_pagina(self, url: str, links: List[str]):
+        """Guardar os links a seguir encontrados na página (reusados quando ela não muda)"""
+        with self.conexao() as conn:
+            conn.execute("UPDATE paginas SET links = ? WHERE url = ?", (json.dumps(links), url))
+    
+    def limpar_paginas(self):
+        """Esquecer o estado das páginas, forçando a próxima sincronização completa"""
+        with self.conexao() as conn:
+            conn.execute("DELETE FROM paginas")
@@ -0,0 +1,216 @@
+import hashlib
+import random
+import re
+import unicodedata
+import zlib
+from typing import Dict, List, Set
+
+# Siglas das UFs, removidas dos títulos: a UF vem no campo 'estado'
+UFS = frozenset((
+    'ac', 'al', 'ap', 'am', 'ba', 'ce', 'df', 'es', 'go', 'ma', 'mt', 'ms', 'mg', 'pa',
+    'pb', 'pr', 'pe', 'pi', 'rj', 'rn', 'rs', 'ro', 'rr', 'sc', 'sp', 'se', 'to',
+))
+# Palavras comuns a quase todo anúncio, que só diluem a similaridade entre títulos
+PALAVRAS_GENERICAS = frozenset((
+    'a', 'o', 'as', 'os', 'de', 'da', 'do', 'das', 'dos', 'e', 'em', 'no', 'na', 'para', 'com',
+    'concurso', 'concursos', 'publico', 'edital', 'editais', 'processo', 'seletivo', 'selecao',
+    'abre', 'abertas', 'aberto', 'inscricoes', 'inscricao', 'vaga', 'vagas', 'novo', 'nova',
+))
+RE_NAO_ALFANUMERICO = re.compile(r'[^a-z0-9]+')
+
+# MinHash com 32 permutações em 8 bandas de 4 linhas: pares com similaridade
+# de Jaccard a partir de ~0,6 viram candidatos, confirmados pelo limiar abaixo
+NUM_PERMUTACOES = 32
+BANDAS = 8
+TAMANHO_SHINGLE = 4
+LIMIAR_SIMILARIDADE = 0.7
+
+_PRIMO = (1 << 61) - 1
+_gerador = random.Random(20240601)
+_PERMUTACOES = [
+    (_gerador.randrange(1, _PRIMO), _gerador.randrange(0, _PRIMO)) for _ in range(NUM_PERMUTACOES)
+]
+
+# Campos que contam para escolher o registro canônico do grupo (o mais completo)
+CAMPOS_COMPLETUDE = ('estado', 'escolaridade', 'salario', 'banca', 'link_edital', 'descricao')
+
+
+def normalizar_titulo(titulo: str) -> str:
+    """Título sem acentos, caixa, pontuação, siglas de UF e palavras genéricas"""
+    texto = unicodedata.normalize('NFKD', titulo or '')
+    texto = ''.join(c for c in texto if not unicodedata.combining(c)).lower()
+    palavras = RE_NAO_ALFANUMERICO.sub(' ', texto).split()
+    return ' '.join(p for p in palavras if p not in UFS and p not in PALAVRAS_GENERICAS)
+
+
+def numeros(texto_normalizado: str) -> frozenset:
+    """Números do título (edital, ano, cargo): distinguem concursos de nome parecido"""
+    return frozenset(p.lstrip('0') or '0' for p in texto_normalizado.split() if p.isdigit())
+
+
+def shingles(texto: str) -> frozenset:
+    """Conjunto de k-gramas de caracteres do texto normalizado"""
+    if len(texto) <= TAMANHO_SHINGLE:
+        return frozenset([texto]) if texto else frozenset()
+    return frozenset(texto[i:i + TAMANHO_SHINGLE] for i in range(len(texto) - TAMANHO_SHINGLE + 1))
+
+
+def assinatura(conjunto: frozenset) -> tuple:
+    """Assinatura MinHash do conjunto de shingles (determinística entre execuções)"""
+    hashes = [zlib.crc32(s.encode()) for s in conjunto]
+    return tuple(min((a * h + b) % _PRIMO for h in hashes) for a, b in _PERMUTACOES)
+
+
+def chaves_conjunto(conjunto: frozenset) -> List[int]:
+    """Chaves dos baldes LSH do conjunto, uma por banda (inteiros de 64 bits com sinal, como no SQLite)"""
+    if not conjunto:
+        return []
+    sig = assinatura(conjunto)
+    linhas = NUM_PERMUTACOES // BANDAS
+    return [
+        int.from_bytes(hashlib.blake2b(repr((banda,) + sig[banda * linhas:(banda + 1) * linhas]).encode(),
+                                       digest_size=8).digest(), 'big', signed=True)
+        for banda in range(BANDAS)
+    ]
+
+
+def jaccard(a: frozenset, b: frozenset) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def completude(registro: Dict) -> tuple:
+    """Chave de preferência do canônico: aberto, mais campos preenchidos, mais antigo"""
+    preenchidos = sum(1 for campo in CAMPOS_COMPLETUDE if registro.get(campo))
+    return (registro.get('status') != 'open', -preenchidos, registro['id'])
+
+
+class Grupos:
+    """Union-find dos grupos de duplicatas, com a UF e os números de título do grupo na raiz
+
+    A compatibilidade é verificada contra o grupo inteiro, não só contra o
+    membro comparado: um registro sem UF não pode servir de ponte entre
+    grupos de UFs diferentes.
+    """
+
+    def __init__(self):
+        self.pai = {}
+        self.estado = {}
+        self.numeros = {}
+
+    def adicionar(self, i: int, estado: str, numeros_titulo: frozenset):
+        self.pai[i] = i
+        self.estado[i] = estado or None
+        # Conjuntos de números distintos do grupo (poucos: os membros são quase iguais)
+        self.numeros[i] = {numeros_titulo}
+
+    def raiz(self, i: int) -> int:
+        pai = self.pai
+        while pai[i] != i:
+            pai[i] = pai[pai[i]]
+            i = pai[i]
+        return i
+
+    def compativeis(self, a: int, b: int) -> bool:
+        """Indicar se os grupos das raízes a e b podem ser unidos"""
+        estado_a, estado_b = self.estado[a], self.estado[b]
+        if estado_a and estado_b and estado_a != estado_b:
+            return False
+        # Um título pode omitir números que o outro traz, mas não trazer outros
+        return all(x <= y or y <= x for x in self.numeros[a] for y in self.numeros[b])
+
+    def unir(self, a: int, b: int):
+        """Unir os grupos das raízes a e b (sob a raiz b)"""
+        if a == b:
+            return
+        self.pai[a] = b
+        self.estado[b] = self.estado[b] or self.estado.pop(a)
+        self.numeros[b] |= self.numeros.pop(a)
+
+
+def agrupar(registros: List[Dict], pendentes: Set[int] = None, baldes: Dict[int, List[int]] = None,
+            bandas: Dict[int, List[int]] = None) -> Dict[int, int]:
+    """Agrupar concursos quase duplicados, retornando {id: id do canônico do grupo}
+
+    Cada registro precisa de 'id' e 'titulo' (ou 'titulo_normalizado');
+    'estado' (grupos de UFs diferentes nunca se unem), os números do título
+    (não podem divergir dos de nenhum membro do grupo) e os campos de
+    completude ajudam na decisão. Candidatos saem dos baldes LSH, sem comparar
+    todos os pares; cada candidato é confirmado pela similaridade de Jaccard
+    real dos shingles.
+
+    Com 'pendentes', o agrupamento é incremental: os demais registros chegam
+    já agrupados pelo 'canonico_id' (grupos inteiros) e mantêm seus grupos, e
+    só os pendentes são comparados com os membros dos seus baldes. 'baldes'
+    traz os membros já gravados de cada chave de balde dos pendentes e
+    'bandas', as chaves já calculadas dos pendentes.
+    """
+    por_id = {r['id']: r for r in registros}
+    normalizados = {i: r.get('titulo_normalizado') or normalizar_titulo(r['titulo']) for i, r in por_id.items()}
+    conjuntos = {}
+
+    def conjunto(i):
+        if i not in conjuntos:
+            conjuntos[i] = shingles(normalizados[i])
+        return conjuntos[i]
+
+    grupos = Grupos()
+    for i, texto in normalizados.items():
+        grupos.adicionar(i, por_id[i].get('estado'), numeros(texto))
+    if pendentes is None:
+        pendentes, baldes = set(por_id), {}
+    # Os já agrupados voltam a formar seus grupos pelo canonico_id, mesmo que o
+    # próprio canônico esteja pendente (e possa sair do grupo)
+    ancoras = {}
+    for i, registro in por_id.items():
+        if i in pendentes:
+            continue
+        grupo = registro.get('canonico_id') or i
+        if grupo in ancoras:
+            grupos.unir(grupos.raiz(i), grupos.raiz(ancoras[grupo]))
+        else:
+            ancoras[grupo] = i
+
+    baldes = {chave: [i for i in membros if i in por_id and i not in pendentes]
+              for chave, membros in (baldes or {}).items()}
+    bandas = bandas or {}
+    for i in por_id:
+        if i in pendentes:
+            for chave in (bandas[i] if i in bandas else chaves_conjunto(conjunto(i))):
+                baldes.setdefault(chave, []).append(i)
+
+    for membros in baldes.values():
+        if len(membros) < 2:
+            continue
+        # Cada pendente é comparado só com os "líderes" do balde: um membro de cada
+        # grupo já formado e os pendentes que não casaram com nenhum líder anterior,
+        # evitando comparar todos os pares
+        lideres, raizes = [], set()
+        for i in membros:
+            if i not in pendentes and grupos.raiz(i) not in raizes:
+                lideres.append(i)
+                raizes.add(grupos.raiz(i))
+        for i in membros:
+            if i not in pendentes:
+                continue
+            for lider in lideres:
+                raiz_i, raiz_lider = grupos.raiz(i), grupos.raiz(lider)
+                if raiz_i == raiz_lider:
+                    break
+                if (grupos.compativeis(raiz_i, raiz_lider)
+                        and jaccard(conjunto(i), conjunto(lider)) >= LIMIAR_SIMILARIDADE):
+                    grupos.unir(raiz_i, raiz_lider)
+                    break
+            else:
+                lideres.append(i)
+
+    membros_grupo = {}
+    for i in por_id:
+        membros_grupo.setdefault(grupos.raiz(i), []).append(por_id[i])
+    canonicos = {}
+    for membros in membros_grupo.values():
+        canonico = min(membros, key=completude)['id']
+        for membro in membros:
+            canonicos[membro['id']] = canonico
+    return canonicos
@@ -0,0 +1,279 @@
+import re
+import unicodedata
+from typing import Dict, Optional
+
+ESTADOS_BR = {
+    'AC': 'Acre', 'AL': 'Alagoas', 'AP': 'Amapá', 'AM': 'Amazonas', 'BA': 'Bahia',
+    'CE': 'Ceará', 'DF': 'Distrito Federal', 'ES': 'Espírito Santo', 'GO': 'Goiás',
+    'MA': 'Maranhão', 'MT': 'Mato Grosso', 'MS': 'Mato Grosso do Sul', 'MG': 'Minas Gerais',
+    'PA': 'Pará', 'PB': 'Paraíba', 'PR': 'Paraná', 'PE': 'Pernambuco', 'PI': 'Piauí',
+    'RJ': 'Rio de Janeiro', 'RN': 'Rio Grande do Norte', 'RS': 'Rio Grande do Sul',
+    'RO': 'Rondônia', 'RR': 'Roraima', 'SC': 'Santa Catarina', 'SP': 'São Paulo',
+    'SE': 'Sergipe', 'TO': 'Tocantins',
+}
+# Nomes cuja forma sem acento é uma palavra comum ("para"): só valem acentuados
+NOMES_ACENTO_OBRIGATORIO = frozenset(('Pará',))
+
+# Bancas organizadoras: nome canônico -> variações encontradas nos anúncios
+BANCAS = {
+    'FGV': ('FGV', 'Fundação Getúlio Vargas'),
+    'Cebraspe': ('Cebraspe', 'Cespe'),
+    'Vunesp': ('Vunesp',),
+    'FCC': ('FCC', 'Fundação Carlos Chagas'),
+    'Cesgranrio': ('Cesgranrio',),
+    'IBFC': ('IBFC',),
+    'Instituto AOCP': ('AOCP',),
+    'Fundatec': ('Fundatec',),
+    'Quadrix': ('Quadrix',),
+    'Consulplan': ('Consulplan',),
+    'IDECAN': ('IDECAN',),
+    'IBADE': ('IBADE',),
+    'IADES': ('IADES',),
+    'Selecon': ('Selecon',),
+    'Fepese': ('Fepese',),
+    'Fundep': ('Fundep',),
+    'FUMARC': ('FUMARC',),
+    'IBAM': ('IBAM',),
+    'IDIB': ('IDIB',),
+    'Legalle': ('Legalle',),
+    'Instituto Access': ('Instituto Access',),
+    'Instituto Mais': ('Instituto Mais',),
+    'Objetiva Concursos': ('Objetiva Concursos',),
+    'Nosso Rumo': ('Nosso Rumo',),
+    'Comperve': ('Comperve',),
+}
+
+# Níveis de escolaridade, do menor (1) ao maior (4)
+NIVEIS_ESCOLARIDADE = ('Fundamental', 'Médio', 'Técnico', 'Superior')
+
+# Faixa plausível de um salário: abaixo disso costuma ser taxa de inscrição
+SALARIO_MINIMO = 500.0
+SALARIO_MAXIMO = 100000.0
+VAGAS_MAXIMO = 10000
+
+RE_ESPACOS = re.compile(r'\s+')
+VARIANTES = {'a': 'aáàâã', 'e': 'eéê', 'i': 'ií', 'o': 'oóôõ', 'u': 'uúü', 'c': 'cç'}
+
+
+def sem_acentos(texto: str) -> str:
+    decomposto = unicodedata.normalize('NFD', texto)
+    return ''.join(c for c in decomposto if not unicodedata.combining(c)).lower()
+
+
+def letras_tolerantes(texto: str, acentos: bool = True) -> list:
+    """Padrão de cada letra do texto, sem diferenciar maiúsculas e (se 'acentos') acentos
+
+    Cada letra vira uma classe explícita ([aáàâãAÁÀÂÃ]) em vez de depender de
+    re.IGNORECASE: com classes, o sre descarta cada ramo de uma alternação
+    pela primeira letra sem entrar nele. Espaços aceitam qualquer espaçamento.
+    """
+    partes = []
+    for letra in texto:
+        base = sem_acentos(letra)
+        if letra.isspace():
+            partes.append(r'\s+')
+        elif not base.isalpha():
+            partes.append(re.escape(letra))
+        else:
+            variantes = VARIANTES.get(base, base) if acentos else letra.lower()
+            partes.append(f"[{variantes}{variantes.upper()}]")
+    return partes
+
+
+def padrao_tolerante(texto: str, acentos: bool = True) -> str:
+    return ''.join(letras_tolerantes(texto, acentos))
+
+
+def qualquer(*textos: str) -> str:
+    return '(?:' + '|'.join(padrao_tolerante(t) for t in textos) + ')'
+
+
+def trie(palavras) -> str:
+    """Alternação em forma de trie de palavras já convertidas em listas de padrões por letra
+
+    O prefixo comum fica fatorado, então cada posição do texto testa só a
+    primeira letra de cada ramo; a palavra mais longa é tentada antes da
+    mais curta que é prefixo dela ('Mato Grosso do Sul' antes de 'Mato Grosso').
+    """
+    raiz = {}
+    for letras in palavras:
+        no = raiz
+        for letra in letras:
+            no = no.setdefault(letra, {})
+        no[''] = {}
+
+    def montar(no: dict) -> str:
+        ramos = [letra + montar(filho) for letra, filho in no.items() if letra]
+        if not ramos:
+            return ''
+        corpo = ramos[0] if len(ramos) == 1 else '(?:' + '|'.join(ramos) + ')'
+        return f"(?:{corpo})?" if '' in no else corpo
+
+    return montar(raiz)
+
+
+SIGLAS = trie(letras_tolerantes(uf, acentos=False) for uf in ESTADOS_BR)
+SIGLAS_MAIUSCULAS = trie(list(uf) for uf in ESTADOS_BR)
+NOMES_ESTADOS = trie(letras_tolerantes(nome, acentos=nome not in NOMES_ACENTO_OBRIGATORIO)
+                     for nome in ESTADOS_BR.values())
+UF_POR_NOME = {sem_acentos(nome): uf for uf, nome in ESTADOS_BR.items()}
+BANCA_POR_VARIACAO = {sem_acentos(v): banca for banca, variacoes in BANCAS.items() for v in variacoes}
+NOMES_BANCAS = trie(letras_tolerantes(v) for v in BANCA_POR_VARIACAO)
+VALOR = r'\d{1,3}(?:\.\d{3})+(?:,\d{1,2})?|\d+(?:,\d{1,2})?'
+REAIS = r'[rR]\$\s*'
+MIL = r'\s*' + padrao_tolerante('mil') + r'\b'
+ATE = padrao_tolerante('até')
+# Número seguido disto é contagem de vagas, não valor
+VAGA = qualquer('vaga', 'posto', 'lugar', 'selecionado', 'aprovado')
+NIVEL = qualquer('fundamental', 'médio', 'técnico', 'superior')
+SEPARADOR_NIVEIS = r'\s*(?:[,/]|\b' + qualquer('e', 'ou') + r'\b)\s*'
+
+# Todos os campos numa única regex: cada ramo nomeado é um tipo de achado, e a
+# ordem dos ramos desempata achados que começam na mesma posição.
+# Todo achado começa consumindo um separador ou o primeiro dígito ([\W\d]):
+# com uma classe como início do padrão, o sre pula em C as letras do meio das
+# palavras (a maior parte do texto) e só tenta os ramos nos inícios possíveis.
+# O lookbehind de cada ramo confere qual foi o caractere consumido.
+RE_ENRIQUECIMENTO = re.compile(
+    r"[\W\d](?:"
+    # Vagas e demais números (o grupo vazio no fim só marca o tipo)
+    rf"(?<=\d)(?:\d{{0,2}}(?:\.\d{{3}})+|\d*)\s*{VAGA}(?P<vagas>)"
+    r"|(?<=\d)[\d.,]*(?P<numero>)"
+    # UF depois de hífen ou barra, seguida de fim, separador ou número: "- SP 04/2024", "Campinas / sp"
+    rf"|(?<=[-–/])\s*(?P<uf_separada>{SIGLAS})(?=\s*(?:$|[-–/),;|]|\d))"
+    # UF colada à cidade por barra: "Campinas/sp abre ..."
+    rf"|(?<=\w/)(?P<uf_barra>{SIGLAS})(?!\w)"
+    # UF entre parênteses: "Campinas (SP)", mas não o plural de "professor(es)"
+    rf"|(?<=\()(?<!\w\()\s*(?P<uf_parenteses>{SIGLAS})\s*\)"
+    # Ramos que começam por letra, logo depois do separador consumido
+    r"|(?<!\d)(?:"
+    # UF maiúscula antes de hífen: "SP - Prefeitura de ..."
+    rf"(?<!-)(?P<uf_antes>{SIGLAS_MAIUSCULAS})\s*[-–]"
+    rf"|(?P<estado_nome>{NOMES_ESTADOS})(?!\w)"
+    rf"|(?P<banca>{NOMES_BANCAS})(?!\w)"
+    # Salário ou faixa: "R$ 2.000,00 a R$ 8.000,00", "até R$ 25 mil"
+    rf"|(?P<salario>(?:(?P<salario_ate>{ATE})\s+)?{REAIS}(?P<salario_a>{VALOR})(?P<salario_a_mil>{MIL})?"
+    rf"(?:\s*(?:[aA]|{ATE})\s*(?:{REAIS})?(?P<salario_b>{VALOR})(?P<salario_b_mil>{MIL})?(?![\d.,]*\s*{VAGA})"
+    rf"|\s*(?:[eE]|-|–)\s*{REAIS}(?P<salario_c>{VALOR})(?P<salario_c_mil>{MIL})?)?)"
+    # Escolaridade: "níveis médio e superior", "ensino médio", "superior completo", "graduação"
+    rf"|(?P<escolaridade>{qualquer('níveis', 'nível')}\s+(?:{padrao_tolerante('de')}\s+)?{NIVEL}"
+    rf"(?:{SEPARADOR_NIVEIS}{NIVEL})*"
+    rf"|{qualquer('ensino', 'escolaridade', 'formação')}\s+{NIVEL}|{NIVEL}\s+{qualquer('completo', 'completa')}"
+    rf"|{qualquer('graduação', 'curso superior', 'bacharelado', 'licenciatura', 'alfabetizado', 'alfabetizada')})"
+    r"))",
+    re.MULTILINE
+)
+RE_NIVEIS = re.compile(
+    r'(fundamental|alfabetizad)|(m[eé]dio)|(t[eé]cnico)|(superior|gradua|bacharel|licenciatura)', re.IGNORECASE
+)
+RE_NUMERO_INICIAL = re.compile(r'[\d.]+')
+# Prioridade de cada forma de UF (menor vence), como na antiga ordem de extrair_estado
+PRIORIDADE_UF = {'uf_parenteses': 0, 'uf_separada': 1, 'uf_barra': 1, 'uf_antes': 2, 'estado_nome': 3}
+
+
+def valor_reais(numero: str, mil: Optional[str]) -> float:
+    """Converter '1.500,00' ou '25' + ' mil' em float"""
+    valor = float(numero.replace('.', '').replace(',', '.'))
+    return valor * 1000 if mil else valor
+
+
+def formatar_reais(valor: float) -> str:
+    return 'R$ ' + f"{valor:,.2f}".replace(',', '_').replace('.', ',').replace('_', '.')
+
+
+def nivel_escolaridade(texto: str) -> Optional[int]:
+    """Nível (1 a 4) de um nome de escolaridade ('medio', 'Superior', ...) ou None"""
+    match = RE_NIVEIS.search(texto or '')
+    return match.lastindex if match else None
+
+
+def banca_canonica(texto: str) -> str:
+    """Nome canônico da banca ('cespe' -> 'Cebraspe'); textos desconhecidos voltam como vieram"""
+    chave = ' '.join(sem_acentos(texto or '').split())
+    return BANCA_POR_VARIACAO.get(chave, texto)
+
+
+def enriquecer(titulo: str, contexto: str = None) -> Dict:
+    """Extrair UF, banca, faixa salarial, escolaridade e vagas numa única passada
+
+    Título e contexto (o texto em volta do anúncio) são lidos juntos pela
+    RE_ENRIQUECIMENTO. UF e banca do título têm precedência sobre as do
+    contexto; salário e escolaridade juntam tudo o que aparecer (faixa de
+    mínimo a máximo). As vagas vêm do contexto (ou do título, sem contexto),
+    como no antigo extrair_numero: o primeiro "N vagas", se plausível; senão o
+    primeiro número do texto (o de "N vagas" ou de um salário também conta),
+    0 se estiver fora da faixa plausível; sem número algum, 1.
+    """
+    # O espaço inicial é o separador consumido pelo achado que abre o título
+    texto = f" {titulo}\n{contexto}" if contexto else f" {titulo}"
+    # Achados a partir daqui (do '\n') são do contexto; sem contexto, as vagas vêm do título
+    inicio_contexto = len(titulo) + 1 if contexto else 0
+    uf, chave_uf, banca = '', None, None
+    salarios_min, salarios_max, niveis = [], [], set()
+    vagas = numero = None
+
+    for match in RE_ENRIQUECIMENTO.finditer(texto):
+        tipo = match.lastgroup
+        no_contexto = match.start() >= inicio_contexto
+        if tipo in PRIORIDADE_UF:
+            chave = (bool(contexto) and no_contexto, PRIORIDADE_UF[tipo])
+            if chave_uf is None or chave < chave_uf:
+                valor = match.group(tipo)
+                uf = UF_POR_NOME[sem_acentos(RE_ESPACOS.sub(' ', valor))] if tipo == 'estado_nome' else valor.upper()
+                chave_uf = chave
+        elif tipo == 'banca':
+            # O título vem antes do contexto no texto: a primeira banca é a do título, se houver
+            if banca is None:
+                banca = banca_canonica(RE_ESPACOS.sub(' ', match.group(tipo)))
+        elif tipo == 'salario':
+            if no_contexto and numero is None:
+                numero = int(match.group('salario_a').replace('.', '').replace(',', ''))
+            valores = [valor_reais(match.group(f'salario_{p}'), match.group(f'salario_{p}_mil'))
+                       for p in 'abc' if match.group(f'salario_{p}')]
+            valores = [v for v in valores if SALARIO_MINIMO <= v <= SALARIO_MAXIMO]
+            if valores:
+                salarios_max.append(max(valores))
+                # "até R$ X" só informa o teto
+                if not match.group('salario_ate') or len(valores) > 1:
+                    salarios_min.append(min(valores))
+        elif tipo == 'escolaridade':
+            niveis.update(m.lastindex for m in RE_NIVEIS.finditer(match.group(tipo)))
+        elif tipo == 'vagas' and no_contexto:
+            quantidade = int(RE_NUMERO_INICIAL.match(match.group()).group().replace('.', ''))
+            if vagas is None:
+                vagas = quantidade
+            if numero is None:
+                numero = quantidade
+        elif tipo == 'numero' and no_contexto and numero is None:
+            numero = int(match.group().replace('.', '').replace(',', ''))
+
+    if vagas is None or not 1 <= vagas <= VAGAS_MAXIMO:
+        # Sem "N vagas" plausível: primeiro número do texto, 0 fora da faixa; sem número algum, 1 vaga
+        if numero is None:
+            vagas = 1
+        else:
+            vagas = numero if 1 <= numero <= VAGAS_MAXIMO else 0
+
+    salario_min = min(salarios_min) if salarios_min else None
+    salario_max = max(salarios_max) if salarios_max else None
+    if salario_max is None:
+        salario = None
+    elif salario_min is None:
+        salario = f"até {formatar_reais(salario_max)}"
+    elif salario_min == salario_max:
+        salario = formatar_reais(salario_max)
+    else:
+        salario = f"{formatar_reais(salario_min)} a {formatar_reais(salario_max)}"
+
+    return {
+        'estado': uf,
+        'banca': banca,
+        'escolaridade': ', '.join(NIVEIS_ESCOLARIDADE[n - 1] for n in sorted(niveis)) or None,
+        'escolaridade_min': min(niveis) if niveis else None,
+        'escolaridade_max': max(niveis) if niveis else None,
+        'salario': salario,
+        'salario_min': salario_min,
+        'salario_max': salario_max,
+        'vagas': vagas,
+    }
+
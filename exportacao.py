@@ -0,0 +1,163 @@
+import csv
+import io
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from database import Database
+from respostas import TAMANHO_PARTE
+
+TABELAS = {
+    'concursos': Database.CAMPOS_CONCURSO,
+    'atualizacoes': Database.CAMPOS_ATUALIZACAO,
+}
+# formato: (mimetype, extensão do arquivo)
+FORMATOS = {
+    'csv': ('text/csv', 'csv'),
+    'parquet': ('application/vnd.apache.parquet', 'parquet'),
+    'arrow': ('application/vnd.apache.arrow.file', 'arrow'),
+}
+COLUNAS_INTEIRAS = frozenset(('id', 'vagas', 'canonico_id', 'escolaridade_min', 'escolaridade_max',
+                              'total_concursos', 'novos', 'atualizados', 'removidos'))
+COLUNAS_REAIS = frozenset(('salario_min', 'salario_max'))
+
+
+class FormatoIndisponivel(Exception):
+    """Formato colunar pedido sem o pacote pyarrow instalado"""
+
+
+def carregar_pyarrow():
+    """Importar o pyarrow só quando um formato colunar é pedido (pesa no boot da API)"""
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError:
+        raise FormatoIndisponivel('Parquet e Arrow exigem o pacote pyarrow (pip install pyarrow)')
+    return pyarrow
+
+
+def colunas_exportacao(tabela: str, campos: List[str] = None) -> List[str]:
+    """Validar tabela e campos, retornando as colunas exportadas (ValueError se inválidos)"""
+    if tabela not in TABELAS:
+        raise ValueError(f"tabela inválida: {tabela} (use {', '.join(TABELAS)})")
+    if not campos:
+        return list(TABELAS[tabela])
+    invalidos = [c for c in campos if c not in TABELAS[tabela]]
+    if invalidos:
+        raise ValueError(f"campos inválidos: {', '.join(invalidos)}")
+    return list(dict.fromkeys(['id'] + list(campos)))
+
+
+def linhas_exportacao(db: Database, tabela: str, colunas: List[str], filtros: Dict = None,
+                      lote: int = 500) -> Iterator[Dict]:
+    """Linhas da tabela lidas em lotes do cursor; em atualizacoes só o filtro 'fonte' se aplica"""
+    filtros = filtros or {}
+    if tabela == 'concursos':
+        return db.iterar_concursos(filtros, colunas, lote)
+    return db.iterar_atualizacoes(filtros.get('fonte'), lote)
+
+
+def csv_em_partes(colunas: List[str], linhas: Iterable[Dict]) -> Iterator[bytes]:
+    """CSV em UTF-8 gerado em partes; o cabeçalho sai imediatamente"""
+    buffer = io.StringIO()
+    escritor = csv.writer(buffer, lineterminator='\n')
+    escritor.writerow(colunas)
+    yield buffer.getvalue().encode('utf-8')
+    buffer.seek(0)
+    buffer.truncate()
+    for linha in linhas:
+        escritor.writerow([linha.get(c) for c in colunas])
+        if buffer.tell() >= TAMANHO_PARTE:
+            yield buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode('utf-8')
+
+
+class SaidaEmPartes:
+    """Arquivo só de escrita que acumula os bytes gravados até serem retirados
+
+    Permite que os escritores do pyarrow, que gravam num arquivo, sejam
+    enviados em fluxo: cada grupo de linhas gravado é retirado e enviado.
+    """
+
+    def __init__(self):
+        self._partes = []
+        self._posicao = 0
+        self.closed = False
+
+    def write(self, dados) -> int:
+        dados = bytes(dados)
+        self._partes.append(dados)
+        self._posicao += len(dados)
+        return len(dados)
+
+    def tell(self) -> int:
+        return self._posicao
+
+    def writable(self) -> bool:
+        return True
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def retirar(self) -> bytes:
+        dados = b''.join(self._partes)
+        self._partes = []
+        return dados
+
+
+def colunar_em_partes(colunas: List[str], linhas: Iterable[Dict], formato: str,
+                      linhas_por_grupo: int = 10000) -> Iterator[bytes]:
+    """Parquet ou Arrow IPC (arquivo) gerado em partes, um grupo de linhas por vez
+
+    Cada grupo vira um row group (Parquet) ou record batch (Arrow), então a
+    memória fica limitada a linhas_por_grupo. Comprime com zstd quando o
+    pyarrow tiver o codec.
+    """
+    pa = carregar_pyarrow()
+    esquema = pa.schema([
+        (c, pa.int64() if c in COLUNAS_INTEIRAS else pa.float64() if c in COLUNAS_REAIS else pa.string())
+        for c in colunas
+    ])
+    codec = 'zstd' if pa.Codec.is_available('zstd') else None
+    saida = SaidaEmPartes()
+    if formato == 'parquet':
+        escritor = pa.parquet.ParquetWriter(saida, esquema, compression=codec or 'snappy')
+        gravar = escritor.write_table
+    else:
+        escritor = pa.ipc.new_file(saida, esquema, options=pa.ipc.IpcWriteOptions(compression=codec))
+        gravar = escritor.write
+    linhas = iter(linhas)
+    try:
+        while True:
+            grupo = list(islice(linhas, linhas_por_grupo))
+            if not grupo:
+                break
+            gravar(pa.Table.from_pylist([{c: linha.get(c) for c in colunas} for linha in grupo], schema=esquema))
+            yield saida.retirar()
+    finally:
+        escritor.close()
+    yield saida.retirar()
+
+
+def exportar(db: Database, tabela: str, formato: str, filtros: Dict = None, campos: List[str] = None,
+             lote: int = 500, linhas_por_grupo: int = 10000) -> Tuple[str, Iterator[bytes]]:
+    """Exportar a tabela no formato pedido, retornando (mimetype, partes do arquivo)
+
+    Levanta ValueError para tabela, formato ou campos inválidos e
+    FormatoIndisponivel se o formato colunar não puder ser gerado.
+    """
+    if formato not in FORMATOS:
+        raise ValueError(f"formato inválido: {formato} (use {', '.join(FORMATOS)})")
+    colunas = colunas_exportacao(tabela, campos)
+    if formato != 'csv':
+        carregar_pyarrow()
+    linhas = linhas_exportacao(db, tabela, colunas, filtros, lote)
+    if formato == 'csv':
+        return FORMATOS[formato][0], csv_em_partes(colunas, linhas)
+    return FORMATOS[formato][0], colunar_em_partes(colunas, linhas, formato, linhas_por_grupo)
@@ -0,0 +1,78 @@
+import argparse
+import os
+import sys
+import time
+
+from config import Config
+from database import Database
+from exportacao import FORMATOS, TABELAS, FormatoIndisponivel, exportar
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Exportar concursos ou atualizacoes em CSV, Parquet ou Arrow (mesmos filtros de /api/concursos)")
+    parser.add_argument('tabela', choices=list(TABELAS))
+    parser.add_argument('--formato', choices=list(FORMATOS),
+                        help='padrão: pela extensão de --saida, ou csv')
+    parser.add_argument('--saida', help="arquivo de destino ('-' = stdout; padrão: <tabela>.<formato>)")
+    parser.add_argument('--banco', default=Config.DATABASE_PATH)
+    parser.add_argument('--estado')
+    parser.add_argument('--status')
+    parser.add_argument('--fonte')
+    parser.add_argument('--busca')
+    parser.add_argument('--banca')
+    parser.add_argument('--escolaridade', help='fundamental, medio, tecnico ou superior')
+    parser.add_argument('--salario-min', help='salário máximo do concurso de pelo menos este valor')
+    parser.add_argument('--salario-max', help='salário inicial do concurso de até este valor')
+    parser.add_argument('--vagas-min')
+    parser.add_argument('--ordem', help='data (padrão), salario ou vagas')
+    parser.add_argument('--canonicos', action='store_true',
+                        help='só o registro canônico de cada grupo de duplicatas (padrão: todos)')
+    parser.add_argument('--campos', help='colunas separadas por vírgula')
+    args = parser.parse_args()
+
+    formato = args.formato
+    if not formato:
+        extensao = os.path.splitext(args.saida or '')[1].lstrip('.').lower()
+        formato = next((f for f, (_, ext) in FORMATOS.items() if ext == extensao), 'csv')
+    saida = args.saida or f"{args.tabela}.{FORMATOS[formato][1]}"
+    filtros = {
+        'estado': args.estado,
+        'status': args.status,
+        'fonte': args.fonte,
+        'busca': args.busca,
+        'banca': args.banca,
+        'escolaridade': args.escolaridade,
+        'salario_min': args.salario_min,
+        'salario_max': args.salario_max,
+        'vagas_min': args.vagas_min,
+        'ordem': args.ordem,
+        'incluir_duplicados': not args.canonicos,
+    }
+    filtros = {k: v for k, v in filtros.items() if v}
+    campos = [c.strip() for c in (args.campos or '').split(',') if c.strip()]
+
+    inicio = time.perf_counter()
+    db = Database(args.banco)
+    try:
+        _, partes = exportar(db, args.tabela, formato, filtros, campos,
+                             Config.API_STREAM_LOTE, Config.EXPORT_LINHAS_POR_GRUPO)
+    except (ValueError, FormatoIndisponivel) as e:
+        parser.error(str(e))
+
+    destino = sys.stdout.buffer if saida == '-' else open(saida, 'wb')
+    total = 0
+    try:
+        for parte in partes:
+            destino.write(parte)
+            total += len(parte)
+    finally:
+        if destino is not sys.stdout.buffer:
+            destino.close()
+    db.fechar()
+    print(f"✓ {args.tabela} exportada em {formato} para {saida}: {total / 2**20:.1f} MiB "
+          f"em {time.perf_counter() - inicio:.1f}s", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
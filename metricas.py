@@ -0,0 +1,182 @@
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Tuple
+
+# Limites (em segundos) dos histogramas de latência
+BALDES_PADRAO = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def escapar(valor) -> str:
+    """Escapar o valor de um rótulo no formato de texto do Prometheus"""
+    return str(valor).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def formatar(valor: float) -> str:
+    if valor == float('inf'):
+        return '+Inf'
+    return repr(float(valor)) if isinstance(valor, float) else str(valor)
+
+
+class Metrica:
+    """Série de valores de uma métrica, um por combinação de rótulos"""
+
+    tipo = 'untyped'
+
+    def __init__(self, nome: str, descricao: str, rotulos: Tuple[str, ...] = ()):
+        self.nome = nome
+        self.descricao = descricao
+        self.rotulos = tuple(rotulos)
+        self._valores = {}
+        self._lock = threading.Lock()
+
+    def _chave(self, rotulos: Dict) -> tuple:
+        if set(rotulos) != set(self.rotulos):
+            raise ValueError(f"{self.nome} espera os rótulos {self.rotulos}, recebeu {tuple(rotulos)}")
+        return tuple(str(rotulos[r]) for r in self.rotulos)
+
+    def _seletor(self, chave: tuple, extra: str = '') -> str:
+        pares = [f'{r}="{escapar(v)}"' for r, v in zip(self.rotulos, chave)]
+        if extra:
+            pares.append(extra)
+        return '{' + ','.join(pares) + '}' if pares else ''
+
+    def amostras(self) -> List[str]:
+        with self._lock:
+            return [f"{self.nome}{self._seletor(chave)} {formatar(valor)}"
+                    for chave, valor in sorted(self._valores.items())]
+
+    def exportar(self) -> List[str]:
+        return [f"# HELP {self.nome} {self.descricao}", f"# TYPE {self.nome} {self.tipo}"] + self.amostras()
+
+
+class Contador(Metrica):
+    tipo = 'counter'
+
+    def incrementar(self, valor: float = 1, **rotulos):
+        chave = self._chave(rotulos)
+        with self._lock:
+            self._valores[chave] = self._valores.get(chave, 0) + valor
+
+
+class Medidor(Metrica):
+    tipo = 'gauge'
+
+    def definir(self, valor: float, **rotulos):
+        chave = self._chave(rotulos)
+        with self._lock:
+            self._valores[chave] = valor
+
+
+class Histograma(Metrica):
+    tipo = 'histogram'
+
+    def __init__(self, nome: str, descricao: str, rotulos: Tuple[str, ...] = (), baldes=BALDES_PADRAO):
+        super().__init__(nome, descricao, rotulos)
+        self.baldes = tuple(sorted(baldes))
+
+    def observar(self, valor: float, **rotulos):
+        chave = self._chave(rotulos)
+        with self._lock:
+            contagens, soma = self._valores.get(chave) or ([0] * (len(self.baldes) + 1), 0.0)
+            contagens[bisect.bisect_left(self.baldes, valor)] += 1
+            self._valores[chave] = (contagens, soma + valor)
+
+    @contextmanager
+    def medir(self, **rotulos):
+        """Observar a duração do bloco, mesmo quando ele levanta uma exceção"""
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observar(time.perf_counter() - inicio, **rotulos)
+
+    def amostras(self) -> List[str]:
+        linhas = []
+        with self._lock:
+            for chave, (contagens, soma) in sorted(self._valores.items()):
+                acumulado = 0
+                for limite, contagem in zip(self.baldes + (float('inf'),), contagens):
+                    acumulado += contagem
+                    le = 'le="' + formatar(limite) + '"'
+                    linhas.append(f"{self.nome}_bucket{self._seletor(chave, le)} {acumulado}")
+                linhas.append(f"{self.nome}_sum{self._seletor(chave)} {formatar(soma)}")
+                linhas.append(f"{self.nome}_count{self._seletor(chave)} {acumulado}")
+        return linhas
+
+
+class Registro:
+    """Conjunto de métricas do processo, exportado no formato de texto do Prometheus"""
+
+    def __init__(self):
+        self._metricas = {}
+        self._lock = threading.Lock()
+
+    def _registrar(self, classe, nome: str, *args, **kwargs) -> Metrica:
+        with self._lock:
+            metrica = self._metricas.get(nome)
+            if metrica is None:
+                metrica = self._metricas[nome] = classe(nome, *args, **kwargs)
+            elif not isinstance(metrica, classe):
+                raise ValueError(f"{nome} já registrada como {metrica.tipo}")
+            return metrica
+
+    def contador(self, nome: str, descricao: str, rotulos: Tuple[str, ...] = ()) -> Contador:
+        return self._registrar(Contador, nome, descricao, rotulos)
+
+    def medidor(self, nome: str, descricao: str, rotulos: Tuple[str, ...] = ()) -> Medidor:
+        return self._registrar(Medidor, nome, descricao, rotulos)
+
+    def histograma(self, nome: str, descricao: str, rotulos: Tuple[str, ...] = (),
+                   baldes=BALDES_PADRAO) -> Histograma:
+        return self._registrar(Histograma, nome, descricao, rotulos, baldes=baldes)
+
+    def exportar(self) -> str:
+        with self._lock:
+            metricas = list(self._metricas.values())
+        return '\n'.join(linha for metrica in metricas for linha in metrica.exportar()) + '\n'
+
+
+registro = Registro()
+
+
+# ===== MÉTRICAS DA SINCRONIZAÇÃO (por fonte) =====
+
+REQUISICOES_FONTE = registro.contador(
+    'concursos_fonte_requisicoes_total',
+    'Requisições às páginas das fontes, por status HTTP (erro = falha de rede)', ('fonte', 'status'))
+LATENCIA_FONTE = registro.histograma(
+    'concursos_fonte_requisicao_segundos', 'Latência das requisições às fontes', ('fonte',))
+BYTES_FONTE = registro.contador(
+    'concursos_fonte_bytes_total', 'Bytes recebidos das fontes (corpo das respostas)', ('fonte',))
+PARSE_FONTE = registro.histograma(
+    'concursos_fonte_parse_segundos', 'Tempo de parse do HTML de cada página', ('fonte',))
+EXTRACAO_FONTE = registro.histograma(
+    'concursos_fonte_extracao_segundos', 'Tempo de extração dos concursos de cada página', ('fonte',))
+CANDIDATOS_FONTE = registro.contador(
+    'concursos_fonte_candidatos_total',
+    'Candidatos examinados pelo extrator e concursos aceitos, por método (links ou textos)',
+    ('fonte', 'metodo', 'resultado'))
+ERROS_FONTE = registro.contador(
+    'concursos_fonte_erros_total', 'Exceções capturadas durante a sincronização, por etapa', ('fonte', 'etapa'))
+GRAVACAO_FONTE = registro.histograma(
+    'concursos_fonte_gravacao_segundos', 'Tempo do upsert dos concursos de cada fonte no banco', ('fonte',))
+LINHAS_FONTE = registro.contador(
+    'concursos_fonte_linhas_total', 'Concursos gravados por resultado do upsert', ('fonte', 'resultado'))
+SINCRONIZACOES_FONTE = registro.contador(
+    'concursos_fonte_sincronizacoes_total', 'Execuções de cada fonte por status final', ('fonte', 'status'))
+DURACAO_FONTE = registro.histograma(
+    'concursos_fonte_sincronizacao_segundos', 'Duração do rastreamento completo de cada fonte', ('fonte',),
+    baldes=(0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 45.0, 60.0, 120.0))
+ULTIMA_SINCRONIZACAO_FONTE = registro.medidor(
+    'concursos_fonte_ultima_sincronizacao_timestamp_seconds', 'Fim da última execução de cada fonte (epoch)',
+    ('fonte',))
+ULTIMOS_CONCURSOS_FONTE = registro.medidor(
+    'concursos_fonte_ultima_sincronizacao_concursos', 'Concursos extraídos na última execução de cada fonte',
+    ('fonte',))
+
+# ===== MÉTRICAS DA API =====
+
+LATENCIA_ROTA = registro.histograma(
+    'concursos_http_requisicao_segundos', 'Latência das rotas da API', ('rota', 'metodo', 'status'))
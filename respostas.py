@@ -0,0 +1,143 @@
+import json
+import zlib
+from typing import Callable, Dict, Iterable, Iterator
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Tamanho mínimo de cada parte enviada pelas respostas em fluxo
+TAMANHO_PARTE = 64 * 1024
+NIVEL_GZIP = 6
+# Qualidade 5 do brotli: compressão próxima do gzip -9 a um custo de CPU parecido com o gzip -6
+QUALIDADE_BROTLI = 5
+TIPOS_COMPRESSIVEIS = ('application/json', 'application/x-ndjson', 'text/')
+
+
+def serializar(obj) -> bytes:
+    """Serializar para JSON compacto em UTF-8 (orjson, se instalado)
+
+    Mesmas opções do ProvedorJSON (chaves ordenadas, sem escapar não-ASCII), para o
+    corpo em fluxo ser idêntico ao do jsonify.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, sort_keys=True, separators=(',', ':'), default=str).encode('utf-8')
+
+
+class ProvedorJSON(DefaultJSONProvider):
+    """JSON do Flask (jsonify) pelo orjson quando disponível, mantendo as chaves ordenadas"""
+
+    # Como o orjson, UTF-8 direto em vez de \uXXXX
+    ensure_ascii = False
+
+    def dumps(self, obj, **kwargs) -> str:
+        if orjson is None or kwargs.get('indent'):
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(
+            obj, default=self.default, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        ).decode('utf-8')
+
+
+def agrupar_partes(pedacos: Iterable[bytes], tamanho: int = TAMANHO_PARTE) -> Iterator[bytes]:
+    """Juntar pedaços pequenos em partes de ~tamanho bytes
+
+    A primeira parte sai assim que o primeiro pedaço fica pronto, para o
+    cliente receber o primeiro byte antes de a consulta terminar.
+    """
+    buffer, acumulado, primeira = [], 0, True
+    for pedaco in pedacos:
+        buffer.append(pedaco)
+        acumulado += len(pedaco)
+        if primeira or acumulado >= tamanho:
+            yield b''.join(buffer)
+            buffer, acumulado, primeira = [], 0, False
+    if buffer:
+        yield b''.join(buffer)
+
+
+def ndjson(itens: Iterable[Dict]) -> Iterator[bytes]:
+    """Um objeto JSON por linha (application/x-ndjson)"""
+    return agrupar_partes(serializar(item) + b'\n' for item in itens)
+
+
+def json_lista(chave: str, itens: Iterable[Dict], rodape: Callable[[int], Dict]) -> Iterator[bytes]:
+    """Objeto JSON {chave: [itens...], **rodape(total)} gerado em partes
+
+    Os demais campos vêm depois da lista, porque o total só é conhecido no fim.
+    """
+    def pedacos():
+        yield b'{' + serializar(chave) + b':['
+        total = 0
+        for item in itens:
+            yield (b',' if total else b'') + serializar(item)
+            total += 1
+        fim = serializar(rodape(total))
+        yield b']' + (b',' + fim[1:] if fim != b'{}' else b'}')
+    return agrupar_partes(pedacos())
+
+
+def codificacao_preferida(aceitas) -> str:
+    """Escolher 'br' ou 'gzip' pelo Accept-Encoding (None se nenhuma for aceita)"""
+    opcoes = (['br'] if brotli is not None else []) + ['gzip']
+    # best_match desempata pela ordem das opções: brotli primeiro
+    return aceitas.best_match(opcoes)
+
+
+def comprimir(corpo: bytes, codificacao: str) -> bytes:
+    if codificacao == 'br':
+        return brotli.compress(corpo, quality=QUALIDADE_BROTLI)
+    compressor = zlib.compressobj(NIVEL_GZIP, zlib.DEFLATED, 31)
+    return compressor.compress(corpo) + compressor.flush()
+
+
+def comprimir_partes(partes: Iterable[bytes], codificacao: str) -> Iterator[bytes]:
+    """Comprimir uma resposta em fluxo, liberando cada parte assim que ela chega"""
+    if codificacao == 'br':
+        compressor = brotli.Compressor(quality=QUALIDADE_BROTLI)
+        for parte in partes:
+            yield compressor.process(parte) + compressor.flush()
+        yield compressor.finish()
+    else:
+        compressor = zlib.compressobj(NIVEL_GZIP, zlib.DEFLATED, 31)
+        for parte in partes:
+            yield compressor.compress(parte) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        yield compressor.flush()
+
+
+def comprimir_resposta(resposta, aceitas, minimo_bytes: int):
+    """Comprimir a resposta (inteira ou em fluxo) com a codificação negociada
+
+    Respostas pequenas, não textuais, já codificadas ou de arquivo (send_file)
+    seguem como estão. O ETag vira fraco: a representação comprimida não é
+    idêntica byte a byte à original.
+    """
+    if (resposta.status_code != 200 or resposta.direct_passthrough
+            or 'Content-Encoding' in resposta.headers
+            or not (resposta.mimetype or '').startswith(TIPOS_COMPRESSIVEIS)):
+        return resposta
+    resposta.vary.add('Accept-Encoding')
+    codificacao = codificacao_preferida(aceitas)
+    if codificacao is None:
+        return resposta
+
+    if resposta.is_streamed:
+        resposta.response = comprimir_partes(resposta.response, codificacao)
+    else:
+        corpo = resposta.get_data()
+        if len(corpo) < minimo_bytes:
+            return resposta
+        resposta.set_data(comprimir(corpo, codificacao))
+    resposta.headers['Content-Encoding'] = codificacao
+    etag, fraco = resposta.get_etag()
+    if etag and not fraco:
+        resposta.set_etag(etag, weak=True)
+    return resposta
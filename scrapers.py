@@ -1,392 +1,979 @@
 import requests
-from bs4 import BeautifulSoup
-from typing import List, Dict
-from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, NavigableString
+from typing import Callable, Iterator, List, Dict, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeout
+from urllib.parse import urljoin, urldefrag, urlparse
+from collections import deque
+from itertools import chain, islice
+from config import Config
+from enriquecimento import ESTADOS_BR, enriquecer
+from metricas import (
+    BYTES_FONTE, CANDIDATOS_FONTE, DURACAO_FONTE, ERROS_FONTE, EXTRACAO_FONTE, LATENCIA_FONTE, PARSE_FONTE,
+    REQUISICOES_FONTE, SINCRONIZACOES_FONTE, ULTIMA_SINCRONIZACAO_FONTE, ULTIMOS_CONCURSOS_FONTE,
+)
+import hashlib
+import os
 import re
+import threading
+import time
 import warnings
+import yaml
 warnings.filterwarnings('ignore')
 
+try:
+    import lxml.html
+    import lxml.etree
+except ImportError:
+    lxml = None
+
+try:
+    import brotli  # noqa: F401 - habilita decodificação 'br' no urllib3
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    ACCEPT_ENCODING = 'gzip, deflate'
+
+
+PALAVRAS_INVALIDAS = (
+    'assinatura', 'completa', 'pacote', 'combo', 'plano',
+    'aula', 'curso', 'conteúdo', 'material', 'apostila', 'live',
+    'webinar', 'videoaula', 'tutorial', 'treinamento', 'capacitação',
+    'professor', 'instrutor', 'mentor', 'coach', 'palestrante',
+    'resultado', 'gabarito', 'prova', 'resposta', 'correção',
+    'sorteio', 'promoção', 'desconto', 'cupom', 'oferta',
+    'valor', 'custa', 'pague', 'pagamento', 'cartão',
+    'clique', 'saiba', 'confira', 'veja', 'baixe',
+    'whatsapp', 'telegram', 'instagram', 'facebook', 'twitter',
+    'inscrição', 'inscreva', 'aprenda', 'domine',
+    'prepare-se', 'prepare', 'estude', 'estudo', 'aprova'
+)
+
+PALAVRAS_CONCURSO = (
+    'concurso', 'edital', 'seleção', 'processo', 'vaga', 'cargo',
+    'analista', 'técnico', 'assistente', 'agente', 'auditor',
+    'inspetor', 'perito', 'fiscal', 'advogado', 'juiz',
+    'médico', 'enfermeiro', 'engenheiro', 'arquiteto',
+    'prefeitura', 'câmara', 'tribunal', 'ministério', 'secretaria',
+    'governo', 'estado', 'município', 'federal', 'público',
+    'instituição', 'autarquia', 'fundação', 'empresa pública',
+    'abertura', 'abertas', 'aberto',
+)
+
+MARCADORES_TITULO = (' - ', ' de ', ' para ', 'edital', 'concurso', 'vaga', 'cargo')
+
+RE_ESPACOS = re.compile(r'\s+')
+RE_INICIO_NUMERICO = re.compile(r'\d')
+RE_TELEFONE = re.compile('|'.join([
+    r'^\(?\d{2}\)?[\s-]?\d{4,5}[\s-]?\d{4}$',
+    r'^\d{2}\s\d{4,5}\s\d{4}$',
+    r'^\(\d{2}\)\s?\d{4}-\d{4}$',
+    r'^\+55\s\d{2}\s\d{4,5}-?\d{4}$',
+]))
+RE_PRECO = re.compile('|'.join([r'r\$\s*[\d.,]+', r'por\s*r\$', r'/mês', r'/ano', r'^\d+,?\d{2}$']))
+
+
+@lru_cache(maxsize=32)
+def compilar_palavras(palavras: tuple) -> re.Pattern:
+    """Compilar uma lista de palavras em uma única regex em forma de trie
+
+    Palavras que contêm outra palavra da lista são descartadas, pois a busca
+    só precisa saber se alguma delas aparece no texto.
+    """
+    unicas = sorted(set(palavras), key=len)
+    minimas = []
+    for palavra in unicas:
+        if not any(menor in palavra for menor in minimas):
+            minimas.append(palavra)
+
+    trie = {}
+    for palavra in minimas:
+        no = trie
+        for letra in palavra:
+            no = no.setdefault(letra, {})
+        no[''] = {}
+
+    def montar(no: dict) -> str:
+        ramos = [re.escape(letra) + montar(filho) for letra, filho in sorted(no.items()) if letra]
+        if not ramos:
+            return ''
+        if len(ramos) == 1:
+            return ramos[0]
+        return '(?:' + '|'.join(ramos) + ')'
+
+    return re.compile(montar(trie))
+
+
+RE_PALAVRAS_INVALIDAS = compilar_palavras(PALAVRAS_INVALIDAS)
+RE_PALAVRAS_CONCURSO = compilar_palavras(PALAVRAS_CONCURSO)
+
+# Links seguidos pelo rastreador: paginação e listagens por estado
+RE_TEXTO_PAGINACAO = re.compile(
+    r'^(?:\d{1,3}|próxim[ao]s?(?: página)?|proxim[ao]s?(?: pagina)?|seguinte|mais concursos|ver mais|»|›|>>?)$'
+)
+RE_URL_PAGINACAO = re.compile(r'[?&](?:page|pagina|pg|p)=\d+|/(?:page|pagina)/\d+', re.IGNORECASE)
+RE_URL_ESTADO = re.compile(
+    r'/(?:estados?|uf)(?:/[a-z-]+)?/?(?:$|\?)|[?&](?:estado|uf)=[a-z]{2}(?:&|$)', re.IGNORECASE
+)
+TEXTOS_ESTADO = frozenset(
+    [uf.lower() for uf in ESTADOS_BR] + [nome.lower() for nome in ESTADOS_BR.values()]
+)
+
+
+class NaoModificado(Exception):
+    """Página não mudou desde a última requisição (HTTP 304 ou mesmo hash de conteúdo)"""
+
+
+class FonteInacessivel(Exception):
+    """Nenhuma página da fonte pôde ser baixada (falha de rede ou resposta de erro)"""
+
+
+class EstadoPaginasMemoria:
+    """Hash do conteúdo e validadores HTTP de cada página, mantidos em memória
+
+    Database implementa a mesma interface para persistir o estado entre execuções.
+    """
+
+    def __init__(self):
+        self._paginas = {}
+        self._lock = threading.Lock()
+
+    def obter_pagina(self, url: str) -> Dict:
+        with self._lock:
+            return self._paginas.get(url)
+
+    def salvar_pagina(self, url: str, hash_conteudo: str, etag: str = None, last_modified: str = None):
+        with self._lock:
+            links = self._paginas.get(url, {}).get('links', [])
+            self._paginas[url] = {
+                'hash_conteudo': hash_conteudo, 'etag': etag, 'last_modified': last_modified, 'links': links
+            }
+
+    def salvar_links_pagina(self, url: str, links: List[str]):
+        with self._lock:
+            if url in self._paginas:
+                self._paginas[url]['links'] = list(links)
+
+    def limpar_paginas(self):
+        with self._lock:
+            self._paginas.clear()
+
+
 class Scraper:
     """Classe base para scrapers de concursos"""
 
+    # Semáforos por host, limitando requisições simultâneas ao mesmo site
+    _semaforos_host = {}
+    _lock_semaforos = threading.Lock()
+
+    # Próximo horário (time.monotonic) em que cada host pode receber uma requisição
+    _proximo_acesso_host = {}
+
+    # Sessão HTTP compartilhada (keep-alive)
+    _sessao = None
+    _lock_sessao = threading.Lock()
+
+    # Hash e ETag/Last-Modified da última versão de cada página
+    estado_paginas = EstadoPaginasMemoria()
+
+    # Páginas baixadas pela execução de fonte em andamento na thread, gravadas
+    # em estado_paginas só depois que os concursos da fonte forem salvos
+    _execucao = threading.local()
+
+    @classmethod
+    def sessao(cls) -> requests.Session:
+        """Obter a sessão HTTP compartilhada, com pool de conexões e retry"""
+        with cls._lock_sessao:
+            if cls._sessao is None:
+                retry = Retry(
+                    total=Config.HTTP_RETRIES,
+                    backoff_factor=Config.HTTP_BACKOFF,
+                    status_forcelist=(429, 500, 502, 503, 504),
+                    allowed_methods=frozenset(['GET', 'HEAD']),
+                    raise_on_status=False,
+                )
+                adapter = HTTPAdapter(
+                    pool_connections=max(1, Config.SCRAPE_MAX_WORKERS),
+                    pool_maxsize=max(1, Config.SCRAPE_MAX_POR_HOST),
+                    max_retries=retry,
+                )
+                sessao = requests.Session()
+                sessao.mount('http://', adapter)
+                sessao.mount('https://', adapter)
+                sessao.verify = False
+                sessao.headers.update({
+                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+                    'Accept-Language': 'pt-BR,pt;q=0.9,en;q=0.8',
+                    'Accept-Encoding': ACCEPT_ENCODING,
+                })
+                cls._sessao = sessao
+            return cls._sessao
+
+    @classmethod
+    def cabecalhos_condicionais(cls, url: str) -> Dict[str, str]:
+        """Montar If-None-Match/If-Modified-Since a partir da última resposta da URL"""
+        if not Config.HTTP_CONDITIONAL_GET:
+            return {}
+        pagina = cls.estado_paginas.obter_pagina(url) or {}
+        headers = {}
+        if pagina.get('etag'):
+            headers['If-None-Match'] = pagina['etag']
+        if pagina.get('last_modified'):
+            headers['If-Modified-Since'] = pagina['last_modified']
+        return headers
+
+    @classmethod
+    def estado_resposta(cls, url: str, response: requests.Response) -> Tuple[Dict, bool]:
+        """Hash e validadores de uma resposta 200, e se o conteúdo mudou desde a última visita gravada"""
+        estado = {
+            'hash_conteudo': hashlib.sha1(response.content).hexdigest(),
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+        }
+        anterior = cls.estado_paginas.obter_pagina(url)
+        return estado, not anterior or anterior.get('hash_conteudo') != estado['hash_conteudo']
+
+    @classmethod
+    def iniciar_execucao(cls, paginas: Dict[str, Dict] = None) -> Dict[str, Dict]:
+        """Passar a acumular o estado das páginas baixadas pela thread atual (ver confirmar_paginas)
+
+        'paginas' permite que outra thread acompanhe o dicionário (iterar_concorrente).
+        """
+        cls._execucao.paginas = {} if paginas is None else paginas
+        return cls._execucao.paginas
+
+    @classmethod
+    def encerrar_execucao(cls):
+        cls._execucao.paginas = None
+
+    @classmethod
+    def registrar_pagina(cls, url: str, estado: Dict = None, links: List[str] = None,
+                         concursos: List[Dict] = None):
+        """Anotar o estado (hash e validadores), os links e/ou os concursos de uma página analisada
+
+        Dentro de uma execução de fonte fica pendente até confirmar_paginas;
+        fora dela, vai direto para estado_paginas. 'concursos' (mesmo vazio)
+        marca a página como lida nesta execução: a lista dela substitui a
+        anterior no encerramento dos ausentes.
+        """
+        pendentes = getattr(cls._execucao, 'paginas', None)
+        if pendentes is None:
+            cls.confirmar_paginas({url: {'estado': estado, 'links': links}})
+            return
+        pagina = pendentes.setdefault(url, {'estado': None, 'links': None, 'concursos': None})
+        if estado is not None:
+            pagina['estado'] = estado
+        if links is not None:
+            pagina['links'] = links
+        if concursos is not None:
+            pagina['concursos'] = concursos
+
+    @classmethod
+    def confirmar_paginas(cls, paginas: Dict[str, Dict]):
+        """Gravar em estado_paginas as páginas anotadas por registrar_pagina"""
+        for url, pagina in paginas.items():
+            estado = pagina['estado']
+            if estado is not None:
+                cls.estado_paginas.salvar_pagina(url, estado['hash_conteudo'], estado['etag'], estado['last_modified'])
+            if pagina['links'] is not None:
+                cls.estado_paginas.salvar_links_pagina(url, pagina['links'])
+
+    @classmethod
+    def semaforo_host(cls, url: str) -> threading.BoundedSemaphore:
+        """Obter o semáforo de concorrência do host da URL"""
+        host = urlparse(url).netloc.lower()
+        with cls._lock_semaforos:
+            semaforo = cls._semaforos_host.get(host)
+            if semaforo is None:
+                semaforo = threading.BoundedSemaphore(max(1, Config.SCRAPE_MAX_POR_HOST))
+                cls._semaforos_host[host] = semaforo
+            return semaforo
+
+    @classmethod
+    def aguardar_vez_host(cls, url: str):
+        """Respeitar o intervalo mínimo entre requisições ao mesmo host
+
+        O horário é reservado sob o lock e a espera acontece fora dele, então
+        hosts diferentes nunca esperam uns pelos outros.
+        """
+        intervalo = Config.CRAWL_INTERVALO_DOMINIO_SECONDS
+        if intervalo <= 0:
+            return
+        host = urlparse(url).netloc.lower()
+        with cls._lock_semaforos:
+            agora = time.monotonic()
+            vez = max(agora, cls._proximo_acesso_host.get(host, agora))
+            cls._proximo_acesso_host[host] = vez + intervalo
+        if vez > agora:
+            time.sleep(vez - agora)
+
     @staticmethod
     def limpar_titulo(titulo: str) -> str:
         """Remove espaços extras e caracteres desnecessários"""
-        return re.sub(r'\s+', ' ', titulo).strip()
+        return RE_ESPACOS.sub(' ', titulo).strip()
 
     @staticmethod
     def contem_palavra_ou_variacao(texto: str, palavras: List[str]) -> bool:
-        """Busca palavra ou variações (plural, diminutivo, conjugações)"""
-        texto_lower = texto.lower()
-        for palavra in palavras:
-            if f' {palavra} ' in f' {texto_lower} ':
-                return True
-            if texto_lower.startswith(palavra + ' '):
-                return True
-            if texto_lower.endswith(f' {palavra}'):
-                return True
-            variações = [
-                palavra,
-                palavra + 's', palavra + 'a', palavra + 'as',
-                palavra + 'o', palavra + 'os', palavra + 'ão', palavra + 'ões',
-                palavra + 'inho', palavra + 'inhos', palavra + 'inha', palavra + 'inhas',
-                palavra + 'ado', palavra + 'ados', palavra + 'ação', palavra + 'ações',
-                palavra + 'mente',
-            ]
-            for var in variações:
-                if var in texto_lower:
-                    return True
-        return False
+        """Busca palavra ou variações (plural, diminutivo, conjugações)
+
+        Toda variação começa pela própria palavra, então basta procurar a
+        palavra como substring; a busca usa a regex compilada da lista.
+        """
+        return compilar_palavras(tuple(palavras)).search(texto.lower()) is not None
 
     @staticmethod
     def eh_numero_telefone(texto: str) -> bool:
         """Verifica se o texto é um número de telefone"""
-        patterns = [
-            r'^\(?\d{2}\)?[\s-]?\d{4,5}[\s-]?\d{4}$',
-            r'^\d{2}\s\d{4,5}\s\d{4}$',
-            r'^\(\d{2}\)\s?\d{4}-\d{4}$',
-            r'^\+55\s\d{2}\s\d{4,5}-?\d{4}$',
-        ]
-        for pattern in patterns:
-            if re.search(pattern, texto.strip()):
-                return True
-        return False
+        return RE_TELEFONE.search(texto.strip()) is not None
 
     @staticmethod
     def tem_preco(texto: str) -> bool:
         """Verifica se contém preço"""
-        patterns = [r'r\$\s*[\d.,]+', r'por\s*r\$', r'/mês', r'/ano', r'^\d+,?\d{2}$']
-        texto_lower = texto.lower()
-        for pattern in patterns:
-            if re.search(pattern, texto_lower):
-                return True
-        return False
+        return RE_PRECO.search(texto.lower()) is not None
 
     @staticmethod
     def eh_titulo_valido(titulo: str) -> bool:
         """Verifica se o título é um concurso público válido"""
         if not titulo or len(titulo) < 10:
             return False
-        if re.match(r'^\d', titulo):
+        if RE_INICIO_NUMERICO.match(titulo):
             return False
-        if Scraper.eh_numero_telefone(titulo):
-            return False
-        if Scraper.tem_preco(titulo):
+        if RE_TELEFONE.search(titulo.strip()):
             return False
 
         texto_lower = titulo.lower()
-        
-        palavras_invalidas = [
-            'assinatura', 'completa', 'pacote', 'combo', 'plano',
-            'aula', 'curso', 'conteúdo', 'material', 'apostila', 'live',
-            'webinar', 'videoaula', 'tutorial', 'treinamento', 'capacitação',
-            'professor', 'instrutor', 'mentor', 'coach', 'palestrante',
-            'resultado', 'gabarito', 'prova', 'resposta', 'correção',
-            'sorteio', 'promoção', 'desconto', 'cupom', 'oferta',
-            'valor', 'custa', 'pague', 'pagamento', 'cartão',
-            'clique', 'saiba', 'confira', 'veja', 'baixe',
-            'whatsapp', 'telegram', 'instagram', 'facebook', 'twitter',
-            'inscrição', 'inscreva', 'aprenda', 'domine',
-            'prepare-se', 'prepare', 'estude', 'estudo', 'aprova'
-        ]
 
-        if Scraper.contem_palavra_ou_variacao(titulo, palavras_invalidas):
+        if RE_PRECO.search(texto_lower):
             return False
 
-        palavras_concurso = [
-            'concurso', 'edital', 'seleção', 'processo', 'vaga', 'cargo',
-            'analista', 'técnico', 'assistente', 'agente', 'auditor',
-            'inspetor', 'perito', 'fiscal', 'advogado', 'juiz',
-            'médico', 'enfermeiro', 'engenheiro', 'arquiteto',
-            'prefeitura', 'câmara', 'tribunal', 'ministério', 'secretaria',
-            'governo', 'estado', 'município', 'federal', 'público',
-            'instituição', 'autarquia', 'fundação', 'empresa pública',
-            'abertura', 'abertas', 'aberto',
-        ]
+        if RE_PALAVRAS_INVALIDAS.search(texto_lower):
+            return False
 
-        if not Scraper.contem_palavra_ou_variacao(titulo, palavras_concurso):
+        if not RE_PALAVRAS_CONCURSO.search(texto_lower):
             return False
 
-        if not any(pattern in texto_lower for pattern in [' - ', ' de ', ' para ', 'edital', 'concurso', 'vaga', 'cargo']):
+        if not any(pattern in texto_lower for pattern in MARCADORES_TITULO):
             if len(titulo.split()) < 3:
                 return False
 
         return True
 
     @staticmethod
-    def extrair_numero(texto: str) -> int:
-        """Extrair número de vagas de uma string"""
-        try:
-            match = re.search(r'(\d+)\s*(?:vaga|posto|lugar|selecionado|aprovado)', texto, re.IGNORECASE)
-            if match:
-                num = int(match.group(1))
-                if 1 <= num <= 10000:
-                    return num
-            match = re.search(r'\d+', texto.replace('.', '').replace(',', ''))
-            if match:
-                num = int(match.group())
-                if num > 10000 or num < 1:
-                    return 0
-                return num
-        except:
-            pass
-        return 1
+    def timeout_no_orcamento(restante: float, timeout: float) -> Optional[float]:
+        """Timeout de cada tentativa para a requisição inteira (retries e backoff) caber em 'restante'
 
-    @staticmethod
-    def extrair_estado(texto: str) -> str:
-        """Extrair estado (UF)"""
-        estados_br = {'AC', 'AL', 'AP', 'AM', 'BA', 'CE', 'DF', 'ES', 'GO', 'MA',
-                      'MT', 'MS', 'MG', 'PA', 'PB', 'PR', 'PE', 'PI', 'RJ', 'RN',
-                      'RS', 'RO', 'RR', 'SC', 'SP', 'SE', 'TO'}
-        patterns = [r'\(([A-Z]{2})\)', r'-\s*([A-Z]{2})\s*$', r'-\s*([A-Z]{2})\s*-', r'([A-Z]{2})\s*-']
-        for pattern in patterns:
-            match = re.search(pattern, texto)
-            if match:
-                uf = match.group(1).upper()
-                if uf in estados_br:
-                    return uf
-        return ''
+        None se não sobra nem 1s por tentativa: melhor não começar outra página.
+        """
+        tentativas = Config.HTTP_RETRIES + 1
+        # Soma das esperas do urllib3 entre as tentativas (arredondada para cima)
+        esperas = Config.HTTP_BACKOFF * (2 ** Config.HTTP_RETRIES - 1)
+        por_tentativa = min(timeout, (restante - esperas) / tentativas)
+        return por_tentativa if por_tentativa >= 1 else None
 
     @staticmethod
-    def fazer_requisicao(url: str, timeout=10) -> BeautifulSoup:
-        """Fazer requisição HTTP com tratamento de erros"""
+    def fazer_requisicao(url: str, timeout=10, fonte: str = None) -> BeautifulSoup:
+        """Fazer requisição HTTP com tratamento de erros
+
+        Levanta NaoModificado quando o servidor responde 304 ou quando o
+        conteúdo tem o mesmo hash da última visita, para que a página não
+        seja analisada novamente. Falhas de rede, respostas de erro (4xx/5xx)
+        e falhas de parse retornam None; o hash só é registrado (registrar_pagina)
+        se a página não mudou ou foi analisada, para que a próxima visita a
+        releia;
+        latência, status, bytes e tempo de parse vão para as métricas da
+        fonte (padrão: o host da URL).
+        """
+        fonte = fonte or urlparse(url).netloc.lower()
+        try:
+            Scraper.aguardar_vez_host(url)
+            with Scraper.semaforo_host(url), LATENCIA_FONTE.medir(fonte=fonte):
+                response = Scraper.sessao().get(
+                    url, headers=Scraper.cabecalhos_condicionais(url), timeout=timeout
+                )
+        except Exception as e:
+            REQUISICOES_FONTE.incrementar(fonte=fonte, status='erro')
+            print(f"  ⚠️  {fonte}: falha ao acessar {url}: {str(e)[:80]}")
+            return None
+        REQUISICOES_FONTE.incrementar(fonte=fonte, status=response.status_code)
+        BYTES_FONTE.incrementar(len(response.content), fonte=fonte)
+
+        if response.status_code == 304:
+            raise NaoModificado(url)
+        if response.status_code >= 400:
+            print(f"  ⚠️  {fonte}: HTTP {response.status_code} em {url}")
+            return None
+        estado, mudou = Scraper.estado_resposta(url, response) if response.status_code == 200 else (None, True)
+        if not mudou:
+            Scraper.registrar_pagina(url, estado)
+            raise NaoModificado(url)
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'pt-BR,pt;q=0.9,en;q=0.8',
-            }
-            response = requests.get(url, headers=headers, timeout=timeout, verify=False)
             response.encoding = 'utf-8'
-            return BeautifulSoup(response.text, 'html.parser')
+            with PARSE_FONTE.medir(fonte=fonte):
+                doc = Scraper.analisar_html(response.text)
         except Exception as e:
+            ERROS_FONTE.incrementar(fonte=fonte, etapa='parse')
+            print(f"  ⚠️  {fonte}: erro no parse de {url}: {str(e)[:80]}")
             return None
+        if estado is not None:
+            Scraper.registrar_pagina(url, estado)
+        return doc
+
+    @staticmethod
+    def analisar_html(html: str):
+        """Analisar o HTML com lxml, mantendo o html.parser do BeautifulSoup como fallback
+
+        Com lxml, <script>, <style>, <noscript> e <svg> são descartados logo após
+        o parse, já que o extrator só lê links e nós de texto.
+        """
+        if lxml is not None:
+            try:
+                parser = lxml.html.HTMLParser(encoding='utf-8', remove_comments=True, remove_pis=True)
+                doc = lxml.html.document_fromstring(html.encode('utf-8'), parser=parser)
+                lxml.etree.strip_elements(doc, 'script', 'style', 'noscript', 'svg', with_tail=False)
+                return doc
+            except (lxml.etree.LxmlError, ValueError):
+                pass
+        return BeautifulSoup(html, 'html.parser')
+
+    @staticmethod
+    def candidatos_links(doc, limite: int, seletor: str = None) -> List[tuple]:
+        """Listar (texto do link, texto do elemento pai) dos primeiros links do documento
+
+        'seletor' é um XPath que restringe os links candidatos; só vale com lxml
+        (no fallback do BeautifulSoup todos os links são considerados).
+        """
+        if isinstance(doc, BeautifulSoup):
+            return [
+                (link.get_text(), link.parent.get_text() if link.parent else None)
+                for link in doc.find_all('a', limit=limite)
+            ]
+        candidatos = []
+        for link in (doc.xpath(seletor) if seletor else doc.iter('a')):
+            if len(candidatos) >= limite:
+                break
+            pai = link.getparent()
+            candidatos.append((link.text_content(), pai.text_content() if pai is not None else None))
+        return candidatos
+
+    @staticmethod
+    def iterar_textos(doc) -> Iterator[str]:
+        """Percorrer os nós de texto do documento em ordem, sem montar a lista"""
+        if isinstance(doc, BeautifulSoup):
+            return (str(t) for t in doc.descendants if isinstance(t, NavigableString))
+        return (str(t) for t in doc.itertext())
 
     @staticmethod
-    def extrair_concursos_generico(soup: BeautifulSoup, fonte: str, url: str, max_items=100) -> List[Dict]:
-        """Extrai concursos de forma genérica, procurando por padrões comuns"""
+    def links_rastreaveis(doc, url: str) -> List[str]:
+        """Listar os links do mesmo host que levam a outras páginas de listagem
+
+        São seguidos links de paginação (rel="next", "próxima", números, ?page=N)
+        e de listagens por estado (texto com a UF ou o nome do estado, /estado/...).
+        """
+        if doc is None:
+            return []
+        if isinstance(doc, BeautifulSoup):
+            ancoras = [
+                (a.get('href'), ' '.join(a.get('rel') or []), a.get_text())
+                for a in doc.find_all('a', href=True)
+            ]
+        else:
+            ancoras = [(a.get('href'), a.get('rel') or '', a.text_content()) for a in doc.iter('a')]
+
+        host = urlparse(url).netloc.lower()
+        links, vistos = [], {urldefrag(url)[0]}
+        for href, rel, texto in ancoras:
+            if not href:
+                continue
+            destino = urldefrag(urljoin(url, href.strip()))[0]
+            partes = urlparse(destino)
+            if partes.scheme not in ('http', 'https') or partes.netloc.lower() != host or destino in vistos:
+                continue
+            texto = Scraper.limpar_titulo(texto).lower()
+            if ('next' in rel.lower() or RE_TEXTO_PAGINACAO.match(texto) or RE_URL_PAGINACAO.search(destino)
+                    or texto in TEXTOS_ESTADO or RE_URL_ESTADO.search(destino)):
+                vistos.add(destino)
+                links.append(destino)
+        return links
+
+    @staticmethod
+    def liberar_documento(doc):
+        """Liberar a árvore do documento assim que a extração terminar"""
+        if doc is None:
+            return
+        if isinstance(doc, BeautifulSoup):
+            doc.decompose()
+        else:
+            doc.clear()
+
+    @staticmethod
+    def rastrear(urls, fonte: str, max_items=100, max_paginas: int = None, profundidade: int = None,
+                 seletor: str = None, timeout=10) -> List[Dict]:
+        """Percorrer a fonte a partir de urls, seguindo paginação e listagens por estado
+
+        Busca em largura limitada por Config.CRAWL_MAX_PAGINAS, CRAWL_PROFUNDIDADE_MAXIMA
+        e CRAWL_TEMPO_MAXIMO_SECONDS; cada requisição recebe um timeout que a faz
+        caber (com retries) no tempo que resta, e nenhuma começa quando ele não
+        dá para uma requisição. max_items vale por página. Páginas não
+        modificadas não são analisadas, mas seus links da última visita continuam
+        alimentando a fila. Levanta NaoModificado se nenhuma página mudou e
+        FonteInacessivel se nenhuma pôde ser baixada.
+        """
+        if max_paginas is None:
+            max_paginas = Config.CRAWL_MAX_PAGINAS
+        if profundidade is None:
+            profundidade = Config.CRAWL_PROFUNDIDADE_MAXIMA
+        limite = time.monotonic() + Config.CRAWL_TEMPO_MAXIMO_SECONDS
+
+        if isinstance(urls, str):
+            urls = [urls]
+        fila = deque((url, 0) for url in urls)
+        enfileiradas = set(urls)
+        concursos, visitadas, modificadas, falhas = [], 0, 0, 0
+        while fila and visitadas < max_paginas:
+            timeout_pagina = Scraper.timeout_no_orcamento(limite - time.monotonic(), timeout)
+            if timeout_pagina is None:
+                break
+            pagina, nivel = fila.popleft()
+            visitadas += 1
+            try:
+                doc = Scraper.fazer_requisicao(pagina, timeout_pagina, fonte)
+            except NaoModificado:
+                links = (Scraper.estado_paginas.obter_pagina(pagina) or {}).get('links') or []
+            else:
+                if doc is None:
+                    falhas += 1
+                    continue
+                modificadas += 1
+                try:
+                    da_pagina = Scraper.extrair_concursos_generico(doc, fonte, pagina, max_items, seletor)
+                    links = Scraper.links_rastreaveis(doc, pagina)
+                finally:
+                    Scraper.liberar_documento(doc)
+                concursos.extend(da_pagina)
+                Scraper.registrar_pagina(pagina, links=links, concursos=da_pagina)
+
+            if nivel < profundidade:
+                for link in links:
+                    if link not in enfileiradas:
+                        enfileiradas.add(link)
+                        fila.append((link, nivel + 1))
+
+        if visitadas and falhas == visitadas:
+            raise FonteInacessivel(f"{falhas} página(s) sem resposta válida")
+        if visitadas and not modificadas:
+            raise NaoModificado(urls[0])
+        return concursos
+
+    @staticmethod
+    def extrair_por_textos(doc, fonte: str, url: str, concursos: List[Dict], limite_nos: int = 500) -> int:
+        """Procurar concursos nos primeiros nós de texto do documento, numa única passada
+
+        Os nós chegam em streaming e só uma janela de 5 é mantida: o candidato
+        e 2 nós de cada lado, onde as vagas são procuradas. A leitura para 2 nós
+        depois do último candidato. Os concursos são acrescentados a 'concursos';
+        retorna quantos nós foram examinados como candidatos.
+        """
+        data = datetime.now().strftime('%Y-%m-%d')
+        examinados = 0
+        janela = deque(maxlen=5)
+        # Dois marcadores de fim (None) completam a janela dos últimos candidatos
+        nos = chain(islice(Scraper.iterar_textos(doc), limite_nos + 2), (None, None))
+        for j, no in enumerate(nos):
+            janela.append(no)
+            centro = j - 2
+            if centro < 0 or centro >= limite_nos:
+                continue
+            examinados += 1
+            texto = Scraper.limpar_titulo(janela[-3])
+            if len(texto) > 10 and Scraper.eh_titulo_valido(texto):
+                # Procura vagas, UF, salário etc. no candidato e nos nós vizinhos
+                contexto = ' '.join(t for t in janela if t is not None)
+                campos = enriquecer(texto, contexto)
+                if campos['vagas'] > 0:
+                    concursos.append({
+                        'titulo': texto,
+                        'organizacao': texto.split('-')[0].strip()[:50],
+                        **campos,
+                        'status': 'open',
+                        'fonte': fonte,
+                        'link_edital': url,
+                        'data_publicacao': data
+                    })
+        return examinados
+
+    @staticmethod
+    def extrair_concursos_generico(soup, fonte: str, url: str, max_items=100, seletor: str = None) -> List[Dict]:
+        """Extrai concursos de forma genérica, procurando por padrões comuns
+
+        Aceita tanto o documento lxml quanto um BeautifulSoup (fallback). O
+        tempo de extração e os candidatos examinados/aceitos de cada método vão
+        para as métricas da fonte; uma falha no meio da página é registrada e
+        mantém os concursos já extraídos.
+        """
         concursos = []
-        if not soup:
+        if soup is None:
             return concursos
         
+        inicio = time.perf_counter()
         try:
             # Procura por texto contendo números seguido de "vaga(s)"
-            links = soup.find_all('a', limit=max_items)
+            links = Scraper.candidatos_links(soup, max_items, seletor)
+            CANDIDATOS_FONTE.incrementar(len(links), fonte=fonte, metodo='links', resultado='examinado')
             
-            for link in links:
-                texto = Scraper.limpar_titulo(link.get_text())
+            for texto_link, texto_pai in links:
+                texto = Scraper.limpar_titulo(texto_link)
                 
                 if not texto or len(texto) < 10:
                     continue
                 
                 # Verifica se é um concurso válido
                 if Scraper.eh_titulo_valido(texto):
-                    vagas = Scraper.extrair_numero(link.parent.get_text() if link.parent else texto)
-                    if vagas > 0:
-                        estado = Scraper.extrair_estado(texto)
+                    # UF, banca, salário, escolaridade e vagas do título e do texto do elemento pai
+                    campos = enriquecer(texto, texto_pai)
+                    if campos['vagas'] > 0:
                         concursos.append({
                             'titulo': texto,
                             'organizacao': texto.split('-')[0].strip()[:50],
-                            'vagas': vagas,
-                            'estado': estado,
+                            **campos,
                             'status': 'open',
                             'fonte': fonte,
                             'link_edital': url,
                             'data_publicacao': datetime.now().strftime('%Y-%m-%d')
                         })
             
-            # Se não encontrou por links, procura em todos os textos
+            CANDIDATOS_FONTE.incrementar(len(concursos), fonte=fonte, metodo='links', resultado='aceito')
+            
+            # Se não encontrou por links, procura nos nós de texto
             if len(concursos) == 0:
-                textos = soup.find_all(string=True)
-                for i, texto_raw in enumerate(textos[:500]):
-                    texto = Scraper.limpar_titulo(texto_raw)
-                    if len(texto) > 10 and Scraper.eh_titulo_valido(texto):
-                        # Procura vagas na próxima linha ou contexto
-                        contexto = ' '.join([t.get_text() for t in textos[max(0, i-2):min(len(textos), i+3)]])
-                        vagas = Scraper.extrair_numero(contexto)
-                        if vagas > 0:
-                            estado = Scraper.extrair_estado(texto)
-                            concursos.append({
-                                'titulo': texto,
-                                'organizacao': texto.split('-')[0].strip()[:50],
-                                'vagas': vagas,
-                                'estado': estado,
-                                'status': 'open',
-                                'fonte': fonte,
-                                'link_edital': url,
-                                'data_publicacao': datetime.now().strftime('%Y-%m-%d')
-                            })
-        except:
-            pass
+                examinados = Scraper.extrair_por_textos(soup, fonte, url, concursos)
+                CANDIDATOS_FONTE.incrementar(examinados, fonte=fonte, metodo='textos', resultado='examinado')
+                CANDIDATOS_FONTE.incrementar(len(concursos), fonte=fonte, metodo='textos', resultado='aceito')
+        except Exception as e:
+            ERROS_FONTE.incrementar(fonte=fonte, etapa='extracao')
+            print(f"  ⚠️  {fonte}: erro na extração de {url}: {str(e)[:80]}")
+        finally:
+            EXTRACAO_FONTE.observar(time.perf_counter() - inicio, fonte=fonte)
         
         return concursos[:max_items]
 
 # ============================================================
-# SCRAPERS - VERSÃO ROBUSTA COM FALLBACK GENÉRICO
+# FONTES - REGISTRO DECLARATIVO (fontes.yaml)
 # ============================================================
 
-class ConcursosNoBrasilScraper(Scraper):
-    @staticmethod
-    def scrape() -> List[Dict]:
-        url = 'https://concursosnobrasil.com/concursos/'
-        soup = Scraper.fazer_requisicao(url)
-        concursos = Scraper.extrair_concursos_generico(soup, 'concursosnobrasil', url, 100)
-        print(f"  ✓ {len(concursos)} concursos")
-        return concursos
+class FonteScraper(Scraper):
+    """Scraper de uma fonte do registro: rastreia suas URLs com o extrator genérico"""
+
+    CAMPOS = ('fonte', 'urls', 'nome', 'seletor', 'max_items', 'timeout', 'intervalo_horas',
+              'max_paginas', 'profundidade', 'ativo')
+
+    def __init__(self, fonte: str, urls: List[str], nome: str = None, seletor: str = None,
+                 max_items: int = 100, timeout: float = None, intervalo_horas: float = None,
+                 max_paginas: int = None, profundidade: int = None, ativo: bool = True):
+        self.fonte = fonte
+        self.urls = [urls] if isinstance(urls, str) else list(urls)
+        self.nome = nome or fonte
+        self.seletor = seletor
+        self.max_items = max_items
+        self.timeout = timeout or Config.REQUEST_TIMEOUT
+        self.intervalo_horas = intervalo_horas if intervalo_horas is not None else Config.SCRAPE_INTERVAL_HOURS
+        self.max_paginas = max_paginas
+        self.profundidade = profundidade
+        self.ativo = ativo
 
-class QConcursosScraper(Scraper):
-    @staticmethod
-    def scrape() -> List[Dict]:
-        url = 'https://www.qconcursos.com/'
-        soup = Scraper.fazer_requisicao(url)
-        concursos = Scraper.extrair_concursos_generico(soup, 'qconcursos', url, 100)
+    @classmethod
+    def de_registro(cls, item: Dict) -> 'FonteScraper':
+        """Criar a fonte a partir de uma entrada do registro, validando os campos"""
+        if not isinstance(item, dict):
+            raise ValueError(f"entrada inválida no registro de fontes: {item!r}")
+        desconhecidos = set(item) - set(cls.CAMPOS)
+        if desconhecidos:
+            raise ValueError(f"fonte '{item.get('fonte')}': campos desconhecidos {sorted(desconhecidos)}")
+        if not item.get('fonte') or not item.get('urls'):
+            raise ValueError(f"fonte '{item.get('fonte')}': 'fonte' e 'urls' são obrigatórios")
+        return cls(**item)
+
+    def scrape(self) -> List[Dict]:
+        concursos = Scraper.rastrear(
+            self.urls, self.fonte, self.max_items, self.max_paginas, self.profundidade,
+            self.seletor, self.timeout
+        )
         print(f"  ✓ {len(concursos)} concursos")
         return concursos
 
-class AcheConcursosScraper(Scraper):
-    @staticmethod
-    def scrape() -> List[Dict]:
-        url = 'https://www.acheconcursos.com.br/'
-        soup = Scraper.fazer_requisicao(url)
-        concursos = Scraper.extrair_concursos_generico(soup, 'acheconcursos', url, 80)
-        print(f"  ✓ {len(concursos)} concursos")
-        return concursos
+    def vencida(self, ultima_execucao: datetime, agora: datetime) -> bool:
+        """Indicar se a fonte deve ser sincronizada (nunca executada ou intervalo esgotado)"""
+        return ultima_execucao is None or agora - ultima_execucao >= timedelta(hours=self.intervalo_horas)
 
-class CebrasepScraper(Scraper):
-    @staticmethod
-    def scrape() -> List[Dict]:
-        url = 'https://www.cebraspe.org.br/concursos/'
-        soup = Scraper.fazer_requisicao(url)
-        concursos = Scraper.extrair_concursos_generico(soup, 'cebraspe', url, 60)
-        print(f"  ✓ {len(concursos)} concursos")
-        return concursos
 
-class VunespScraper(Scraper):
-    @staticmethod
-    def scrape() -> List[Dict]:
-        url = 'https://www.vunesp.com.br/'
-        soup = Scraper.fazer_requisicao(url)
-        concursos = Scraper.extrair_concursos_generico(soup, 'vunesp', url, 60)
-        print(f"  ✓ {len(concursos)} concursos")
-        return concursos
+def carregar_fontes(caminho: str = None) -> List[FonteScraper]:
+    """Ler o registro de fontes (YAML: lista de fontes, ver fontes.yaml)"""
+    caminho = caminho or Config.FONTES_PATH
+    with open(caminho, encoding='utf-8') as arquivo:
+        itens = yaml.safe_load(arquivo) or []
+    if not isinstance(itens, list):
+        raise ValueError(f"{caminho}: o registro de fontes deve ser uma lista")
 
-class FGVScraper(Scraper):
-    @staticmethod
-    def scrape() -> List[Dict]:
-        url = 'https://conhecimento.fgv.br/concursos'
-        soup = Scraper.fazer_requisicao(url)
-        concursos = Scraper.extrair_concursos_generico(soup, 'fgv', url, 50)
-        print(f"  ✓ {len(concursos)} concursos")
-        return concursos
+    fontes = [FonteScraper.de_registro(item) for item in itens]
+    nomes = [fonte.nome for fonte in fontes]
+    repetidos = sorted({nome for nome in nomes if nomes.count(nome) > 1})
+    if repetidos:
+        raise ValueError(f"{caminho}: nomes de fonte repetidos {repetidos}")
+    return fontes
 
-class IbfcConcursosScraper(Scraper):
-    @staticmethod
-    def scrape() -> List[Dict]:
-        url = 'https://www.ibfc.org.br/concursos/'
-        soup = Scraper.fazer_requisicao(url)
-        concursos = Scraper.extrair_concursos_generico(soup, 'ibfc', url, 50)
-        print(f"  ✓ {len(concursos)} concursos")
-        return concursos
+# ============================================================
+# MANAGER DE SCRAPERS
+# ============================================================
 
-class GlobalConcursosScraper(Scraper):
-    @staticmethod
-    def scrape() -> List[Dict]:
-        url = 'https://www.globalconcursos.com.br/'
-        soup = Scraper.fazer_requisicao(url)
-        concursos = Scraper.extrair_concursos_generico(soup, 'globalconcursos', url, 80)
-        print(f"  ✓ {len(concursos)} concursos")
-        return concursos
+class ScraperManager:
+    """Gerenciador de scrapers de concursos públicos"""
 
-class JCConcursosScraper(Scraper):
-    @staticmethod
-    def scrape() -> List[Dict]:
-        url = 'https://jcconcursos.uol.com.br/'
-        soup = Scraper.fazer_requisicao(url)
-        concursos = Scraper.extrair_concursos_generico(soup, 'jcconcursos', url, 80)
-        print(f"  ✓ {len(concursos)} concursos")
-        return concursos
+    # Fontes do registro (Config.FONTES_PATH), recarregadas quando o arquivo muda
+    scrapers = None
+    _mtime_fontes = None
+    _lock_fontes = threading.Lock()
 
-class KoncursosScraper(Scraper):
-    @staticmethod
-    def scrape() -> List[Dict]:
-        url = 'https://www.konkursos.com.br/'
-        soup = Scraper.fazer_requisicao(url)
-        concursos = Scraper.extrair_concursos_generico(soup, 'konkursos', url, 80)
-        print(f"  ✓ {len(concursos)} concursos")
-        return concursos
+    @classmethod
+    def fontes(cls) -> List[FonteScraper]:
+        """Todas as fontes do registro, ativas ou não"""
+        with cls._lock_fontes:
+            try:
+                mtime = os.path.getmtime(Config.FONTES_PATH)
+            except OSError:
+                mtime = None
+            if cls.scrapers is None or (mtime is not None and mtime != cls._mtime_fontes):
+                cls.scrapers = carregar_fontes(Config.FONTES_PATH)
+                cls._mtime_fontes = mtime
+            return cls.scrapers
 
-class PciConcursosScraper(Scraper):
-    @staticmethod
-    def scrape() -> List[Dict]:
-        url = 'https://www.pciconcursos.com.br/'
-        soup = Scraper.fazer_requisicao(url)
-        concursos = Scraper.extrair_concursos_generico(soup, 'pciconcursos', url, 80)
-        print(f"  ✓ {len(concursos)} concursos")
-        return concursos
+    @classmethod
+    def fontes_ativas(cls) -> List[FonteScraper]:
+        return [fonte for fonte in cls.fontes() if fonte.ativo]
+
+    @classmethod
+    def fontes_vencidas(cls, execucoes: Dict[str, datetime], padrao: datetime = None,
+                        agora: datetime = None) -> List[FonteScraper]:
+        """Fontes ativas cujo intervalo já passou desde a última execução
+
+        'execucoes' mapeia o nome da fonte para a última execução (UTC), ou None
+        se ela falhou (vencida). Fontes sem registro estão vencidas (fonte nova
+        no registro); só enquanto 'execucoes' estiver vazio, isto é, na primeira
+        verificação depois da atualização do esquema, elas usam 'padrao' (a
+        última sincronização geral).
+        """
+        agora = agora or datetime.now(timezone.utc)
+        if execucoes:
+            padrao = None
+        return [
+            fonte for fonte in cls.fontes_ativas()
+            if fonte.vencida(execucoes.get(fonte.nome, padrao), agora)
+        ]
 
-class ConcursosScraper(Scraper):
     @staticmethod
-    def scrape() -> List[Dict]:
-        url = 'https://www.concursos.com.br/abertos'
-        soup = Scraper.fazer_requisicao(url)
-        concursos = Scraper.extrair_concursos_generico(soup, 'concursos.com.br', url, 80)
-        print(f"  ✓ {len(concursos)} concursos")
-        return concursos
+    def executar_scraper(scraper, progresso: Callable = None,
+                         paginas: Dict[str, Dict] = None) -> Tuple[List[Dict], Dict[str, Dict]]:
+        """Executar um scraper isolando suas falhas, retornando (concursos, páginas pendentes)
+
+        As páginas pendentes (ver Scraper.confirmar_paginas) são acumuladas em
+        'paginas', se informado, e ficam vazias se a fonte falhou, para que a
+        próxima sincronização volte a lê-las.
+        'progresso', se informado, é chamado com (nome, status, total, duração)
+        ao iniciar ('executando') e ao terminar ('ok', 'nao_modificado' ou 'erro').
+        """
+        nome = scraper.nome
+        fonte = getattr(scraper, 'fonte', nome)
+        if progresso:
+            progresso(nome, 'executando', 0, None)
+        inicio = time.monotonic()
+        status, concursos = 'ok', []
+        paginas = Scraper.iniciar_execucao(paginas)
+        try:
+            concursos = scraper.scrape()
+        except NaoModificado:
+            print(f"  ⏸️  {nome}: sem alterações desde a última sincronização")
+            status = 'nao_modificado'
+        except Exception as e:
+            print(f"  ❌ {nome}: {str(e)[:40]}")
+            ERROS_FONTE.incrementar(fonte=fonte, etapa='fonte')
+            status = 'erro'
+            paginas = {}
+        finally:
+            Scraper.encerrar_execucao()
+        duracao = time.monotonic() - inicio
+        SINCRONIZACOES_FONTE.incrementar(fonte=fonte, status=status)
+        DURACAO_FONTE.observar(duracao, fonte=fonte)
+        ULTIMA_SINCRONIZACAO_FONTE.definir(time.time(), fonte=fonte)
+        ULTIMOS_CONCURSOS_FONTE.definir(len(concursos), fonte=fonte)
+        if progresso:
+            progresso(nome, status, len(concursos), duracao)
+        return concursos, paginas
 
-# ============================================================
-# MANAGER DE SCRAPERS
-# ============================================================
+    @classmethod
+    def iterar_sequencial(cls, scrapers: List, progresso: Callable = None) -> Iterator[Tuple[List[Dict], Dict]]:
+        """Executar os scrapers um após o outro, entregando (concursos, páginas pendentes) de cada um"""
+        for scraper in scrapers:
+            print(f"\n📍 {scraper.nome}...")
+            yield cls.executar_scraper(scraper, progresso)
 
-class ScraperManager:
-    """Gerenciador de scrapers de concursos públicos"""
+    @classmethod
+    def iterar_concorrente(cls, scrapers: List, max_workers: int, deadline: float,
+                           progresso: Callable = None) -> Iterator[Tuple[int, Tuple[List[Dict], Dict]]]:
+        """Executar os scrapers em paralelo, entregando (índice, (concursos, páginas)) de cada um assim que termina
+
+        Scrapers que não terminarem dentro do prazo total são abandonados com
+        o resultado parcial: as páginas que já tinham sido lidas por inteiro e
+        seus concursos. O que eles fizerem depois (páginas, progresso) é ignorado.
+        """
+        executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix='scraper')
+        # Progresso de scrapers abandonados não chega mais ao chamador (um 'ok' atrasado
+        # sobrescreveria o 'prazo_excedido')
+        abandonados, trava = set(), threading.Lock()
+        def relatar(nome, status, total, duracao):
+            with trava:
+                if progresso and nome not in abandonados:
+                    progresso(nome, status, total, duracao)
+
+        parciais = [{} for _ in scrapers]
+        try:
+            futuros = {
+                executor.submit(cls.executar_scraper, scraper, relatar, parciais[i]): i
+                for i, scraper in enumerate(scrapers)
+            }
+            try:
+                for futuro in as_completed(list(futuros), timeout=deadline):
+                    yield futuros.pop(futuro), futuro.result()
+            except FuturesTimeout:
+                for futuro, i in futuros.items():
+                    futuro.cancel()
+                    nome = scrapers[i].nome
+                    with trava:
+                        abandonados.add(nome)
+                        lidas = {url: pagina for url, pagina in list(parciais[i].items())
+                                 if pagina.get('concursos') is not None}
+                    concursos = [c for pagina in lidas.values() for c in pagina['concursos']]
+                    print(f"  ⏱️  {nome}: prazo de {deadline}s excedido ({len(lidas)} página(s) lida(s))")
+                    SINCRONIZACOES_FONTE.incrementar(fonte=getattr(scrapers[i], 'fonte', nome), status='prazo_excedido')
+                    if progresso:
+                        progresso(nome, 'prazo_excedido', len(concursos), None)
+                    yield i, (concursos, lidas)
+        finally:
+            # Não aguarda scrapers que estouraram o prazo; eles terminam pelo timeout da requisição
+            executor.shutdown(wait=False, cancel_futures=True)
 
-    scrapers = [
-        ConcursosNoBrasilScraper,
-        QConcursosScraper,
-        AcheConcursosScraper,
-        CebrasepScraper,
-        VunespScraper,
-        FGVScraper,
-        IbfcConcursosScraper,
-        GlobalConcursosScraper,
-        JCConcursosScraper,
-        KoncursosScraper,
-        PciConcursosScraper,
-        ConcursosScraper,
-    ]
+    @staticmethod
+    def deduplicar(concursos: List[Dict], vistos: set) -> List[Dict]:
+        """Remover concursos já vistos (mesmo título e fonte), atualizando 'vistos'
+
+        As cópias de um concurso em várias páginas da mesma lista viram uma
+        só, com todas essas páginas em 'paginas' (ver sincronizar_concursos).
+        """
+        unicos, novos = [], {}
+        for concurso in concursos:
+            chave = f"{concurso.get('titulo')}_{concurso.get('fonte')}"
+            if chave in vistos:
+                continue
+            if chave in novos:
+                paginas = novos[chave]['paginas']
+                if concurso.get('link_edital') not in paginas:
+                    paginas.append(concurso.get('link_edital'))
+                continue
+            concurso['paginas'] = [concurso.get('link_edital')]
+            novos[chave] = concurso
+            unicos.append(concurso)
+        vistos.update(novos)
+        return unicos
 
-    @classmethod
-    def scrape_all(cls) -> List[Dict]:
-        """Executar todos os scrapers"""
-        todos_concursos = []
+    @staticmethod
+    def imprimir_inicio(total_fontes: int):
         print("\n" + "="*70)
         print("🔄 SINCRONIZAÇÃO DE CONCURSOS PÚBLICOS ABERTOS")
         print("="*70)
-        print(f"📊 Total de fontes: {len(cls.scrapers)} sites")
+        print(f"📊 Total de fontes: {total_fontes} sites")
         print("="*70)
 
-        for scraper_class in cls.scrapers:
-            print(f"\n📍 {scraper_class.__name__}...")
-            try:
-                concursos = scraper_class.scrape()
-                todos_concursos.extend(concursos)
-            except Exception as e:
-                print(f"  ❌ Erro: {str(e)[:40]}")
-
-        # Remover duplicatas
-        concursos_unicos = []
-        titulos_vistos = set()
-        for concurso in todos_concursos:
-            chave = f"{concurso.get('titulo')}_{concurso.get('fonte')}"
-            if chave not in titulos_vistos:
-                titulos_vistos.add(chave)
-                concursos_unicos.append(concurso)
-
+    @staticmethod
+    def imprimir_fim(total: int, total_fontes: int, inicio: float):
         print("\n" + "="*70)
         print(f"✅ SINCRONIZAÇÃO CONCLUÍDA")
-        print(f"  📊 Total: {len(concursos_unicos)} concursos únicos")
-        print(f"  🌐 Fontes ativas: {len(cls.scrapers)} agregadores")
+        print(f"  📊 Total: {total} concursos únicos")
+        print(f"  🌐 Fontes sincronizadas: {total_fontes}")
+        print(f"  ⏱️  Duração: {time.monotonic() - inicio:.1f}s")
         print(f"  🗓️  {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print("="*70 + "\n")
 
+    @classmethod
+    def scrape_stream(cls, scrapers: List = None, concorrente: bool = None, max_workers: int = None,
+                      deadline: float = None, progresso: Callable = None) -> Iterator[Tuple[List[Dict], Dict[str, str]]]:
+        """Executar os scrapers (padrão: fontes ativas) entregando os concursos de cada fonte assim que ela termina
+
+        Cada item é (concursos já deduplicados, páginas lidas {url: fonte}) de
+        um scraper, na ordem de conclusão; uma fonte que leu páginas sem achar
+        nenhum concurso também é entregue, para que os ausentes sejam
+        encerrados. Só o conjunto de chaves vistas é mantido entre as fontes. O estado das
+        páginas da fonte só é gravado quando o consumidor pede o próximo item,
+        isto é, depois de ter salvo o lote: se ele falhar antes, as páginas
+        serão lidas de novo na próxima sincronização.
+        """
+        if scrapers is None:
+            scrapers = cls.fontes_ativas()
+        if concorrente is None:
+            concorrente = Config.SCRAPE_CONCORRENTE
+        cls.imprimir_inicio(len(scrapers))
+
+        inicio = time.monotonic()
+        if concorrente:
+            resultados = cls.iterar_concorrente(
+                scrapers,
+                max_workers or Config.SCRAPE_MAX_WORKERS,
+                deadline or Config.SCRAPE_DEADLINE_SECONDS,
+                progresso
+            )
+        else:
+            resultados = enumerate(cls.iterar_sequencial(scrapers, progresso))
+
+        vistos = set()
+        for i, (concursos, paginas) in resultados:
+            unicos = cls.deduplicar(concursos, vistos)
+            fonte = getattr(scrapers[i], 'fonte', scrapers[i].nome)
+            lidas = {url: fonte for url, pagina in paginas.items() if pagina.get('concursos') is not None}
+            if unicos or lidas:
+                yield unicos, lidas
+            Scraper.confirmar_paginas(paginas)
+
+        cls.imprimir_fim(len(vistos), len(scrapers), inicio)
+
+    @classmethod
+    def scrape_all(cls, scrapers: List = None, concorrente: bool = None, max_workers: int = None,
+                   deadline: float = None, progresso: Callable = None) -> List[Dict]:
+        """Executar os scrapers (padrão: fontes ativas)"""
+        if scrapers is None:
+            scrapers = cls.fontes_ativas()
+        if concorrente is None:
+            concorrente = Config.SCRAPE_CONCORRENTE
+        cls.imprimir_inicio(len(scrapers))
+
+        inicio = time.monotonic()
+        if concorrente:
+            resultados = [([], {}) for _ in scrapers]
+            for i, resultado in cls.iterar_concorrente(
+                scrapers,
+                max_workers or Config.SCRAPE_MAX_WORKERS,
+                deadline or Config.SCRAPE_DEADLINE_SECONDS,
+                progresso
+            ):
+                resultados[i] = resultado
+        else:
+            resultados = cls.iterar_sequencial(scrapers, progresso)
+
+        # Remover duplicatas (na ordem do registro, independente da ordem de conclusão)
+        vistos = set()
+        concursos_unicos = []
+        for concursos, paginas in resultados:
+            concursos_unicos.extend(cls.deduplicar(concursos, vistos))
+            Scraper.confirmar_paginas(paginas)
+
+        cls.imprimir_fim(len(concursos_unicos), len(scrapers), inicio)
+
         return concursos_unicos
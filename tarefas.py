@@ -0,0 +1,112 @@
+import copy
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import Callable, Dict, Tuple
+
+
+class GerenciadorSincronizacao:
+    """Fila single-flight para a sincronização de concursos
+
+    Só existe uma sincronização em andamento por vez: disparos feitos enquanto
+    ela roda (POST manual, agendador) são agrupados no mesmo job em vez de
+    iniciar outra execução. Cada job guarda o progresso por scraper, tempos e
+    contagens, consultáveis pelo id.
+    """
+
+    def __init__(self, sincronizar: Callable, max_historico: int = 20):
+        # sincronizar(progresso, **parametros) executa a sincronização e retorna o resumo das contagens
+        self.sincronizar = sincronizar
+        self.max_historico = max_historico
+        self._jobs = OrderedDict()
+        self._atual = None
+        self._lock = threading.Lock()
+
+    def disparar(self, origem: str = 'manual', **parametros) -> Tuple[Dict, bool]:
+        """Iniciar uma sincronização, ou agrupar no job em andamento
+
+        'parametros' são repassados a sincronizar (ignorados se o disparo for
+        agrupado). Retorna uma cópia do job e se ele foi criado agora (False = agrupado).
+        """
+        with self._lock:
+            if self._atual is not None:
+                job = self._jobs[self._atual]
+                job['disparos_agrupados'] += 1
+                return copy.deepcopy(job), False
+
+            job_id = uuid.uuid4().hex
+            job = {
+                'id': job_id,
+                'status': 'pendente',
+                'origem': origem,
+                'parametros': parametros,
+                'disparos_agrupados': 0,
+                'criado_em': datetime.now().isoformat(),
+                'inicio': None,
+                'fim': None,
+                'duracao_segundos': None,
+                'fontes': {},
+                'contagens': None,
+                'erro': None,
+            }
+            self._jobs[job_id] = job
+            self._atual = job_id
+            while len(self._jobs) > self.max_historico:
+                self._jobs.popitem(last=False)
+
+        threading.Thread(target=self._executar, args=(job_id,), name=f'sincronizacao-{job_id[:8]}',
+                         daemon=True).start()
+        with self._lock:
+            return copy.deepcopy(self._jobs[job_id]), True
+
+    def obter(self, job_id: str) -> Dict:
+        """Obter uma cópia do job (None se não existir mais no histórico)"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return copy.deepcopy(job) if job else None
+
+    def em_andamento(self) -> bool:
+        """Indicar se há uma sincronização rodando"""
+        with self._lock:
+            return self._atual is not None
+
+    def _progresso(self, job_id: str, nome: str, status: str, total: int, duracao: float):
+        """Registrar o andamento de um scraper no job"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return
+            job['fontes'][nome] = {
+                'status': status,
+                'total': total,
+                'duracao_segundos': round(duracao, 3) if duracao is not None else None,
+            }
+
+    def _executar(self, job_id: str):
+        """Rodar a sincronização em background e registrar o resultado"""
+        with self._lock:
+            job = self._jobs[job_id]
+            job['status'] = 'executando'
+            job['inicio'] = datetime.now().isoformat()
+        inicio = time.monotonic()
+
+        status, contagens, erro = 'concluido', None, None
+        try:
+            contagens = self.sincronizar(
+                lambda nome, st, total, duracao: self._progresso(job_id, nome, st, total, duracao),
+                **job['parametros']
+            )
+            if contagens and contagens.get('erro'):
+                status, erro = 'erro', contagens['erro']
+        except Exception as e:
+            status, erro = 'erro', str(e)
+
+        with self._lock:
+            job['status'] = status
+            job['contagens'] = contagens
+            job['erro'] = erro
+            job['fim'] = datetime.now().isoformat()
+            job['duracao_segundos'] = round(time.monotonic() - inicio, 3)
+            self._atual = None
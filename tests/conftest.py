@@ -0,0 +1,5 @@
+import os
+import tempfile
+
+# O app abre Config.DATABASE_PATH ao ser importado: os testes nunca tocam o concursos.db do repositório
+os.environ['DATABASE_PATH'] = os.path.join(tempfile.mkdtemp(prefix='concursos-testes-'), 'concursos.db')
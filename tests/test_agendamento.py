@@ -0,0 +1,32 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from scrapers import FonteScraper, ScraperManager
+
+AGORA = datetime(2026, 3, 1, 12, tzinfo=timezone.utc)
+
+
+@pytest.fixture(autouse=True)
+def fontes(monkeypatch):
+    registro = [FonteScraper('antiga', ['http://a/'], intervalo_horas=12),
+                FonteScraper('nova', ['http://b/'], intervalo_horas=12)]
+    monkeypatch.setattr(ScraperManager, 'fontes_ativas', classmethod(lambda cls: registro))
+
+
+def vencidas(execucoes, padrao):
+    return [f.nome for f in ScraperManager.fontes_vencidas(execucoes, padrao, AGORA)]
+
+
+def test_fonte_nova_no_registro_esta_vencida():
+    ultima = AGORA - timedelta(hours=1)
+    assert vencidas({'antiga': ultima}, padrao=ultima) == ['nova']
+
+
+def test_sem_execucoes_registradas_vale_a_ultima_sincronizacao_geral():
+    assert vencidas({}, padrao=AGORA - timedelta(hours=1)) == []
+    assert vencidas({}, padrao=AGORA - timedelta(hours=13)) == ['antiga', 'nova']
+
+
+def test_fonte_que_falhou_esta_vencida():
+    assert vencidas({'antiga': None, 'nova': AGORA}, padrao=AGORA) == ['antiga']
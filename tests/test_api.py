@@ -0,0 +1,162 @@
+import gzip
+import threading
+from datetime import datetime
+
+import pytest
+from flask import jsonify
+
+import app as aplicacao
+import respostas
+from cache import CacheRespostas
+from database import Database
+from scrapers import FonteScraper, Scraper, ScraperManager
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    banco = Database(str(tmp_path / 'concursos.db'))
+    monkeypatch.setattr(aplicacao, 'db', banco)
+    monkeypatch.setattr(aplicacao, 'cache', CacheRespostas(100))
+    yield banco
+    banco.fechar()
+
+
+@pytest.fixture
+def cliente(db):
+    return aplicacao.app.test_client()
+
+
+def em_outra_thread(funcao):
+    """Executar como o servidor threaded: cada requisição na sua própria thread"""
+    resultado = []
+    thread = threading.Thread(target=lambda: resultado.append(funcao()))
+    thread.start()
+    thread.join()
+    return resultado[0]
+
+
+def test_exportar_atualizacoes_devolve_a_conexao_ao_pool(db, cliente, monkeypatch):
+    db.registrar_atualizacao('local', 2, 2, 0)
+    abertas = []
+    nova_conexao = db._nova_conexao
+    monkeypatch.setattr(db, '_nova_conexao', lambda: abertas.append(1) or nova_conexao())
+
+    for _ in range(5):
+        corpo = em_outra_thread(lambda: cliente.get('/api/export?tabela=atualizacoes').get_data(as_text=True))
+        assert corpo.splitlines()[1].split(',')[1] == 'local'
+    assert len(abertas) <= 1
+
+
+def test_etag_do_detalhe_muda_com_as_fontes_relacionadas(db, cliente):
+    titulo = "Edital Prefeitura de Curitiba - PR 04/2025"
+    db.inserir_concursos([{'titulo': titulo, 'organizacao': 'Prefeitura', 'fonte': fonte,
+                           'link_edital': f'https://{fonte}/1'} for fonte in ('a', 'b')])
+    with db.conexao() as conn:
+        conn.execute("UPDATE concursos SET canonico_id = 1")
+
+    resposta = cliente.get('/api/concursos/1')
+    etag = resposta.headers['ETag']
+    assert cliente.get('/api/concursos/1', headers={'If-None-Match': etag}).status_code == 304
+
+    # Só a outra linha do grupo muda; a data_atualizacao do concurso 1 fica igual
+    with db.conexao() as conn:
+        conn.execute("UPDATE concursos SET link_edital = 'https://b/2' WHERE id = 2")
+    resposta = cliente.get('/api/concursos/1', headers={'If-None-Match': etag})
+    assert resposta.status_code == 200
+    assert resposta.get_json()['fontes_relacionadas'][0]['link_edital'] == 'https://b/2'
+
+
+def paginas_da_listagem(cliente, consulta):
+    """Seguir proximo_cursor até o fim, retornando os ids na ordem recebida"""
+    ids, cursor = [], None
+    while True:
+        resposta = cliente.get(f"/api/concursos?{consulta}" + (f"&cursor={cursor}" if cursor else ''))
+        assert resposta.status_code == 200
+        corpo = resposta.get_json()
+        ids += [c['id'] for c in corpo['concursos']]
+        cursor = corpo['proximo_cursor']
+        if not cursor:
+            return ids
+
+
+@pytest.mark.parametrize('ordem, coluna', [('data', 'data_publicacao'), ('salario', 'salario_max')])
+def test_paginacao_por_cursor_sem_repetir_nem_pular(db, cliente, ordem, coluna):
+    # Valores repetidos na chave de ordem e linhas sem valor (que vêm no fim)
+    datas = ['2025-03-01', '2025-02-01', '2025-02-01', None]
+    db.inserir_concursos([{
+        'titulo': f"Edital Prefeitura de Cidade {i} - PR 01/2025", 'organizacao': f'Prefeitura {i}', 'fonte': 'a',
+        'data_publicacao': datas[i % 4], 'salario_max': [3000.0, None, 5000.0][i % 3],
+    } for i in range(23)])
+    linhas = db.conexao().execute(f"SELECT id, {coluna} FROM concursos").fetchall()
+    esperados = ([i for _, i in sorted(((v, i) for i, v in linhas if v is not None), reverse=True)]
+                 + sorted((i for i, v in linhas if v is None), reverse=True))
+
+    assert paginas_da_listagem(cliente, f"limit=5&fields=titulo&ordem={ordem}") == esperados
+
+
+def test_cursor_com_chave_que_nao_e_escalar_e_recusado(cliente):
+    cursor = Database.codificar_cursor([['2025-01-01'], 3])
+    assert cliente.get(f"/api/concursos?cursor={cursor}").status_code == 400
+
+
+def concurso(titulo, fonte='a'):
+    return {'titulo': titulo, 'organizacao': titulo.split('-')[0].strip(), 'fonte': fonte,
+            'link_edital': f'https://{fonte}/', 'vagas': 10, 'status': 'open'}
+
+
+def test_cache_e_etag_valem_ate_a_proxima_sincronizacao(db, cliente, monkeypatch):
+    db.inserir_concursos([concurso("Edital Prefeitura de Curitiba - PR 04/2025")])
+    resposta = cliente.get('/api/concursos?fields=titulo')
+    etag = resposta.headers['ETag']
+    assert len(resposta.get_json()['concursos']) == 1
+    assert cliente.get('/api/concursos?fields=titulo', headers={'If-None-Match': etag}).status_code == 304
+
+    # Fora de uma sincronização o banco não é consultado de novo: a resposta vem do cache
+    db.inserir_concursos([concurso("Edital Prefeitura de Londrina - PR 11/2025")])
+    assert len(cliente.get('/api/concursos?fields=titulo').get_json()['concursos']) == 1
+
+    novo = concurso("Edital Câmara Municipal de Campinas - SP 02/2025")
+    monkeypatch.setattr(Scraper, 'estado_paginas', Scraper.estado_paginas)
+    monkeypatch.setattr(ScraperManager, 'fontes_ativas', classmethod(lambda cls: [FonteScraper('a', ['https://a/'])]))
+    monkeypatch.setattr(ScraperManager, 'scrape_stream',
+                        classmethod(lambda cls, fontes, progresso=None: iter([([novo], {'https://a/': 'a'})])))
+    assert aplicacao.atualizar_concursos()['novos'] == 1
+
+    resposta = cliente.get('/api/concursos?fields=titulo', headers={'If-None-Match': etag})
+    assert resposta.status_code == 200
+    assert resposta.headers['ETag'] != etag
+    assert len(resposta.get_json()['concursos']) == 3
+
+
+def corpo_do_jsonify(obj) -> bytes:
+    """Corpo que o jsonify geraria para obj (sem a quebra de linha final)"""
+    with aplicacao.app.app_context():
+        return jsonify(obj).get_data().rstrip(b'\n')
+
+
+class Relogio(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2025, 5, 1, 12, 0)
+
+
+@pytest.mark.parametrize('com_orjson', [True, False])
+def test_corpo_em_fluxo_igual_ao_do_jsonify(db, cliente, monkeypatch, com_orjson):
+    if not com_orjson:
+        monkeypatch.setattr(respostas, 'orjson', None)
+    monkeypatch.setattr(aplicacao, 'datetime', Relogio)
+    db.inserir_concursos([dict(concurso(titulo), data_publicacao='2025-03-01', salario_max=4500.5)
+                          for titulo in ("Edital Câmara Municipal de Campinas - SP 02/2025",
+                                         "Edital Prefeitura de Curitiba - PR 04/2025")])
+    concursos = cliente.get('/api/concursos?limit=1000').get_json()['concursos']
+    esperado = corpo_do_jsonify({'concursos': concursos, 'total': 2, 'timestamp': Relogio.now().isoformat()})
+
+    resposta = cliente.get('/api/concursos?todos=1')
+    assert resposta.is_streamed
+    assert resposta.get_data() == esperado
+    comprimida = cliente.get('/api/concursos?todos=1', headers={'Accept-Encoding': 'gzip'})
+    assert comprimida.headers['Content-Encoding'] == 'gzip'
+    assert gzip.decompress(comprimida.get_data()) == esperado
+
+    linhas = cliente.get('/api/concursos?formato=ndjson').get_data()
+    assert linhas == b''.join(corpo_do_jsonify(c) + b'\n' for c in concursos)
@@ -0,0 +1,63 @@
+from database import Database
+from deduplicacao import agrupar
+
+TITULO = "Prefeitura de Campinas abre concurso para Agente Administrativo"
+
+
+def grupos(canonicos):
+    por_canonico = {}
+    for i, canonico in canonicos.items():
+        por_canonico.setdefault(canonico, set()).add(i)
+    return sorted(map(sorted, por_canonico.values()))
+
+
+def test_agrupa_titulos_quase_iguais_de_fontes_diferentes():
+    canonicos = agrupar([
+        {'id': 1, 'titulo': TITULO, 'estado': 'SP', 'status': 'open'},
+        {'id': 2, 'titulo': f"{TITULO} - SP", 'estado': 'SP', 'status': 'open', 'banca': 'FGV'},
+        {'id': 3, 'titulo': "Tribunal de Justiça de Goiás abre seleção para Analista", 'estado': 'GO'},
+    ])
+    # O mais completo (com banca) é o canônico
+    assert canonicos == {1: 2, 2: 2, 3: 3}
+
+
+def test_registro_sem_uf_nao_une_grupos_de_ufs_diferentes():
+    canonicos = agrupar([
+        {'id': 1, 'titulo': TITULO, 'estado': ''},
+        {'id': 2, 'titulo': TITULO, 'estado': 'SP'},
+        {'id': 3, 'titulo': TITULO, 'estado': 'GO'},
+    ])
+    assert not any({2, 3} <= set(grupo) for grupo in grupos(canonicos))
+    assert canonicos[3] == 3
+
+
+def test_titulo_sem_numeros_nao_une_editais_de_numeros_diferentes():
+    canonicos = agrupar([
+        {'id': 1, 'titulo': f"{TITULO} 2024", 'estado': 'SP'},
+        {'id': 2, 'titulo': TITULO, 'estado': 'SP'},
+        {'id': 3, 'titulo': f"{TITULO} 2025", 'estado': 'SP'},
+    ])
+    assert not any({1, 3} <= set(grupo) for grupo in grupos(canonicos))
+
+
+def test_agrupamento_incremental_no_banco(tmp_path):
+    db = Database(str(tmp_path / 'concursos.db'))
+    concurso = {'titulo': TITULO, 'organizacao': 'Prefeitura de Campinas', 'estado': 'SP', 'fonte': 'A'}
+    db.inserir_concursos([concurso, {'titulo': "Tribunal de Justiça de Goiás abre seleção para Analista",
+                                     'organizacao': 'TJGO', 'estado': 'GO', 'fonte': 'A'}])
+    assert db.agrupar_duplicatas() == 0
+
+    # A duplicata que chega depois entra no grupo do já gravado
+    db.inserir_concursos([{**concurso, 'titulo': f"{TITULO} - SP", 'fonte': 'B', 'banca': 'FGV'}])
+    assert db.agrupar_duplicatas() == 1
+    ids = dict(db.conexao().execute("SELECT fonte, id FROM concursos WHERE estado = 'SP'").fetchall())
+    canonicos = dict(db.conexao().execute("SELECT id, canonico_id FROM concursos").fetchall())
+    assert canonicos[ids['A']] == canonicos[ids['B']] == ids['B']
+
+    # A linha alterada volta a ser comparada e sai do grupo ao mudar de UF
+    db.inserir_concursos([{**concurso, 'estado': 'RJ'}])
+    assert db.agrupar_duplicatas() == 0
+    assert db.conexao().execute(
+        "SELECT canonico_id FROM concursos WHERE id = ?", (ids['A'],)
+    ).fetchone()[0] == ids['A']
+    db.fechar()
@@ -0,0 +1,83 @@
+import random
+import re
+from typing import List
+
+import pytest
+
+from benchmarks.sintetico import BANCAS, CARGOS, CIDADES, UFS
+from enriquecimento import enriquecer
+
+TITULO = "Prefeitura abre concurso público"
+PALAVRAS_VAGA = ('vagas', 'vaga', 'Vagas', 'VAGAS', 'postos', 'lugares', 'selecionados', 'aprovados', 'vagabundo')
+TRECHOS = ('Inscrições até 15/03', 'Edital nº 01/2024', 'edital 3/2025', 'Salário R$ 3.000,00',
+           'salário de R$ 1.500,00 a R$ 8.000,00', 'até R$ 25 mil', 'taxa de R$ 80,00', 'R$ 12.345,67',
+           'nível médio e superior', 'ensino fundamental', 'cadastro reserva', 'prova em 2 etapas',
+           'banca', 'Prefeitura', 'validade de 2 anos', 'jornada 40h', '(11) 98765-4321', '3,5 mil inscritos')
+
+
+# Cópia congelada do extrair_numero original (antes da passada única de enriquecer)
+def extrair_numero_original(texto: str) -> int:
+    try:
+        match = re.search(r'(\d+)\s*(?:vaga|posto|lugar|selecionado|aprovado)', texto, re.IGNORECASE)
+        if match:
+            num = int(match.group(1))
+            if 1 <= num <= 10000:
+                return num
+        match = re.search(r'\d+', texto.replace('.', '').replace(',', ''))
+        if match:
+            num = int(match.group())
+            if num > 10000 or num < 1:
+                return 0
+            return num
+    except Exception:
+        pass
+    return 1
+
+
+def trecho_aleatorio(gerador: random.Random) -> str:
+    sorteio = gerador.random()
+    if sorteio < 0.3:
+        quantidade = gerador.choice((0, 1, 2, 15, 120, 9999, 10000, 10001, 15000, 250000))
+        return f"{quantidade}{gerador.choice(('', ' ', '  '))}{gerador.choice(PALAVRAS_VAGA)}"
+    if sorteio < 0.4:
+        return str(gerador.choice((0, 7, 2024, 10000, 10001, 99999)))
+    if sorteio < 0.5:
+        return gerador.choice(CARGOS + CIDADES + UFS + BANCAS)
+    return gerador.choice(TRECHOS)
+
+
+def corpus_contextos(quantidade: int = 5000, semente: int = 25) -> List[str]:
+    """Contextos de anúncio: trechos com vagas, salários, datas, números soltos e texto sem número"""
+    gerador = random.Random(semente)
+    contextos = list(TRECHOS)
+    while len(contextos) < quantidade:
+        separador = gerador.choice((', ', '. ', ' - ', '; '))
+        contextos.append(separador.join(trecho_aleatorio(gerador) for _ in range(gerador.randint(1, 5))))
+    return contextos
+
+
+@pytest.fixture(scope='module')
+def corpus():
+    return corpus_contextos()
+
+
+def test_vagas_igual_ao_extrair_numero_original(corpus):
+    diferentes = [c for c in corpus if enriquecer(TITULO, c)['vagas'] != extrair_numero_original(c)]
+    assert diferentes == []
+    # Sem contexto, as vagas vêm do próprio título
+    diferentes = [c for c in corpus if enriquecer(c)['vagas'] != extrair_numero_original(c)]
+    assert diferentes == []
+
+
+@pytest.mark.parametrize('contexto, vagas', [
+    ('15000 vagas', 0),
+    ('Edital com 10001 vagas', 0),
+    ('Salário R$ 3.000,00', 0),
+    ('Salário R$ 3.000,00, 20 vagas', 20),
+    ('até R$ 25 mil', 25),
+    ('cadastro reserva', 1),
+    # Separador de milhar na contagem (o original lia só '500')
+    ('1.500 vagas', 1500),
+])
+def test_vagas(contexto, vagas):
+    assert enriquecer(TITULO, contexto)['vagas'] == vagas
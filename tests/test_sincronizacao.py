@@ -0,0 +1,156 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from config import Config
+from database import Database
+from scrapers import FonteInacessivel, FonteScraper, Scraper, ScraperManager
+
+CURITIBA = "Edital Prefeitura de Curitiba - PR 04/2025"
+LONDRINA = "Edital Prefeitura de Londrina - PR 11/2025"
+CAMPINAS = "Edital Câmara Municipal de Campinas - SP 02/2025"
+
+
+def pagina(*titulos, links=()):
+    """HTML de listagem no formato dos agregadores: título, vagas e links para outras listagens"""
+    itens = ''.join(f'<div class="item"><p>{titulo}</p><p>{120 + i} vagas</p></div>'
+                    for i, titulo in enumerate(titulos))
+    ancoras = ''.join(f'<a href="{link}">{texto}</a>' for link, texto in links)
+    return f'<html><body><nav>{ancoras}</nav><main>{itens}</main></body></html>'
+
+
+@pytest.fixture
+def site():
+    """Servidor HTTP local; o conteúdo (e o atraso) de cada caminho pode mudar entre as sincronizações"""
+    paginas, atrasos = {}, {}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(atrasos.get(self.path, 0))
+            corpo = paginas.get(self.path)
+            if corpo is None:
+                self.send_error(404)
+                return
+            corpo = corpo.encode('utf-8')
+            try:
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(corpo)))
+                self.end_headers()
+                self.wfile.write(corpo)
+            except OSError:
+                pass  # o cliente desistiu (timeout)
+
+        def log_message(self, *args):
+            pass
+
+    servidor = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{servidor.server_port}", paginas, atrasos
+    servidor.shutdown()
+    servidor.server_close()
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    banco = Database(str(tmp_path / 'concursos.db'))
+    monkeypatch.setattr(Scraper, 'estado_paginas', banco)
+    monkeypatch.setattr(Config, 'CRAWL_INTERVALO_DOMINIO_SECONDS', 0)
+    yield banco
+    banco.fechar()
+
+
+def sincronizar(db, url, contagens=None):
+    """Uma sincronização da fonte, como em atualizar_concursos; retorna {título: status}"""
+    fonte = FonteScraper('local', [url], profundidade=1)
+    for lote, lidas in ScraperManager.scrape_stream([fonte], concorrente=False):
+        for c in db.sincronizar_concursos(lote, lidas).values():
+            if contagens is not None:
+                contagens.append(c)
+    return dict(db.conexao().execute("SELECT titulo, status FROM concursos").fetchall())
+
+
+def test_pagina_que_esvaziou_encerra_os_concursos(site, db):
+    base, paginas, _ = site
+    paginas['/'] = pagina(CURITIBA, LONDRINA)
+    assert sincronizar(db, base + '/') == {CURITIBA: 'open', LONDRINA: 'open'}
+
+    paginas['/'] = pagina()
+    assert sincronizar(db, base + '/') == {CURITIBA: 'closed', LONDRINA: 'closed'}
+
+
+def test_concurso_listado_em_pagina_nao_modificada_continua_aberto(site, db):
+    base, paginas, _ = site
+    estado = [('/estado/sp', 'SP')]
+    paginas['/'] = pagina(CAMPINAS, CURITIBA, links=estado)
+    paginas['/estado/sp'] = pagina(CAMPINAS)
+    assert sincronizar(db, base + '/') == {CAMPINAS: 'open', CURITIBA: 'open'}
+
+    # Sai da página inicial, mas a de SP (não modificada) ainda o lista
+    paginas['/'] = pagina(CURITIBA, links=estado)
+    assert sincronizar(db, base + '/') == {CAMPINAS: 'open', CURITIBA: 'open'}
+
+    paginas['/estado/sp'] = pagina()
+    assert sincronizar(db, base + '/') == {CAMPINAS: 'closed', CURITIBA: 'open'}
+
+
+def test_link_edital_nao_alterna_entre_paginas(site, db):
+    base, paginas, _ = site
+    estado = [('/estado/sp', 'SP')]
+    paginas['/'] = pagina(CAMPINAS, links=estado)
+    paginas['/estado/sp'] = pagina(CAMPINAS, CURITIBA)
+    sincronizar(db, base + '/')
+
+    # Só a página de SP muda, depois só a inicial: cada concurso segue com o link que já tinha
+    for caminho, conteudo in (('/estado/sp', pagina(CAMPINAS, LONDRINA)),
+                              ('/', pagina(CAMPINAS, LONDRINA, links=estado))):
+        paginas[caminho] = conteudo
+        contagens = []
+        sincronizar(db, base + '/', contagens)
+        links = dict(db.conexao().execute("SELECT titulo, link_edital FROM concursos").fetchall())
+        assert links[CAMPINAS] == base + '/'
+        assert links.get(LONDRINA, base + '/estado/sp') == base + '/estado/sp'
+        assert sum(c['atualizados'] for c in contagens) == 0
+
+
+def test_requisicao_lenta_respeita_o_tempo_do_rastreamento(site, monkeypatch):
+    base, paginas, atrasos = site
+    paginas['/'], atrasos['/'] = pagina(CURITIBA), 30
+    monkeypatch.setattr(Config, 'CRAWL_TEMPO_MAXIMO_SECONDS', 3)
+    monkeypatch.setattr(Config, 'HTTP_RETRIES', 1)
+    monkeypatch.setattr(Config, 'HTTP_BACKOFF', 0)
+    monkeypatch.setattr(Config, 'CRAWL_INTERVALO_DOMINIO_SECONDS', 0)
+    monkeypatch.setattr(Scraper, '_sessao', None)
+    inicio = time.monotonic()
+    with pytest.raises(FonteInacessivel):
+        # timeout da fonte (10s por tentativa) maior que o tempo de rastreamento
+        Scraper.rastrear(base + '/', 'local', timeout=10)
+    assert time.monotonic() - inicio < Config.CRAWL_TEMPO_MAXIMO_SECONDS + 1
+
+
+def test_fonte_abandonada_no_prazo_entrega_as_paginas_lidas(site, db):
+    base, paginas, atrasos = site
+    paginas['/'] = pagina(CURITIBA, links=[('/estado/sp', 'SP')])
+    paginas['/estado/sp'], atrasos['/estado/sp'] = pagina(CAMPINAS), 2
+    terminou = threading.Event()
+
+    class Fonte(FonteScraper):
+        def scrape(self):
+            try:
+                return super().scrape()
+            finally:
+                terminou.set()
+
+    eventos = []
+    lotes = list(ScraperManager.scrape_stream([Fonte('local', [base + '/'], profundidade=1)], concorrente=True,
+                                              deadline=1, progresso=lambda *args: eventos.append(args[:2])))
+    # A página inicial já lida vem no resultado parcial; a de SP, ainda em andamento, não
+    assert [[c['titulo'] for c in lote] for lote, _ in lotes] == [[CURITIBA]]
+    assert list(lotes[0][1]) == [base + '/']
+
+    # O scraper abandonado termina depois, mas o progresso dele não sobrescreve o prazo excedido
+    assert terminou.wait(10)
+    time.sleep(0.1)
+    assert eventos == [('local', 'executando'), ('local', 'prazo_excedido')]
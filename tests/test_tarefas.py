@@ -0,0 +1,58 @@
+import threading
+import time
+
+from tarefas import GerenciadorSincronizacao
+
+
+def aguardar(condicao, limite=5):
+    fim = time.monotonic() + limite
+    while not condicao():
+        assert time.monotonic() < fim
+        time.sleep(0.01)
+
+
+def test_disparos_durante_a_sincronizacao_sao_agrupados():
+    liberar = threading.Event()
+    execucoes = []
+
+    def sincronizar(progresso, **parametros):
+        execucoes.append(parametros)
+        progresso('local', 'executando', 0, None)
+        liberar.wait(5)
+        return {'novos': 1}
+
+    gerenciador = GerenciadorSincronizacao(sincronizar)
+    job, criado = gerenciador.disparar('manual', fontes=['local'])
+    assert criado
+    aguardar(lambda: gerenciador.obter(job['id'])['fontes'])
+
+    agrupado, criado = gerenciador.disparar('agendador')
+    assert not criado
+    assert agrupado['id'] == job['id']
+    assert agrupado['disparos_agrupados'] == 1
+    assert gerenciador.em_andamento()
+
+    liberar.set()
+    aguardar(lambda: not gerenciador.em_andamento())
+    final = gerenciador.obter(job['id'])
+    assert (final['status'], final['contagens'], final['disparos_agrupados']) == ('concluido', {'novos': 1}, 1)
+    # Só uma execução, com os parâmetros do disparo que criou o job
+    assert execucoes == [{'fontes': ['local']}]
+
+    # Terminado o job, o próximo disparo inicia outra sincronização
+    novo, criado = gerenciador.disparar('agendador')
+    assert criado and novo['id'] != job['id']
+    aguardar(lambda: not gerenciador.em_andamento())
+    assert len(execucoes) == 2
+
+
+def test_falha_da_sincronizacao_fica_no_job_e_libera_a_fila():
+    def sincronizar(progresso):
+        raise RuntimeError('banco indisponível')
+
+    gerenciador = GerenciadorSincronizacao(sincronizar)
+    job, _ = gerenciador.disparar()
+    aguardar(lambda: not gerenciador.em_andamento())
+    final = gerenciador.obter(job['id'])
+    assert (final['status'], final['erro']) == ('erro', 'banco indisponível')
+    assert gerenciador.disparar()[1]
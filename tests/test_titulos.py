@@ -0,0 +1,129 @@
+import random
+import re
+from typing import List
+
+import pytest
+
+from benchmarks.sintetico import CARGOS, CIDADES, ORGAOS, RUIDO, UFS, titulo
+from scrapers import PALAVRAS_CONCURSO, PALAVRAS_INVALIDAS, Scraper
+
+SUFIXOS = ('', 's', 'a', 'as', 'o', 'os', 'ão', 'ões', 'inho', 'inhas', 'ado', 'ação', 'ações', 'mente')
+AVULSOS = ('de', 'para', 'do', 'da', '-', ' - ', 'em', 'Edital', 'Concurso', 'nº', '2025', '01/2024',
+           'R$', 'R$ 1.500,00', 'por R$', '/mês', '/ano', '(11) 98765-4321', '11 3333 4444', '+55 11 98765-4321',
+           '149,90', 'Prefeitura', 'Municipal', 'pública', 'PÚBLICO', 'Aberto', 'prepare-se', 'empresa pública')
+
+
+# Cópia congelada do classificador original (antes da troca pelas regex em trie)
+def contem_palavra_ou_variacao_original(texto: str, palavras: List[str]) -> bool:
+    texto_lower = texto.lower()
+    for palavra in palavras:
+        if f' {palavra} ' in f' {texto_lower} ':
+            return True
+        if texto_lower.startswith(palavra + ' '):
+            return True
+        if texto_lower.endswith(f' {palavra}'):
+            return True
+        variações = [
+            palavra,
+            palavra + 's', palavra + 'a', palavra + 'as',
+            palavra + 'o', palavra + 'os', palavra + 'ão', palavra + 'ões',
+            palavra + 'inho', palavra + 'inhos', palavra + 'inha', palavra + 'inhas',
+            palavra + 'ado', palavra + 'ados', palavra + 'ação', palavra + 'ações',
+            palavra + 'mente',
+        ]
+        for var in variações:
+            if var in texto_lower:
+                return True
+    return False
+
+
+def eh_numero_telefone_original(texto: str) -> bool:
+    patterns = [
+        r'^\(?\d{2}\)?[\s-]?\d{4,5}[\s-]?\d{4}$',
+        r'^\d{2}\s\d{4,5}\s\d{4}$',
+        r'^\(\d{2}\)\s?\d{4}-\d{4}$',
+        r'^\+55\s\d{2}\s\d{4,5}-?\d{4}$',
+    ]
+    return any(re.search(pattern, texto.strip()) for pattern in patterns)
+
+
+def tem_preco_original(texto: str) -> bool:
+    patterns = [r'r\$\s*[\d.,]+', r'por\s*r\$', r'/mês', r'/ano', r'^\d+,?\d{2}$']
+    return any(re.search(pattern, texto.lower()) for pattern in patterns)
+
+
+def eh_titulo_valido_original(titulo: str) -> bool:
+    if not titulo or len(titulo) < 10:
+        return False
+    if re.match(r'^\d', titulo):
+        return False
+    if eh_numero_telefone_original(titulo):
+        return False
+    if tem_preco_original(titulo):
+        return False
+    texto_lower = titulo.lower()
+    if contem_palavra_ou_variacao_original(titulo, list(PALAVRAS_INVALIDAS)):
+        return False
+    if not contem_palavra_ou_variacao_original(titulo, list(PALAVRAS_CONCURSO)):
+        return False
+    if not any(pattern in texto_lower for pattern in [' - ', ' de ', ' para ', 'edital', 'concurso', 'vaga', 'cargo']):
+        if len(titulo.split()) < 3:
+            return False
+    return True
+
+
+def palavra_aleatoria(gerador: random.Random) -> str:
+    sorteio = gerador.random()
+    if sorteio < 0.35:
+        palavra = gerador.choice(PALAVRAS_CONCURSO) + gerador.choice(SUFIXOS)
+    elif sorteio < 0.5:
+        palavra = gerador.choice(PALAVRAS_INVALIDAS) + gerador.choice(SUFIXOS)
+    elif sorteio < 0.8:
+        palavra = gerador.choice(AVULSOS + tuple(CARGOS) + tuple(CIDADES) + tuple(UFS))
+    else:
+        palavra = ''.join(gerador.choice('abcdeimnorstuvçãé') for _ in range(gerador.randint(1, 9)))
+    if gerador.random() < 0.2:
+        palavra = palavra.upper() if gerador.random() < 0.5 else palavra.capitalize()
+    if gerador.random() < 0.1:
+        palavra = palavra[:gerador.randint(0, len(palavra))]
+    return palavra
+
+
+def corpus_titulos(quantidade: int = 33000, semente: int = 4) -> List[str]:
+    """Títulos reais do gerador sintético, ruído e combinações das listas de palavras"""
+    gerador = random.Random(semente)
+    titulos = list(RUIDO)
+    while len(titulos) < quantidade:
+        sorteio = gerador.random()
+        if sorteio < 0.15:
+            texto = f"{titulo(gerador)} - {gerador.choice(CARGOS)}"
+        elif sorteio < 0.25:
+            texto = f"{gerador.choice(ORGAOS)} {gerador.choice(CIDADES)} {gerador.choice(RUIDO)}"
+        else:
+            separador = gerador.choice((' ', ' ', ' ', '', '  ', ' - ', '-'))
+            texto = separador.join(palavra_aleatoria(gerador) for _ in range(gerador.randint(1, 8)))
+        if gerador.random() < 0.05:
+            texto = f" {texto} "
+        titulos.append(texto)
+    return titulos
+
+
+@pytest.fixture(scope='module')
+def corpus():
+    return corpus_titulos()
+
+
+def test_eh_titulo_valido_igual_ao_original(corpus):
+    diferentes = [t for t in corpus if Scraper.eh_titulo_valido(t) != eh_titulo_valido_original(t)]
+    assert diferentes == []
+    # O corpus precisa exercitar os dois lados do classificador
+    aceitos = sum(map(Scraper.eh_titulo_valido, corpus))
+    assert 0.05 * len(corpus) < aceitos < 0.95 * len(corpus)
+
+
+@pytest.mark.parametrize('palavras', [PALAVRAS_INVALIDAS, PALAVRAS_CONCURSO])
+def test_contem_palavra_ou_variacao_igual_ao_original(corpus, palavras):
+    diferentes = [t for t in corpus
+                  if Scraper.contem_palavra_ou_variacao(t, list(palavras))
+                  != contem_palavra_ou_variacao_original(t, list(palavras))]
+    assert diferentes == []